@@ -3,6 +3,10 @@
 AI控制器 - 连接视图和服务
 """
 from __future__ import annotations
+import json
+import logging
+import weakref
+from tkinter import TclError
 from typing import TYPE_CHECKING
 from gui.controllers.base_controller import BaseController
 from events.event_bus import EventType, Event
@@ -10,6 +14,45 @@ from services.ai_service import AIService
 
 if TYPE_CHECKING:
     from gui.views.ai_panel import AIPanel
+    from services.config_service import ConfigService
+
+logger = logging.getLogger(__name__)
+
+
+# 供应商-型号映射表
+_MODEL_MAP: dict[str, tuple[str, ...]] = {
+    "GPT": ("gpt-5", "gpt-5-mini", "gpt-5-nano", "gpt-4.1", "gpt-4.1-mini"),
+    "Claude": ("opus-4.1", "opus-4.0", "sonnet-4.5", "sonnet-4", "sonnet-3.7"),
+    "Gemini": ("gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.5-flash-lite"),
+    "Perplexity": ("sonar-pro", "sonar-reasoning", "sonar-large", "sonar-medium"),
+    "DeepSeek": ("deepseek-chat", "deepseek-reasoner"),
+    "Kimi": ("kimi-k2-0711-preview", "kimi-k2-turbo-preview", "moonshot-v1-128k"),
+    "Qwen": ("qwen-max", "qwen-plus", "qwen-turbo"),
+    "GLM": ("glm-4", "glm-4-air", "glm-3-turbo"),
+    "Grok": ("grok-1", "grok-beta"),
+    "本地模型": ("custom", "ollama", "llama-2", "llama-3"),
+}
+
+# 自定义API可以使用任意模型，这里只提供常用候选
+_CUSTOM_API_MODELS: tuple[str, ...] = (
+    "gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo", "gpt-4", "gpt-4-turbo",
+    "claude-3-5-sonnet-20241022", "claude-3-opus-20240229",
+    "deepseek-chat", "qwen-plus", "custom",
+)
+
+# 自动保存/加载的字段映射：(UI键, 配置键, 默认值)
+# 翻译功能已移至独立的"字幕翻译"面板，此处不再包含
+_UI_TO_CFG: tuple[tuple[str, str, object], ...] = (
+    ("ai_enabled", "enabled", False),
+    ("ai_provider", "provider", "GPT"),
+    ("ai_model", "model", "gpt-5"),
+    ("ai_api_key", "api_key", ""),
+    ("ai_base_url", "base_url", ""),
+    ("bilingual_enabled", "bilingual_enabled", False),
+)
+
+# 静态事件负载（只读约定，订阅方不应修改）
+_FAIL_CONFLICT = {"reason": "任务冲突"}
 
 
 class AIController(BaseController):
@@ -23,20 +66,43 @@ class AIController(BaseController):
     4. 更新视图状态
     """
     
-    def __init__(self, view: AIPanel, config: dict):
+    def __init__(self, view: AIPanel, config: dict, cfg_service: ConfigService | None = None):
         """
         初始化
         
         Args:
             view: AI面板视图
             config: 全局配置
+            cfg_service: 配置服务（默认使用全局单例）
         """
+        if cfg_service is None:
+            from services.config_service import get_config_service
+            cfg_service = get_config_service()
+        self.cfg_service = cfg_service
         self.view = view
+        # 弱引用：cleanup() 释放 self.view 后仍可安全访问（视图已销毁时为 None）
+        self._view_ref = weakref.ref(view)
         self.config = config
         self.service = AIService()
         self.last_run_dir: str = None
         
+        # 上次写盘内容的哈希（内容未变化时跳过磁盘写入）
+        self._last_saved_hash: int | None = None
+        self._accordion_loaded = False
+        # 批量加载配置期间抑制自动保存（避免变量trace引发的保存风暴）
+        self._suspend_autosave = False
+        self._root = None
+        self._save_timer = None
+        # 上次处理过的供应商（相同供应商重复触发时跳过）
+        self._last_provider: str | None = None
+        # 已安装的变量trace：(变量, trace名)，cleanup 时移除
+        self._traces: list = []
+        # 本控制器发起的AI任务是否仍在运行（避免重复点击穿透到服务层）
+        self._ai_busy = False
+        
         super().__init__()
+        # 热路径（进度回调）使用的发布方法，避免每次重复属性查找
+        self._publish = self.event_bus.publish
         
         # 统一初始化顺序由 InitializationManager 保证，这里同步初始化
         self._setup_button_bindings()
@@ -45,23 +111,32 @@ class AIController(BaseController):
     
     def _setup_button_bindings(self):
         """设置按钮绑定（延迟执行，确保懒加载内容已创建）"""
-        # 确保内容已加载（如果是懒加载模式）
-        if hasattr(self.view, 'accordion') and self.view.accordion._lazy_load:
-            # 触发懒加载（如果尚未加载）
-            self.view.accordion.get_content_frame()
+        self._ensure_accordion_loaded()
+        
+        view = self.view
+        run_btn = getattr(view, 'btn_run_ai', None)
+        test_btn = getattr(view, 'btn_test_api', None)
         
         # 绑定按钮事件
-        if hasattr(self.view, 'btn_run_ai'):
-            self.view.btn_run_ai.config(command=self.run_ai_processing)
+        if run_btn is not None:
+            run_btn.config(command=self.run_ai_processing)
         # 若未存在，InitializationManager 已确保UI创建，这里不再重试
         
         # 绑定API Key验证按钮（如果存在）
-        if hasattr(self.view, 'btn_test_api'):
-            self.view.btn_test_api.config(command=self.test_api_key)
+        if test_btn is not None:
+            test_btn.config(command=self.test_api_key)
         
-        # 绑定供应商切换事件（立即绑定，确保切换时能更新型号）
-        if hasattr(self.view, 'cmb_provider'):
-            self.view.cmb_provider.bind("<<ComboboxSelected>>", lambda e: self._on_provider_changed())
+        # 供应商切换事件统一在 _setup_auto_save 中绑定（切换型号 + 保存）
+    
+    def _ensure_accordion_loaded(self):
+        """确保懒加载内容已创建（只触发一次）"""
+        if self._accordion_loaded:
+            return
+        accordion = getattr(self.view, 'accordion', None)
+        if accordion is not None and accordion._lazy_load:
+            # 触发懒加载（如果尚未加载）
+            accordion.get_content_frame()
+        self._accordion_loaded = True
     
     def _setup_event_listeners(self):
         """设置事件监听"""
@@ -75,113 +150,100 @@ class AIController(BaseController):
         """设置自动保存（当配置变化时）"""
         # 获取root窗口
         try:
-            root = self.view.winfo_toplevel()
-        except:
+            self._root = self.view.winfo_toplevel()
+        except (AttributeError, TclError):
             return  # 如果视图还未完全初始化，稍后再试
         
-        # 确保内容已加载（如果是懒加载模式）
-        if hasattr(self.view, 'accordion') and self.view.accordion._lazy_load:
-            # 触发懒加载（如果尚未加载）
-            self.view.accordion.get_content_frame()
+        self._ensure_accordion_loaded()
         
         # 检查必要的控件是否存在（InitializationManager已确保就绪）
-        if not hasattr(self.view, 'ent_api_key') or not hasattr(self.view, 'cmb_provider'):
-            print("[AIController] 警告: 必要控件缺失")
+        view = self.view
+        ent_api_key = getattr(view, 'ent_api_key', None)
+        cmb_provider = getattr(view, 'cmb_provider', None)
+        if ent_api_key is None or cmb_provider is None:
+            logger.warning("[AIController] 必要控件缺失，跳过自动保存绑定")
             return
-        
-        def _delayed_save():
-            """延迟保存（500ms后）"""
-            if hasattr(self, '_save_timer') and self._save_timer:
-                try:
-                    root.after_cancel(self._save_timer)
-                except:
-                    pass
-            
-            self._save_timer = root.after(500, self._auto_save_config)
+        cmb_model = view.cmb_model
+        ent_base_url = getattr(view, 'ent_base_url', None)
         
         # API Key输入框失去焦点时保存
-        self.view.ent_api_key.bind("<FocusOut>", lambda e: _delayed_save())
-        
-        # 供应商切换时保存（供应商切换已在__init__中绑定，这里只添加保存逻辑）
-        # 注意：供应商切换的事件处理会在_on_provider_changed中执行，这里只添加保存
-        def _on_provider_with_save(e):
-            self._on_provider_changed()
-            _delayed_save()
+        ent_api_key.bind("<FocusOut>", self._on_save_trigger)
         
-        # 移除旧绑定，添加新绑定（包含保存逻辑）
-        try:
-            self.view.cmb_provider.bind("<<ComboboxSelected>>", _on_provider_with_save)
-        except:
-            pass
+        # 供应商切换：更新型号列表并保存（唯一绑定）
+        cmb_provider.bind("<<ComboboxSelected>>", self._on_provider_selected)
         
         # 模型切换时保存
-        self.view.cmb_model.bind("<<ComboboxSelected>>", lambda e: _delayed_save())
+        cmb_model.bind("<<ComboboxSelected>>", self._on_save_trigger)
         
         # Base URL输入框失去焦点时保存（如果存在）
-        if hasattr(self.view, 'ent_base_url'):
-            self.view.ent_base_url.bind("<FocusOut>", lambda e: _delayed_save())
+        if ent_base_url is not None:
+            ent_base_url.bind("<FocusOut>", self._on_save_trigger)
         
         # 复选框变化时保存
         try:
-            self.view.var_ai_enabled.trace_add("write", lambda *args: _delayed_save())
+            self._add_trace(view.var_ai_enabled, self._on_save_trigger)
             # 翻译功能已移至独立的"字幕翻译"面板，此处不再处理
-            self.view.var_bilingual.trace_add("write", lambda *args: _delayed_save())
-        except:
+            self._add_trace(view.var_bilingual, self._on_save_trigger)
+        except (AttributeError, TclError):
             pass
     
+    def _add_trace(self, var, callback):
+        """安装变量写trace并记录，便于 cleanup 时移除"""
+        self._traces.append((var, var.trace_add("write", callback)))
+    
+    def _on_save_trigger(self, *args, **kw):
+        """控件事件/变量trace回调：忽略参数，延迟保存"""
+        self._delayed_save()
+    
+    def _on_provider_selected(self, event=None):
+        """供应商切换回调：更新型号列表并延迟保存"""
+        self._on_provider_changed()
+        self._delayed_save()
+    
+    def _delayed_save(self):
+        """延迟保存（500ms后）"""
+        if self._suspend_autosave:
+            return
+        if self._save_timer:
+            try:
+                self._root.after_cancel(self._save_timer)
+            except TclError:
+                pass
+        
+        self._save_timer = self._root.after(500, self._auto_save_config)
+    
     def _auto_save_config(self):
         """自动保存配置"""
+        self._save_timer = None
         try:
             view_config = self.view.get_config()
-            config = {
-                "enabled": view_config.get("ai_enabled", False),
-                "provider": view_config.get("ai_provider", "GPT"),
-                "model": view_config.get("ai_model", "gpt-5"),
-                "api_key": view_config.get("ai_api_key", ""),
-                "base_url": view_config.get("ai_base_url", ""),
-                # 翻译功能已移至独立的"字幕翻译"面板，此处不再保存
-                "bilingual_enabled": view_config.get("bilingual_enabled", False),
-            }
-            self._save_config(config)
-        except Exception as e:
-            # 静默失败，不干扰用户
-            pass
+        except (AttributeError, TclError) as e:
+            # 视图已销毁（如退出时定时器仍在排队），写盘失败由 _save_config 自行处理
+            self._log(f"[AI] 自动保存已跳过: {e}", "WARN")
+            return
+        
+        config = {cfg_k: view_config.get(ui_k, d) for ui_k, cfg_k, d in _UI_TO_CFG}
+        self._save_config(config)
     
     def _on_provider_changed(self):
         """
         供应商切换处理
         """
         provider = self.view.cmb_provider.get()
+        if provider == self._last_provider:
+            return
+        self._last_provider = provider
         
         # 如果是自定义API，显示Base URL输入框
         if provider == "自定义API":
             self.view.show_custom_api_fields(show=True)
             # 自定义API可以使用任意模型，允许用户手动输入或从列表选择
-            common_models = ["gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", 
-                            "claude-3-5-sonnet-20241022", "claude-3-opus-20240229",
-                            "deepseek-chat", "qwen-plus", "custom"]
             self.view.cmb_model.config(state="normal")  # 允许编辑
-            self.view.update_model_list(provider, common_models)
+            self.view.update_model_list(provider, _CUSTOM_API_MODELS)
         else:
             self.view.show_custom_api_fields(show=False)
             self.view.cmb_model.config(state="readonly")  # 只读模式
-            
-            # 供应商-型号映射表
-            model_map = {
-                "GPT": ["gpt-5", "gpt-5-mini", "gpt-5-nano", "gpt-4.1", "gpt-4.1-mini"],
-                "Claude": ["opus-4.1", "opus-4.0", "sonnet-4.5", "sonnet-4", "sonnet-3.7"],
-                "Gemini": ["gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.5-flash-lite"],
-                "Perplexity": ["sonar-pro", "sonar-reasoning", "sonar-large", "sonar-medium"],
-                "DeepSeek": ["deepseek-chat", "deepseek-reasoner"],
-                "Kimi": ["kimi-k2-0711-preview", "kimi-k2-turbo-preview", "moonshot-v1-128k"],
-                "Qwen": ["qwen-max", "qwen-plus", "qwen-turbo"],
-                "GLM": ["glm-4", "glm-4-air", "glm-3-turbo"],
-                "Grok": ["grok-1", "grok-beta"],
-                "本地模型": ["custom", "ollama", "llama-2", "llama-3"]
-            }
-            
-            models = model_map.get(provider, ["default"])
-            self.view.update_model_list(provider, models)
+            self.view.update_model_list(provider, _MODEL_MAP.get(provider, ("default",)))
         
         self._log(f"[AI] 供应商切换: {provider}")
     
@@ -192,6 +254,10 @@ class AIController(BaseController):
         Args:
             run_dir: 运行目录（可选，如果None则使用最近一次下载的目录）
         """
+        if self._ai_busy:
+            self.view.show_error("已有AI处理任务正在运行")
+            return
+        
         if not run_dir:
             if not self.last_run_dir:
                 self.view.show_error("请先完成下载任务，或指定运行目录")
@@ -207,12 +273,13 @@ class AIController(BaseController):
             return
         
         # 发布事件：AI处理开始
-        self.event_bus.publish(Event(
+        self._publish(Event(
             EventType.AI_PROCESSING_STARTED,
             {"run_dir": run_dir}
         ))
         
         # 启动AI处理
+        self._ai_busy = True
         success = self.service.run_ai_processing(
             run_dir=run_dir,
             ai_config=config,
@@ -221,11 +288,13 @@ class AIController(BaseController):
         )
         
         if not success:
+            self._ai_busy = False
             self.view.show_error("已有AI处理任务正在运行")
-            self.event_bus.publish(Event(
-                EventType.AI_PROCESSING_FAILED,
-                {"reason": "任务冲突"}
-            ))
+            self._publish(Event(EventType.AI_PROCESSING_FAILED, _FAIL_CONFLICT))
+            return
+        
+        # 任务已在后台启动：持久化本次使用的配置（与自动保存内容相同时不写盘）
+        self._save_config({cfg_k: config[cfg_k] for _, cfg_k, _ in _UI_TO_CFG})
     
     def _collect_ai_config(self) -> dict:
         """
@@ -236,24 +305,16 @@ class AIController(BaseController):
         """
         view_config = self.view.get_config()
         
-        config = {
-            "enabled": view_config.get("ai_enabled", False),
-            "provider": view_config.get("ai_provider", "GPT"),
-            "model": view_config.get("ai_model", "gpt-5"),
-            "api_key": view_config.get("ai_api_key", ""),
-            "base_url": view_config.get("ai_base_url", ""),
-            "workers": self.config.get("max_workers", 3),
-            "max_chars_per_video": 30000,
-            "translate_enabled": view_config.get("translate_enabled", False),
-            "translate_langs": view_config.get("translate_langs", ["zh"]),
-            "translate_engine": view_config.get("translate_engine", "Google"),
-            "bilingual_enabled": view_config.get("bilingual_enabled", False),
-            "bilingual_layout": view_config.get("bilingual_layout", "并排"),
-            "bilingual_timeline": view_config.get("bilingual_timeline", True)
-        }
-        
-        # 自动保存配置
-        self._save_config(config)
+        config = {cfg_k: view_config.get(ui_k, d) for ui_k, cfg_k, d in _UI_TO_CFG}
+        config.update(
+            workers=self.config.get("max_workers", 3),
+            max_chars_per_video=30000,
+            translate_enabled=view_config.get("translate_enabled", False),
+            translate_langs=view_config.get("translate_langs", ["zh"]),
+            translate_engine=view_config.get("translate_engine", "Google"),
+            bilingual_layout=view_config.get("bilingual_layout", "并排"),
+            bilingual_timeline=view_config.get("bilingual_timeline", True),
+        )
         
         return config
     
@@ -264,52 +325,59 @@ class AIController(BaseController):
         Args:
             config: 配置字典
         """
+        h = self._config_hash(config)
+        if h == self._last_saved_hash:
+            return
+        
         try:
-            from services.config_service import get_config_service
-            config_service = get_config_service()
+            config_service = self.cfg_service
             config_service.save_ai_config(config)
             config_service.save()
+            self._last_saved_hash = h
         except Exception as e:
             # 保存失败不阻塞主流程
-            print(f"[AIController] 保存配置失败: {e}")
+            logger.warning("[AIController] 保存配置失败: %s", e)
+    
+    @staticmethod
+    def _config_hash(config: dict) -> int:
+        """计算配置内容哈希（用于判断是否需要写盘）"""
+        return hash(json.dumps(config, sort_keys=True, ensure_ascii=False))
     
     def load_config(self):
         """加载保存的配置到UI"""
         try:
-            # 确保内容已加载（如果是懒加载模式）
-            if hasattr(self.view, 'accordion') and self.view.accordion._lazy_load:
-                # 触发懒加载（如果尚未加载）
-                self.view.accordion.get_content_frame()
-        except:
+            self._ensure_accordion_loaded()
+        except (AttributeError, TclError):
             pass
         
         try:
-            from services.config_service import get_config_service
-            config_service = get_config_service()
+            config_service = self.cfg_service
             config = config_service.load_ai_config()
             
-            # 调试：打印加载的配置
-            print(f"[AIController] 加载AI配置: provider={config.get('provider')}, model={config.get('model')}, api_key={'***' if config.get('api_key') else '(空)'}")
+            logger.debug(
+                "[AIController] 加载AI配置: provider=%s, model=%s, api_key=%s",
+                config.get("provider"), config.get("model"),
+                "***" if config.get("api_key") else "(空)",
+            )
             
             # 映射内部配置到UI配置格式
-            ui_config = {
-                "ai_enabled": config.get("enabled", False),
-                "ai_provider": config.get("provider", "GPT"),
-                "ai_model": config.get("model", "gpt-5"),
-                "ai_api_key": config.get("api_key", ""),
-                "ai_base_url": config.get("base_url", ""),
-                "translate_enabled": config.get("translate_enabled", False),
-                "translate_langs": config.get("translate_langs", ["zh", "en"]),
-                "bilingual_enabled": config.get("bilingual_enabled", False),
-            }
-            self.view.load_config(ui_config)
+            ui_config = {ui_k: config.get(cfg_k, d) for ui_k, cfg_k, d in _UI_TO_CFG}
+            self._suspend_autosave = True
+            try:
+                self.view.load_config(ui_config)
+            finally:
+                self._suspend_autosave = False
+            
+            # 刚加载的内容即磁盘内容：自动保存时若无变化则跳过写盘
+            self._last_saved_hash = self._config_hash(
+                {cfg_k: config.get(cfg_k, d) for _, cfg_k, d in _UI_TO_CFG}
+            )
+            
             # 触发供应商切换以更新模型列表
             if hasattr(self, '_on_provider_changed'):
                 self._on_provider_changed()
         except Exception as e:
-            print(f"[AIController] 加载配置失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[AIController] 加载配置失败: %s", e)
     
     def _on_progress(self, progress: dict):
         """
@@ -319,10 +387,7 @@ class AIController(BaseController):
             progress: 进度信息
         """
         # 发布进度事件
-        self.event_bus.publish(Event(
-            EventType.AI_PROCESSING_PROGRESS,
-            progress
-        ))
+        self._publish(Event(EventType.AI_PROCESSING_PROGRESS, progress))
     
     def _on_completion(self, result: dict):
         """
@@ -331,9 +396,11 @@ class AIController(BaseController):
         Args:
             result: 结果信息
         """
+        self._ai_busy = False
+        
         if "error" in result:
             # AI处理失败
-            self.event_bus.publish(Event(
+            self._publish(Event(
                 EventType.AI_PROCESSING_FAILED,
                 {"reason": result["error"]}
             ))
@@ -344,7 +411,7 @@ class AIController(BaseController):
             done = result.get("done", 0)
             html_path = result.get("html_path")
             
-            self.event_bus.publish(Event(
+            self._publish(Event(
                 EventType.AI_PROCESSING_COMPLETED,
                 result
             ))
@@ -420,6 +487,45 @@ class AIController(BaseController):
             self.view.show_error(f"测试过程中发生错误:\n{str(e)}")
             self._log(f"❌ 测试错误: {str(e)}", "ERROR")
     
+    def cleanup(self):
+        """
+        清理资源
+        
+        显式解除Tk绑定、变量trace和事件订阅，打破 控制器<->视图 的引用环，
+        使面板销毁时无需等待循环垃圾回收
+        """
+        # 有待执行的自动保存时立即落盘，避免退出时丢失
+        if self._save_timer and self._root is not None:
+            try:
+                self._root.after_cancel(self._save_timer)
+            except TclError:
+                pass
+            self._auto_save_config()
+        
+        view = self._view_ref()
+        if view is not None:
+            try:
+                for widget_name, sequence in (
+                    ("cmb_provider", "<<ComboboxSelected>>"),
+                    ("cmb_model", "<<ComboboxSelected>>"),
+                    ("ent_api_key", "<FocusOut>"),
+                    ("ent_base_url", "<FocusOut>"),
+                ):
+                    widget = getattr(view, widget_name, None)
+                    if widget is not None:
+                        widget.unbind(sequence)
+                for var, cbname in self._traces:
+                    var.trace_remove("write", cbname)
+            except TclError:
+                pass  # 视图已被Tk销毁
+        self._traces.clear()
+        
+        self.event_bus.unsubscribe(EventType.THEME_CHANGED, self._on_theme_changed)
+        self.event_bus.unsubscribe(EventType.DOWNLOAD_COMPLETED, self._on_download_completed)
+        
+        self._root = None
+        self.view = None
+    
     def _on_theme_changed(self, event: Event):
         """
         主题变化处理
@@ -2,6 +2,7 @@
 """
 控制器基类
 """
+from __future__ import annotations
 from abc import ABC, abstractmethod
 from events.event_bus import EventBus, event_bus
 
@@ -17,6 +18,10 @@ class BaseController(ABC):
     3. 统一的清理接口
     """
     
+    # 需要主控制器处理的事件（通常是本控制器发布、由主窗口展示的事件），
+    # 主控制器只订阅已创建的子控制器声明过的事件
+    REQUIRED_EVENTS: frozenset = frozenset()
+    
     def __init__(self):
         """初始化控制器"""
         self.event_bus = event_bus
@@ -34,6 +39,22 @@ class BaseController(ABC):
         """
         pass
     
+    def _subscribe_many(self, handlers: dict):
+        """
+        批量订阅事件
+        
+        事件总线提供 subscribe_many 时一次加锁完成全部订阅，否则逐个订阅
+        
+        Args:
+            handlers: 事件类型 -> 处理函数
+        """
+        subscribe_many = getattr(self.event_bus, 'subscribe_many', None)
+        if subscribe_many is not None:
+            subscribe_many(handlers)
+        else:
+            for event_type, handler in handlers.items():
+                self.event_bus.subscribe(event_type, handler)
+    
     def cleanup(self):
         """
         清理资源
@@ -55,6 +76,17 @@ class BaseController(ABC):
             EventType.LOG_MESSAGE,
             {"message": message, "level": level}
         ))
+    
+    def _log_batch(self, lines: list[str], level: str = "INFO"):
+        """
+        批量记录日志：多行合并为一条消息发布，减少界面刷新次数
+        
+        Args:
+            lines: 日志行列表
+            level: 日志级别 (INFO/WARN/ERROR)
+        """
+        if lines:
+            self._log("\n".join(lines), level)
 
 
 __all__ = ['BaseController']
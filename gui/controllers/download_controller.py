@@ -3,14 +3,219 @@
 下载控制器 - 连接视图和服务
 """
 from __future__ import annotations
+import heapq
+import json
+import logging
+import os
+import queue
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from time import monotonic as _now
+from tkinter import TclError
 from typing import TYPE_CHECKING
 from pathlib import Path
 from gui.controllers.base_controller import BaseController
 from events.event_bus import EventType, Event
+from services.config_service import get_config_service
 from services.download_service import DownloadService
+from validators import validate_url_list
+
+try:
+    from utils.error_handler import ErrorHandler, ErrorLogger
+except ImportError:
+    ErrorHandler = ErrorLogger = None
+
+# 可选：orjson 解析更快（未安装时回退到标准库 json）
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
 
 if TYPE_CHECKING:
     from gui.views.download_panel import DownloadPanel
+    from services.config_service import ConfigService
+
+logger = logging.getLogger(__name__)
+
+# 调试输出开关（设置环境变量 DL_DEBUG=1 启用）
+_DEBUG = os.environ.get("DL_DEBUG") == "1"
+
+
+def _dbg(*args):
+    """调试输出（仅在 DL_DEBUG=1 时打印）"""
+    if _DEBUG:
+        print(*args, flush=True)
+
+
+# 触发自动保存的高级选项复选框变量（视图中不存在的会被跳过）
+_CHECKBOX_VARS = (
+    'var_merge_bilingual',
+    'var_force_refresh',
+    'var_incremental_detect',
+    'var_incremental_download',
+    'var_early_stop',
+)
+
+# 字幕目录中计入下载结果的文件扩展名
+_SUBTITLE_EXTS = frozenset({
+    '.srt', '.vtt', '.ass', '.ssa', '.lrc', '.txt', '.ttml',
+    '.json', '.json3', '.srv1', '.srv2', '.srv3',
+})
+
+# Cookie 失效相关关键词（忽略大小写）
+_COOKIE_EXPIRE_RE = re.compile(r'sign in|cookie|bot|authentication|expired|invalid', re.IGNORECASE)
+# 按字节扫描文件用的同义模式（关键词均为 ASCII，UTF-8 多字节字符不会产生误匹配）
+_COOKIE_EXPIRE_RE_B = re.compile(rb'sign in|cookie|bot|authentication|expired|invalid', re.IGNORECASE)
+_COOKIE_RE_B = re.compile(rb'cookie', re.IGNORECASE)
+
+
+def _file_contains(path: Path, pattern: re.Pattern, chunk_size: int = 1 << 16, overlap: int = 16) -> bool:
+    """
+    分块扫描文件，找到第一个匹配即返回
+    
+    Args:
+        path: 文件路径
+        pattern: 字节模式的已编译正则（匹配长度不超过 overlap）
+        chunk_size: 每次读取的字节数
+        overlap: 相邻块之间保留的重叠字节数（覆盖跨块边界的关键词）
+    
+    Returns:
+        是否匹配
+    """
+    tail = b""
+    with path.open('rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return False
+            buf = tail + chunk
+            if pattern.search(buf):
+                return True
+            tail = buf[-overlap:] if overlap > 0 else b""
+
+
+# 错误消息特征 -> 错误代码（按优先级排列，匹配小写后的消息）
+_ERROR_SIGNATURES = (
+    ("timeout", "error_timeout"),
+    ("429", "error_429"),
+    ("rate limit", "error_429"),
+    ("503", "error_503"),
+    ("sign in", "YTDLP_SIGNIN"),
+    ("cookie", "YTDLP_SIGNIN"),
+    ("bot", "YTDLP_SIGNIN"),
+)
+
+# 错误处理工具不可用时的错误名称映射
+_FALLBACK_ERROR_NAMES = {
+    "error_other": "其他错误（可能需要 Cookie 认证）",
+    "error_429": "请求过于频繁（429）",
+    "error_503": "服务不可用（503）",
+    "error_timeout": "请求超时",
+    "error_private": "视频为私有",
+    "error_geo": "地区限制",
+}
+_FALLBACK_RETRYABLE = frozenset({"error_429", "error_503", "error_timeout"})
+
+
+@lru_cache(maxsize=32)
+def _classify_status(status: str) -> tuple[str, bool, str]:
+    """
+    按错误状态获取 (中文名称, 是否可重试, 恢复建议)，结果缓存
+    
+    错误处理工具不可用时回退到内置映射（无恢复建议）
+    """
+    if ErrorHandler is not None:
+        _category, name, retryable, suggestion = ErrorHandler.classify_error(status)
+        return name, retryable, suggestion
+    return _FALLBACK_ERROR_NAMES.get(status, status), status in _FALLBACK_RETRYABLE, ""
+
+
+@lru_cache(maxsize=256)
+def _format_file_size(size_bytes: int) -> str:
+    """
+    格式化文件大小（相同大小的结果缓存）
+    
+    Args:
+        size_bytes: 文件大小（字节）
+    
+    Returns:
+        格式化后的文件大小字符串
+    """
+    if size_bytes < (1 << 10):
+        return f"{size_bytes} B"
+    elif size_bytes < (1 << 20):
+        return f"{size_bytes / (1 << 10):.1f} KB"
+    else:
+        return f"{size_bytes / (1 << 20):.1f} MB"
+
+
+@lru_cache(maxsize=64)
+def _format_langs(langs: tuple[str, ...]) -> str:
+    """格式化已排序的语言列表（不同视频的语言组合大多相同，结果缓存）"""
+    return ", ".join(langs)
+
+
+def _is_network_path(path: str) -> bool:
+    """
+    判断路径是否位于网络文件系统（UNC 路径或 Windows 映射网络驱动器）
+    
+    Args:
+        path: 文件或目录路径
+    
+    Returns:
+        是否为网络路径
+    """
+    if path.startswith(("\\\\", "//")):
+        return True
+    if os.name == "nt":
+        drive = os.path.splitdrive(os.path.abspath(path))[0]
+        if drive:
+            try:
+                import ctypes
+                return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == 4  # DRIVE_REMOTE
+            except (AttributeError, OSError):
+                return False
+    return False
+
+
+def _entry_sizes(entries: list, parallel: bool = False) -> list[int]:
+    """
+    获取 DirEntry 列表的文件大小（顺序与输入一致）
+    
+    网络路径上每次 stat 可能耗时数毫秒，parallel=True 时用线程池并发获取；
+    条目较少时线程池开销大于收益，仍顺序执行
+    """
+    def size_of(entry) -> int:
+        return entry.stat(follow_symlinks=False).st_size
+    
+    if parallel and len(entries) >= 5:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return list(pool.map(size_of, entries))
+    return [size_of(entry) for entry in entries]
+
+
+def _progress_rates(current: int, total: int, elapsed: float) -> tuple:
+    """
+    计算进度百分比、速度和剩余时间
+    
+    Args:
+        current: 当前进度
+        total: 总进度
+        elapsed: 已用时间（秒）
+    
+    Returns:
+        (percent, speed, eta)，尚无进度或耗时为0时 speed/eta 为 None
+    """
+    percent = (current / total) * 100 if total > 0 else 0
+    if current > 0 and elapsed > 0:
+        speed = current / elapsed  # items/second
+        eta = (total - current) / speed if total > current else 0
+        return percent, speed, eta
+    return percent, None, None
 
 
 class DownloadController(BaseController):
@@ -24,7 +229,18 @@ class DownloadController(BaseController):
     4. 更新视图状态
     """
     
-    def __init__(self, view: DownloadPanel, config: dict, settings_ctrl=None):
+    REQUIRED_EVENTS = frozenset({
+        EventType.DOWNLOAD_STARTED,
+        EventType.DOWNLOAD_PROGRESS,
+        EventType.DOWNLOAD_COMPLETED,
+        EventType.DOWNLOAD_FAILED,
+        EventType.DOWNLOAD_STOPPED,
+        EventType.DOWNLOAD_PAUSED,
+        EventType.DOWNLOAD_RESUMED,
+    })
+    
+    def __init__(self, view: DownloadPanel, config: dict, settings_ctrl=None,
+                 cfg_service: ConfigService | None = None):
         """
         初始化
         
@@ -32,7 +248,9 @@ class DownloadController(BaseController):
             view: 下载面板视图
             config: 全局配置
             settings_ctrl: 设置控制器（用于获取网络配置）
+            cfg_service: 配置服务（默认使用全局单例）
         """
+        self.cfg_service = cfg_service if cfg_service is not None else get_config_service()
         self.view = view
         self.config = config
         self.settings_ctrl = settings_ctrl  # 保存设置控制器的引用
@@ -47,12 +265,23 @@ class DownloadController(BaseController):
         self.progress_last_count = 0  # 上次处理数量
         self.progress_current_title = ""  # 当前视频标题
         
+        # 进度队列：服务线程只负责入队，由 GUI 主线程的 after 循环批量取出并发布
+        self._progress_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._progress_drain_job = None  # 队列轮询定时器
+        # 上次发布的进度（进度、阶段、消息均未变化时跳过）
+        self._last_emitted_current = -1
+        self._last_emitted_phase = ""
+        self._last_emitted_message = ""
+        
+        # 最近一次URL验证结果：(输入文本, (is_valid, error_msg, valid_count))
+        self._url_validate_cache: tuple[str, tuple[bool, str, int]] | None = None
+        # 最近一次批量URL验证统计：(URL元组, validate_and_statistics 结果)
+        self._url_stats_cache: tuple[tuple[str, ...], dict] | None = None
+        # URL输入框错误高亮当前状态（None 表示尚未设置过）
+        self._url_error_visible: bool | None = None
+        
         # 错误日志管理器
-        try:
-            from utils.error_handler import ErrorLogger
-            self.error_logger = ErrorLogger()
-        except ImportError:
-            self.error_logger = None
+        self.error_logger = ErrorLogger() if ErrorLogger is not None else None
         
         super().__init__()
         
@@ -102,45 +331,52 @@ class DownloadController(BaseController):
         Args:
             dry_run: 是否为干运行（只检测）
         """
-        print(f"[DownloadController] start_download 被调用: dry_run={dry_run}")
-        print(f"[DownloadController] 事件总线: {self.event_bus}")
+        _dbg(f"[DownloadController] start_download 被调用: dry_run={dry_run}")
+        _dbg(f"[DownloadController] 事件总线: {self.event_bus}")
         
         # 获取URL文本
         urls_text = self.view.txt_urls.get("1.0", "end-1c").strip()
-        print(f"[DownloadController] URL文本长度: {len(urls_text)}")
-        print(f"[DownloadController] URL文本内容: {urls_text[:100] if urls_text else '(空)'}")
+        _dbg(f"[DownloadController] URL文本长度: {len(urls_text)}")
+        _dbg(f"[DownloadController] URL文本内容: {urls_text[:100] if urls_text else '(空)'}")
         
-        # 先验证URL格式（无论是否为空）
-        from validators import validate_url_list
-        is_valid, error_msg, valid_count = validate_url_list(urls_text)
-        print(f"[DownloadController] URL验证结果: is_valid={is_valid}, valid_count={valid_count}, error_msg={error_msg}")
+        # 空输入直接提示，无需执行验证
+        if not urls_text:
+            _dbg(f"[DownloadController] URL文本为空，显示错误对话框")
+            self.view.show_error("请输入至少一个视频链接")
+            self._log("错误：未输入任何链接", "ERROR")
+            self._set_url_error_highlight(True)
+            return
+        
+        # 验证URL格式（输入未变化时命中实时验证的缓存结果）
+        is_valid, error_msg, valid_count = self._validate_url_text(urls_text)
+        _dbg(f"[DownloadController] URL验证结果: is_valid={is_valid}, valid_count={valid_count}, error_msg={error_msg}")
         
         if not is_valid:
             # 显示错误信息
-            print(f"[DownloadController] URL验证失败，显示错误对话框")
+            _dbg(f"[DownloadController] URL验证失败，显示错误对话框")
             self.view.show_error(f"URL格式错误:\n{error_msg}\n\n有效URL数量: {valid_count}")
             self._log(f"URL验证失败: {error_msg}", "ERROR")
             # 高亮错误输入框
-            self.view.txt_urls.config(highlightbackground="#FF6B6B", highlightcolor="#FF6B6B", highlightthickness=2)
+            self._set_url_error_highlight(True)
             return
         
         # 获取URL列表
         urls = self.view.get_urls()
-        print(f"[DownloadController] 获取到 {len(urls)} 个URL: {urls[:3] if urls else '[]'}")
+        _dbg(f"[DownloadController] 获取到 {len(urls)} 个URL: {urls[:3] if urls else '[]'}")
         
         # 验证URL列表（双重检查）
         if not urls:
-            print(f"[DownloadController] URL列表为空，显示错误对话框")
+            _dbg(f"[DownloadController] URL列表为空，显示错误对话框")
             self.view.show_error("请输入至少一个视频链接")
             self._log("错误：未输入任何链接", "ERROR")
             # 高亮错误输入框
-            self.view.txt_urls.config(highlightbackground="#FF6B6B", highlightcolor="#FF6B6B", highlightthickness=2)
+            self._set_url_error_highlight(True)
             return
         
-        print(f"[DownloadController] 开始执行: dry_run={dry_run}, urls={len(urls)}")
+        _dbg(f"[DownloadController] 开始执行: dry_run={dry_run}, urls={len(urls)}")
         
         # 清除错误高亮
-        self.view.txt_urls.config(highlightthickness=0)
+        self._set_url_error_highlight(False)
         
         # 重置状态
         self.is_dry_run = dry_run
@@ -148,19 +384,21 @@ class DownloadController(BaseController):
         self.is_paused = False  # 跟踪是否已暂停
         
         # 重置进度跟踪
-        import time
-        self.progress_start_time = time.time()
-        self.progress_last_time = time.time()
+        self.progress_start_time = self.progress_last_time = _now()
         self.progress_last_count = 0
         self.progress_current_title = ""
+        self._discard_queued_progress()
+        self._last_emitted_current = -1
+        self._last_emitted_phase = ""
+        self._last_emitted_message = ""
         
         # 收集配置
-        print(f"[DownloadController] 开始收集配置...")
+        _dbg(f"[DownloadController] 开始收集配置...")
         config = self._collect_config()
-        print(f"[DownloadController] 配置收集完成: {list(config.keys())}")
+        _dbg(f"[DownloadController] 配置收集完成: {list(config.keys())}")
         
         # 发布事件：下载开始
-        print(f"[DownloadController] 发布DOWNLOAD_STARTED事件...")
+        _dbg(f"[DownloadController] 发布DOWNLOAD_STARTED事件...")
         self.event_bus.publish(Event(
             EventType.DOWNLOAD_STARTED,
             {
@@ -169,10 +407,10 @@ class DownloadController(BaseController):
                 "dry_run": dry_run
             }
         ))
-        print(f"[DownloadController] DOWNLOAD_STARTED事件已发布")
+        _dbg(f"[DownloadController] DOWNLOAD_STARTED事件已发布")
         
         # 启动下载
-        print(f"[DownloadController] 调用service.start_download...")
+        _dbg(f"[DownloadController] 调用service.start_download...")
         success = self.service.start_download(
             urls=urls,
             config=config,
@@ -180,13 +418,47 @@ class DownloadController(BaseController):
             completion_callback=self._on_completion,
             dry_run=dry_run
         )
-        print(f"[DownloadController] service.start_download返回: success={success}")
+        _dbg(f"[DownloadController] service.start_download返回: success={success}")
+        if success:
+            self._schedule_progress_drain()
         
         if not success:
-            print(f"[DownloadController] 启动失败：已有任务正在运行")
+            _dbg(f"[DownloadController] 启动失败：已有任务正在运行")
             self.view.show_error("已有下载任务正在运行")
             self.event_bus.publish(Event(EventType.DOWNLOAD_FAILED, {"reason": "任务冲突"}))
     
+    def _set_url_error_highlight(self, visible: bool):
+        """
+        设置URL输入框错误高亮（状态未变化时不重复配置控件）
+        
+        Args:
+            visible: 是否显示错误高亮
+        """
+        if self._url_error_visible == visible:
+            return
+        self._url_error_visible = visible
+        if visible:
+            self.view.txt_urls.config(highlightbackground="#FF6B6B", highlightcolor="#FF6B6B", highlightthickness=2)
+        else:
+            self.view.txt_urls.config(highlightthickness=0)
+    
+    def _validate_url_text(self, urls_text: str) -> tuple[bool, str, int]:
+        """
+        验证URL文本（文本未变化时直接返回上次结果）
+        
+        Args:
+            urls_text: URL输入框文本
+        
+        Returns:
+            (is_valid, error_msg, valid_count)
+        """
+        cache = self._url_validate_cache
+        if cache is not None and cache[0] == urls_text:
+            return cache[1]
+        result = validate_url_list(urls_text)
+        self._url_validate_cache = (urls_text, result)
+        return result
+    
     def _collect_config(self) -> dict:
         """
         收集配置
@@ -202,79 +474,52 @@ class DownloadController(BaseController):
         if self.settings_ctrl:
             try:
                 network_config = self.settings_ctrl.get_advanced_config()
-                cookiefile = network_config.get('cookiefile', '')
-                print(f"[DownloadController] 获取网络配置: proxy={'***' if network_config.get('proxy_text') else '(空)'}, "
-                      f"cookie={'***' if cookiefile else '(空)'}, "
-                      f"user_agent={'***' if network_config.get('user_agent') else '(空)'}")
-                print(f"[DownloadController] cookiefile完整路径: {cookiefile}")
-                print(f"[DownloadController] cookiefile长度: {len(cookiefile)}")
-                if cookiefile:
-                    from pathlib import Path
-                    cookie_path = Path(cookiefile)
-                    if cookie_path.exists():
-                        print(f"[DownloadController] ✓ Cookie文件存在: {cookiefile}")
-                    else:
-                        print(f"[DownloadController] ⚠️ Cookie文件不存在: {cookiefile}")
+                if _DEBUG:
+                    # 诊断输出（含 Cookie 文件存在性检查）仅在调试模式下执行
+                    cookiefile = network_config.get('cookiefile', '')
+                    _dbg(f"[DownloadController] 获取网络配置: proxy={'***' if network_config.get('proxy_text') else '(空)'}, "
+                          f"cookie={'***' if cookiefile else '(空)'}, "
+                          f"user_agent={'***' if network_config.get('user_agent') else '(空)'}")
+                    if cookiefile:
+                        state = "✓ Cookie文件存在" if Path(cookiefile).exists() else "⚠️ Cookie文件不存在"
+                        _dbg(f"[DownloadController] {state}: {cookiefile}")
             except Exception as e:
-                print(f"[DownloadController] 获取网络配置失败: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("[DownloadController] 获取网络配置失败: %s", e)
         
         # 合并全局配置和网络配置
-        config = {
-            **self.config,
-            **view_config,
-            **network_config  # 网络配置（proxy_text, cookiefile, user_agent等）
-        }
+        config = dict(self.config)
+        config.update(view_config)
+        config.update(network_config)  # 网络配置（proxy_text, cookiefile, user_agent等）
         
         # 自动保存配置
         self._save_config(view_config)
         
         return config
     
-    def _save_config(self, config: dict):
-        """
-        保存下载配置
-        
-        Args:
-            config: 配置字典
-        """
-        try:
-            from services.config_service import get_config_service
-            config_service = get_config_service()
-            config_service.save_download_config(config)
-            config_service.save()
-        except Exception as e:
-            # 保存失败不阻塞主流程
-            print(f"[DownloadController] 保存配置失败: {e}")
-    
     def load_config(self):
         """加载保存的配置到UI"""
         try:
-            from services.config_service import get_config_service
-            config_service = get_config_service()
+            config_service = self.cfg_service
             config = config_service.load_download_config()
-            print(f"[DownloadController] 加载下载配置:")
-            print(f"  - download_langs: {config.get('download_langs')} (类型: {type(config.get('download_langs'))})")
-            print(f"  - download_fmt: {config.get('download_fmt')} (类型: {type(config.get('download_fmt'))})")
-            print(f"  - max_workers: {config.get('max_workers')} (类型: {type(config.get('max_workers'))})")
-            print(f"  - output_root: {config.get('output_root')}")
+            _dbg(f"[DownloadController] 加载下载配置:")
+            _dbg(f"  - download_langs: {config.get('download_langs')} (类型: {type(config.get('download_langs'))})")
+            _dbg(f"  - download_fmt: {config.get('download_fmt')} (类型: {type(config.get('download_fmt'))})")
+            _dbg(f"  - max_workers: {config.get('max_workers')} (类型: {type(config.get('max_workers'))})")
+            _dbg(f"  - output_root: {config.get('output_root')}")
             
             # 加载配置到UI
             self.view.load_config(config)
             
             # 验证UI中的值
-            print(f"[DownloadController] 验证UI中的值:")
-            print(f"  - ent_langs: {self.view.ent_langs.get()}")
-            print(f"  - opt_fmt: {self.view.opt_fmt.get()}")
-            print(f"  - spin_workers: {self.view.spin_workers.get()}")
-            print(f"  - ent_output: {self.view.ent_output.get()}")
+            _dbg(f"[DownloadController] 验证UI中的值:")
+            _dbg(f"  - ent_langs: {self.view.ent_langs.get()}")
+            _dbg(f"  - opt_fmt: {self.view.opt_fmt.get()}")
+            _dbg(f"  - spin_workers: {self.view.spin_workers.get()}")
+            _dbg(f"  - ent_output: {self.view.ent_output.get()}")
             
-            print(f"[DownloadController] ✓ 下载配置已加载到UI")
+            _dbg(f"[DownloadController] ✓ 下载配置已加载到UI")
         except Exception as e:
-            print(f"[DownloadController] ✗ 加载配置失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] ✗ 加载配置失败: %s", e)
     
     def _save_config(self, config: dict):
         """
@@ -284,21 +529,18 @@ class DownloadController(BaseController):
             config: 配置字典
         """
         try:
-            from services.config_service import get_config_service
-            config_service = get_config_service()
+            config_service = self.cfg_service
             config_service.save_download_config(config)
             config_service.save()
         except Exception as e:
             # 保存失败不阻塞主流程
-            print(f"[DownloadController] 保存配置失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] 保存配置失败: %s", e)
     
     def clear_urls(self):
         """清空URL"""
         self.view.clear_urls()
         # 清除错误高亮
-        self.view.txt_urls.config(highlightthickness=0)
+        self._set_url_error_highlight(False)
         self._log("已清空链接输入框", "INFO")
     
     def _setup_auto_save(self):
@@ -313,11 +555,11 @@ class DownloadController(BaseController):
         
         # 检查必要的控件是否存在
         if not hasattr(self.view, 'ent_langs'):
-            print("[DownloadController] 警告: ent_langs控件不存在，延迟设置自动保存")
+            _dbg("[DownloadController] 警告: ent_langs控件不存在，延迟设置自动保存")
             root.after(200, self._setup_auto_save)
             return
         
-        print("[DownloadController] 开始设置自动保存绑定")
+        _dbg("[DownloadController] 开始设置自动保存绑定")
         
         def delayed_save():
             """延迟保存函数"""
@@ -333,64 +575,65 @@ class DownloadController(BaseController):
         # 绑定语言输入框变化事件
         self.view.ent_langs.bind('<KeyRelease>', lambda e: delayed_save())
         self.view.ent_langs.bind('<FocusOut>', lambda e: self._on_config_changed())
-        print("[DownloadController] ✓ 已绑定 ent_langs 事件")
+        _dbg("[DownloadController] ✓ 已绑定 ent_langs 事件")
         
         # 绑定格式下拉框变化事件
         self.view.opt_fmt.bind('<<ComboboxSelected>>', lambda e: self._on_config_changed())
-        print("[DownloadController] ✓ 已绑定 opt_fmt 事件")
+        _dbg("[DownloadController] ✓ 已绑定 opt_fmt 事件")
         
         # 绑定并发数输入框变化事件
         self.view.spin_workers.bind('<KeyRelease>', lambda e: delayed_save())
         self.view.spin_workers.bind('<ButtonRelease-1>', lambda e: delayed_save())
         self.view.spin_workers.bind('<FocusOut>', lambda e: self._on_config_changed())
-        print("[DownloadController] ✓ 已绑定 spin_workers 事件")
+        _dbg("[DownloadController] ✓ 已绑定 spin_workers 事件")
         
         # 绑定输出目录输入框变化事件
         self.view.ent_output.bind('<KeyRelease>', lambda e: delayed_save())
         self.view.ent_output.bind('<FocusOut>', lambda e: self._on_config_changed())
-        print("[DownloadController] ✓ 已绑定 ent_output 事件")
+        _dbg("[DownloadController] ✓ 已绑定 ent_output 事件")
+        
+        # 绑定URL输入框变化事件（实时验证，防抖300ms）
+        self._url_validate_job = None
         
-        # 绑定URL输入框变化事件（实时验证）
         def on_url_change(event):
-            """URL输入变化时实时验证"""
+            """URL输入变化时延迟验证（停止输入后才验证，避免粘贴大量URL时逐键全量验证）"""
+            if self._url_validate_job:
+                try:
+                    root.after_cancel(self._url_validate_job)
+                except:
+                    pass
+            self._url_validate_job = root.after(300, _do_validate)
+        
+        def _do_validate():
+            """实际执行URL验证并更新高亮"""
+            self._url_validate_job = None
             urls_text = self.view.txt_urls.get("1.0", "end-1c").strip()
             if not urls_text:
                 # 清空时清除错误高亮
-                self.view.txt_urls.config(highlightthickness=0)
+                self._set_url_error_highlight(False)
                 return
             
             # 实时验证URL格式
-            from validators import validate_url_list
-            is_valid, error_msg, valid_count = validate_url_list(urls_text)
+            is_valid, error_msg, valid_count = self._validate_url_text(urls_text)
             
             if not is_valid:
                 # 显示错误高亮
-                self.view.txt_urls.config(highlightbackground="#FF6B6B", highlightcolor="#FF6B6B", highlightthickness=2)
+                self._set_url_error_highlight(True)
             else:
                 # 清除错误高亮
-                self.view.txt_urls.config(highlightthickness=0)
+                self._set_url_error_highlight(False)
         
         self.view.txt_urls.bind('<KeyRelease>', on_url_change)
         self.view.txt_urls.bind('<FocusOut>', on_url_change)
-        print("[DownloadController] ✓ 已绑定 txt_urls 实时验证事件")
+        _dbg("[DownloadController] ✓ 已绑定 txt_urls 实时验证事件")
         
         # 绑定高级选项复选框变化事件
-        checkbox_vars = []
-        if hasattr(self.view, 'var_merge_bilingual'):
-            checkbox_vars.append(self.view.var_merge_bilingual)
-        if hasattr(self.view, 'var_force_refresh'):
-            checkbox_vars.append(self.view.var_force_refresh)
-        if hasattr(self.view, 'var_incremental_detect'):
-            checkbox_vars.append(self.view.var_incremental_detect)
-        if hasattr(self.view, 'var_incremental_download'):
-            checkbox_vars.append(self.view.var_incremental_download)
-        if hasattr(self.view, 'var_early_stop'):
-            checkbox_vars.append(self.view.var_early_stop)
+        checkbox_vars = [v for v in (getattr(self.view, n, None) for n in _CHECKBOX_VARS) if v is not None]
         
         for var in checkbox_vars:
             var.trace_add('write', lambda *args: delayed_save())
         
-        print("[DownloadController] ✓ 自动保存绑定完成")
+        _dbg("[DownloadController] ✓ 自动保存绑定完成")
     
     def _on_config_changed(self):
         """配置变化时自动保存（延迟保存）"""
@@ -399,29 +642,17 @@ class DownloadController(BaseController):
             view_config = self.view.get_config()
             
             # 打印调试信息
-            print(f"[DownloadController] 自动保存下载配置:")
-            print(f"  - download_langs: {view_config.get('download_langs')}")
-            print(f"  - download_fmt: {view_config.get('download_fmt')}")
-            print(f"  - max_workers: {view_config.get('max_workers')}")
-            print(f"  - output_root: {view_config.get('output_root')}")
+            _dbg(f"[DownloadController] 自动保存下载配置:")
+            _dbg(f"  - download_langs: {view_config.get('download_langs')}")
+            _dbg(f"  - download_fmt: {view_config.get('download_fmt')}")
+            _dbg(f"  - max_workers: {view_config.get('max_workers')}")
+            _dbg(f"  - output_root: {view_config.get('output_root')}")
             
             # 保存配置
             self._save_config(view_config)
-            
-            # 验证保存结果
-            from services.config_service import get_config_service
-            config_service = get_config_service()
-            saved_config = config_service.load_download_config()
-            print(f"[DownloadController] ✓ 保存后验证:")
-            print(f"  - download_langs: {saved_config.get('download_langs')}")
-            print(f"  - download_fmt: {saved_config.get('download_fmt')}")
-            print(f"  - max_workers: {saved_config.get('max_workers')}")
-            print(f"[DownloadController] ✓ 配置已自动保存成功")
         except Exception as e:
             # 自动保存失败不阻塞，但打印错误信息
-            import traceback
-            print(f"[DownloadController] ✗ 自动保存失败: {e}")
-            traceback.print_exc()
+            logger.exception("[DownloadController] ✗ 自动保存失败: %s", e)
     
     def _enhance_progress_info(self, progress: dict) -> dict:
         """
@@ -431,46 +662,22 @@ class DownloadController(BaseController):
             progress: 原始进度信息字典
         
         Returns:
-            增强后的进度信息字典
+            增强后的进度信息字典（新字典，不修改原始进度）
         """
-        import time
-        
-        # 复制原始进度信息
-        enhanced = progress.copy()
-        
         # 提取基本信息
         current = progress.get("current", 0)
         total = progress.get("total", 0)
-        phase = progress.get("phase", "")
         message = progress.get("message", "")
         
-        # 计算百分比
-        if total > 0:
-            percent = (current / total) * 100
-        else:
-            percent = 0
-        
-        enhanced["percent"] = percent
-        
-        # 提取视频标题（从current_item或message中）
+        # 提取视频标题（优先使用meta中的标题）
         title = progress.get("current_item", "")
-        if not title:
-            # 尝试从message中提取标题（如果包含视频信息）
-            if "title" in message.lower() or "视频" in message:
-                # 简单提取，实际可能需要更复杂的解析
-                pass
-        
-        # 从meta中提取标题（如果存在）
-        meta = progress.get("meta", {})
+        meta = progress.get("meta")
         if isinstance(meta, dict) and "title" in meta:
             title = meta.get("title", "")
-        
         if title:
-            enhanced["title"] = title
             self.progress_current_title = title
         
-        # 计算速度和剩余时间
-        now = time.time()
+        now = _now()
         
         # 如果任务刚开始，初始化时间
         if self.progress_start_time is None:
@@ -478,26 +685,7 @@ class DownloadController(BaseController):
             self.progress_last_time = now
             self.progress_last_count = 0
         
-        # 计算速度（items/second）
-        if current > 0 and now > self.progress_start_time:
-            elapsed = now - self.progress_start_time
-            if elapsed > 0:
-                speed = current / elapsed
-                enhanced["speed"] = speed
-                
-                # 计算剩余时间
-                if total > current and speed > 0:
-                    remaining = total - current
-                    eta = remaining / speed
-                    enhanced["eta"] = eta
-                else:
-                    enhanced["eta"] = 0
-            else:
-                enhanced["speed"] = 0
-                enhanced["eta"] = None
-        else:
-            enhanced["speed"] = None
-            enhanced["eta"] = None
+        percent, speed, eta = _progress_rates(current, total, now - self.progress_start_time)
         
         # 更新最后状态（用于平滑速度计算）
         # 只在有实际进度变化时更新
@@ -505,15 +693,18 @@ class DownloadController(BaseController):
             self.progress_last_time = now
             self.progress_last_count = current
         
-        # 添加任务信息（如果没有）
-        if "task" not in enhanced and message:
-            enhanced["task"] = message
-        
-        return enhanced
+        return {
+            **progress,
+            "percent": percent,
+            "speed": speed,
+            "eta": eta,
+            "title": title or progress.get("title", ""),
+            "task": progress.get("task") or message,
+        }
     
     def _on_progress(self, progress: dict):
         """
-        进度回调函数
+        进度回调函数（在下载服务线程中调用，只入队不做任何 GUI 操作）
         
         Args:
             progress: 进度信息字典，包含：
@@ -525,6 +716,78 @@ class DownloadController(BaseController):
         """
         if self.is_stopped:
             return  # 如果已停止，忽略进度更新
+        self._progress_q.put_nowait(progress)
+    
+    def _schedule_progress_drain(self):
+        """启动进度队列轮询（已在运行时不重复启动）"""
+        if self._progress_drain_job is not None:
+            return
+        try:
+            self._progress_drain_job = self.view.after(50, self._drain_progress)
+        except (RuntimeError, TclError):
+            self._progress_drain_job = None  # 视图已销毁
+    
+    def _drain_progress(self, max_items: int = 500):
+        """
+        在 GUI 主线程中取出队列中的进度并发布
+        
+        同一阶段只发布最新的一条（最后一次事件优先），
+        队列已空且任务结束后停止轮询。
+        """
+        self._progress_drain_job = None
+        self._flush_progress(max_items)
+        
+        if not self._progress_q.empty() or self.service.is_running():
+            self._schedule_progress_drain()
+    
+    def _flush_progress(self, max_items: int | None = None):
+        """
+        取出队列中的进度（最多 max_items 条，None 表示取空），每个阶段只发布最新的一条（GUI 主线程）
+        
+        Args:
+            max_items: 本次最多取出的条数
+        """
+        latest: dict[str, dict] = {}
+        remaining = max_items
+        while remaining is None or remaining > 0:
+            try:
+                progress = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+            latest[progress.get("phase", "")] = progress
+            if remaining is not None:
+                remaining -= 1
+        
+        if not self.is_stopped:
+            for progress in latest.values():
+                self._emit_progress(progress)
+    
+    def _discard_queued_progress(self):
+        """丢弃队列中尚未发布的进度"""
+        try:
+            while True:
+                self._progress_q.get_nowait()
+        except queue.Empty:
+            pass
+    
+    def _emit_progress(self, progress: dict):
+        """
+        增强并发布进度事件
+        
+        Args:
+            progress: 原始进度信息字典
+        """
+        # 与上次发布相比没有任何新内容
+        current = progress.get("current", 0)
+        phase = progress.get("phase", "")
+        message = progress.get("message", "")
+        if (current == self._last_emitted_current
+                and phase == self._last_emitted_phase
+                and message == self._last_emitted_message):
+            return
+        self._last_emitted_current = current
+        self._last_emitted_phase = phase
+        self._last_emitted_message = message
         
         # 增强进度信息（计算速度、ETA等）
         enhanced = self._enhance_progress_info(progress)
@@ -537,13 +800,34 @@ class DownloadController(BaseController):
     
     def _on_completion(self, result: dict):
         """
-        下载完成回调
+        下载完成回调（在下载服务线程中调用，转交 GUI 主线程处理）
         
         Args:
             result: 结果信息
         """
-        print(f"[DownloadController] _on_completion 被调用: result={result}")
-        print(f"[DownloadController] is_dry_run={self.is_dry_run}, is_stopped={self.is_stopped}")
+        _dbg(f"[DownloadController] _on_completion 被调用: result={result}")
+        try:
+            self.view.after(0, self._handle_completion, result)
+        except (RuntimeError, TclError):
+            pass  # 视图已销毁
+    
+    def _handle_completion(self, result: dict):
+        """
+        处理下载完成（GUI 主线程）：先发布队列中剩余的进度（含最终进度），再发布完成信息，
+        保证完成事件之后不会再出现进度事件
+        
+        Args:
+            result: 结果信息
+        """
+        _dbg(f"[DownloadController] is_dry_run={self.is_dry_run}, is_stopped={self.is_stopped}")
+        
+        if self._progress_drain_job is not None:
+            try:
+                self.view.after_cancel(self._progress_drain_job)
+            except (RuntimeError, TclError):
+                pass
+            self._progress_drain_job = None
+        self._flush_progress()
         
         # 如果已停止，忽略完成回调（避免显示停止后的进度）
         if self.is_stopped:
@@ -553,26 +837,25 @@ class DownloadController(BaseController):
         if "error" in result:
             # 下载失败 - 使用错误处理工具格式化错误消息
             error_msg = result["error"]
-            print(f"[DownloadController] 下载失败: {error_msg}")
+            _dbg(f"[DownloadController] 下载失败: {error_msg}")
+            
+            if ErrorHandler is None:
+                # 如果错误处理工具不可用，使用原有方式
+                self.event_bus.publish(Event(
+                    EventType.DOWNLOAD_FAILED,
+                    {"reason": error_msg}
+                ))
+                self._log(f"下载失败: {error_msg}", "ERROR")
+                return
             
             # 尝试使用错误处理工具
             try:
-                from utils.error_handler import ErrorHandler
-                
-                # 尝试从错误消息中提取错误代码
-                error_code = "error_other"
-                if "timeout" in error_msg.lower():
-                    error_code = "error_timeout"
-                elif "429" in error_msg or "rate limit" in error_msg.lower():
-                    error_code = "error_429"
-                elif "503" in error_msg:
-                    error_code = "error_503"
-                elif "sign in" in error_msg.lower() or "cookie" in error_msg.lower() or "bot" in error_msg.lower():
-                    error_code = "YTDLP_SIGNIN"
+                # 尝试从错误消息中提取错误代码（按优先级取第一个命中的特征）
+                low = error_msg.lower()
+                error_code = next((code for sig, code in _ERROR_SIGNATURES if sig in low), "error_other")
+                if error_code == "YTDLP_SIGNIN":
                     # Cookie失效特殊提示
-                    self._log("⚠️ Cookie 失效或已过期！", "ERROR")
-                    self._log("请前往【高级设置】→【网络设置】→【Cookie文件】更新有效的Cookie文件", "WARN")
-                    self._log("提示：Cookie文件通常需要定期更新，建议使用浏览器扩展（如Get cookies.txt）导出最新Cookie", "INFO")
+                    self._log_cookie_expired()
                 
                 category, name, retryable, suggestion = ErrorHandler.classify_error(error_code)
                 formatted_msg = ErrorHandler.format_error_message(error_code, error_msg)
@@ -594,16 +877,9 @@ class DownloadController(BaseController):
                 self._log(f"建议: {suggestion}", "INFO")
                 if retryable:
                     self._log("提示: 此错误可以重试", "INFO")
-            except ImportError:
-                # 如果错误处理工具不可用，使用原有方式
-                self.event_bus.publish(Event(
-                    EventType.DOWNLOAD_FAILED,
-                    {"reason": error_msg}
-                ))
-                self._log(f"下载失败: {error_msg}", "ERROR")
             except Exception as e:
                 # 如果错误处理工具出错，使用原有方式
-                print(f"[DownloadController] 错误处理工具出错: {e}")
+                _dbg(f"[DownloadController] 错误处理工具出错: {e}")
                 self.event_bus.publish(Event(
                     EventType.DOWNLOAD_FAILED,
                     {"reason": error_msg}
@@ -611,15 +887,15 @@ class DownloadController(BaseController):
                 self._log(f"下载失败: {error_msg}", "ERROR")
         else:
             run_dir = result.get("run_dir", "")
-            print(f"[DownloadController] 下载完成，run_dir={run_dir}, is_dry_run={self.is_dry_run}")
+            _dbg(f"[DownloadController] 下载完成，run_dir={run_dir}, is_dry_run={self.is_dry_run}")
             
             if self.is_dry_run:
                 # 检测模式：显示检测结果（字幕类型和语言）
-                print(f"[DownloadController] 进入检测结果显示流程")
+                _dbg(f"[DownloadController] 进入检测结果显示流程")
                 self._show_detection_results(run_dir, result)
             else:
                 # 下载模式：显示下载结果并验证
-                print(f"[DownloadController] 发布下载完成事件")
+                _dbg(f"[DownloadController] 发布下载完成事件")
                 self.event_bus.publish(Event(
                     EventType.DOWNLOAD_COMPLETED,
                     result
@@ -636,49 +912,51 @@ class DownloadController(BaseController):
             run_dir: 运行目录
             result: 结果信息
         """
-        print(f"[DownloadController] _show_detection_results 被调用: run_dir={run_dir}")
+        _dbg(f"[DownloadController] _show_detection_results 被调用: run_dir={run_dir}")
         try:
-            from pathlib import Path
-            import json
-            
             # 检查 run_dir 是否存在
             if not run_dir:
-                print("[DownloadController] ✗ run_dir 为空，无法读取检测结果")
+                _dbg("[DownloadController] ✗ run_dir 为空，无法读取检测结果")
                 self._log("检测完成，但未找到输出目录", "WARN")
                 return
             
             run_path = Path(run_dir)
             if not run_path.exists():
-                print(f"[DownloadController] ✗ run_dir 不存在: {run_dir}")
+                _dbg(f"[DownloadController] ✗ run_dir 不存在: {run_dir}")
                 self._log(f"检测完成，但输出目录不存在: {run_dir}", "WARN")
                 return
             
-            print(f"[DownloadController] ✓ run_dir 存在: {run_dir}")
+            _dbg(f"[DownloadController] ✓ run_dir 存在: {run_dir}")
             
             # 读取检测结果
             results = []
             run_jsonl = run_path / "run.jsonl"
-            print(f"[DownloadController] 检查 run.jsonl: {run_jsonl}, 存在={run_jsonl.exists()}")
+            _dbg(f"[DownloadController] 检查 run.jsonl: {run_jsonl}, 存在={run_jsonl.exists()}")
             
             if run_jsonl.exists():
-                content = run_jsonl.read_text(encoding='utf-8')
-                print(f"[DownloadController] run.jsonl 内容长度: {len(content)}")
-                for line_num, line in enumerate(content.splitlines(), 1):
-                    if line.strip():
+                # 逐行流式读取，避免整文件读入内存
+                with run_jsonl.open('r', encoding='utf-8', buffering=1 << 16) as f:
+                    for line_num, line in enumerate(f, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        # 廉价预过滤：带 action 字段但不含 "detect" 的记录无需解析
+                        if '"action"' in line and '"detect"' not in line:
+                            continue
                         try:
-                            rec = json.loads(line)
+                            rec = _jloads(line)
                             if rec.get("action") == "detect":
                                 results.append(rec)
-                                print(f"[DownloadController] 找到检测记录 #{len(results)}: {rec.get('video_id', 'unknown')}")
+                                _dbg(f"[DownloadController] 找到检测记录 #{len(results)}: {rec.get('video_id', 'unknown')}")
                         except Exception as e:
-                            print(f"[DownloadController] 解析第 {line_num} 行失败: {e}")
+                            _dbg(f"[DownloadController] 解析第 {line_num} 行失败: {e}")
                             continue
             
-            print(f"[DownloadController] 共找到 {len(results)} 条检测记录")
+            _dbg(f"[DownloadController] 共找到 {len(results)} 条检测记录")
             
             if not results:
                 # 如果没有检测记录，尝试从has_subs.txt和no_subs.txt读取
-                print("[DownloadController] 未找到检测记录，尝试读取 has_subs.txt 和 no_subs.txt")
+                _dbg("[DownloadController] 未找到检测记录，尝试读取 has_subs.txt 和 no_subs.txt")
                 has_subs_file = run_path / "has_subs.txt"
                 no_subs_file = run_path / "no_subs.txt"
                 
@@ -688,12 +966,12 @@ class DownloadController(BaseController):
                 if has_subs_file.exists():
                     has_subs_lines = has_subs_file.read_text(encoding='utf-8').splitlines()
                     has_subs_count = len([l for l in has_subs_lines if l.strip()])
-                    print(f"[DownloadController] has_subs.txt 存在，有字幕数量: {has_subs_count}")
+                    _dbg(f"[DownloadController] has_subs.txt 存在，有字幕数量: {has_subs_count}")
                 
                 if no_subs_file.exists():
                     no_subs_lines = no_subs_file.read_text(encoding='utf-8').splitlines()
                     no_subs_count = len([l for l in no_subs_lines if l.strip()])
-                    print(f"[DownloadController] no_subs.txt 存在，无字幕数量: {no_subs_count}")
+                    _dbg(f"[DownloadController] no_subs.txt 存在，无字幕数量: {no_subs_count}")
                 
                 total = has_subs_count + no_subs_count
                 if total > 0:
@@ -710,7 +988,7 @@ class DownloadController(BaseController):
                     self._log(f"检测完成: 总计 {total}，有字幕 {has_subs_count}，无字幕 {no_subs_count}", "SUCCESS")
                     return
                 else:
-                    print("[DownloadController] ✗ has_subs.txt 和 no_subs.txt 也不存在或为空")
+                    _dbg("[DownloadController] ✗ has_subs.txt 和 no_subs.txt 也不存在或为空")
                     self._log("检测完成，但未找到检测结果文件", "WARN")
                     return
             
@@ -738,15 +1016,19 @@ class DownloadController(BaseController):
                     auto_langs.update(rec.get("auto_langs", []))
                     all_langs.update(rec.get("all_langs", []))
             
-            print(f"[DownloadController] 分析结果: 有字幕={len(has_subs)}, 无字幕={len(no_subs)}, 错误={len(errors)}")
-            print(f"[DownloadController] 语言统计: 人工字幕={sorted(manual_langs)}, 自动字幕={sorted(auto_langs)}")
+            _dbg(f"[DownloadController] 分析结果: 有字幕={len(has_subs)}, 无字幕={len(no_subs)}, 错误={len(errors)}")
+            # 每个集合只排序一次，日志/事件/摘要共用
+            manual_sorted = sorted(manual_langs)
+            auto_sorted = sorted(auto_langs)
+            all_sorted = sorted(all_langs)
+            _dbg(f"[DownloadController] 语言统计: 人工字幕={manual_sorted}, 自动字幕={auto_sorted}")
             
             # 格式化语言信息
             lang_info = []
-            if manual_langs:
-                lang_info.append(f"人工字幕: {', '.join(sorted(manual_langs))}")
-            if auto_langs:
-                lang_info.append(f"自动字幕: {', '.join(sorted(auto_langs))}")
+            if manual_sorted:
+                lang_info.append(f"人工字幕: {', '.join(manual_sorted)}")
+            if auto_sorted:
+                lang_info.append(f"自动字幕: {', '.join(auto_sorted)}")
             if not lang_info and len(errors) == 0:
                 lang_info.append("未检测到字幕")
             
@@ -757,10 +1039,7 @@ class DownloadController(BaseController):
             errors_count = len(errors)
             
             # 统计错误类型
-            error_types = {}
-            for err_rec in errors:
-                err_status = err_rec.get("status", "error_unknown")
-                error_types[err_status] = error_types.get(err_status, 0) + 1
+            error_types = Counter(err_rec.get("status", "error_unknown") for err_rec in errors)
             
             self.event_bus.publish(Event(
                 EventType.DOWNLOAD_COMPLETED,
@@ -771,10 +1050,10 @@ class DownloadController(BaseController):
                     "no_subs_count": no_subs_count,
                     "errors_count": errors_count,
                     "total": total,
-                    "manual_langs": sorted(manual_langs),
-                    "auto_langs": sorted(auto_langs),
-                    "all_langs": sorted(all_langs),
-                    "error_types": error_types
+                    "manual_langs": manual_sorted,
+                    "auto_langs": auto_sorted,
+                    "all_langs": all_sorted,
+                    "error_types": dict(error_types)
                 }
             ))
             
@@ -798,28 +1077,10 @@ class DownloadController(BaseController):
                 self._log(f"检测错误详情 ({errors_count} 个):", "WARN")
                 
                 # 使用错误处理工具格式化错误信息
-                try:
-                    from utils.error_handler import ErrorHandler
-                    use_error_handler = True
-                except ImportError:
-                    use_error_handler = False
+                use_error_handler = ErrorHandler is not None
                 
-                for err_status, count in sorted(error_types.items()):
-                    if use_error_handler:
-                        category, name, retryable, suggestion = ErrorHandler.classify_error(err_status)
-                        error_name = name
-                    else:
-                        # 回退到原有映射
-                        error_name = {
-                            "error_other": "其他错误（可能需要 Cookie 认证）",
-                            "error_429": "请求过于频繁（429）",
-                            "error_503": "服务不可用（503）",
-                            "error_timeout": "请求超时",
-                            "error_private": "视频为私有",
-                            "error_geo": "地区限制"
-                        }.get(err_status, err_status)
-                        retryable = err_status in ["error_429", "error_503", "error_timeout"]
-                        suggestion = ""
+                for err_status, count in error_types.most_common():
+                    error_name, retryable, suggestion = _classify_status(err_status)
                     
                     retryable_mark = "（可重试）" if retryable else ""
                     self._log(f"  • {error_name}: {count} 个{retryable_mark}", "WARN")
@@ -829,6 +1090,7 @@ class DownloadController(BaseController):
                         self._log(f"    建议: {suggestion}", "INFO")
                 
                 # 显示前3个错误的详细信息
+                detail_lines = []
                 for err_rec in errors[:3]:
                     vid = err_rec.get("video_id", "")
                     title = err_rec.get("meta", {}).get("title", "")
@@ -846,16 +1108,12 @@ class DownloadController(BaseController):
                             url
                         )
                     
+                    # format_error_message 内部已截断标题和详情，这里直接传原始字符串
                     if use_error_handler:
-                        error_msg = ErrorHandler.format_error_message(
-                            status,
-                            api_err[:100] if api_err else "",
-                            vid,
-                            title[:50] if title else ""
-                        )
-                        self._log(f"  - {error_msg}", "ERROR")
+                        detail_lines.append(f"  - {ErrorHandler.format_error_message(status, api_err, vid, title)}")
                     else:
-                        self._log(f"  - {vid}: {status}", "WARN")
+                        detail_lines.append(f"  - {vid}: {status}")
+                self._log_batch(detail_lines, "ERROR" if use_error_handler else "WARN")
                 
                 if len(errors) > 3:
                     self._log(f"  ... 还有 {len(errors) - 3} 个错误", "WARN")
@@ -867,17 +1125,15 @@ class DownloadController(BaseController):
                     vid = rec.get("video_id", "")
                     title = rec.get("meta", {}).get("title", "")[:50]
                     langs = rec.get("all_langs", [])
-                    lang_str = ", ".join(sorted(langs)) if langs else "未知"
+                    lang_str = _format_langs(tuple(sorted(langs))) if langs else "未知"
                     self._log(f"  • {vid}: {title} - 语言: {lang_str}", "INFO")
                 if len(has_subs) > 5:
                     self._log(f"  ... 还有 {len(has_subs) - 5} 个视频", "INFO")
                     
-            print(f"[DownloadController] ✓ 检测结果显示完成")
+            _dbg(f"[DownloadController] ✓ 检测结果显示完成")
             
         except Exception as e:
-            print(f"[DownloadController] ✗ 显示检测结果失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] ✗ 显示检测结果失败: %s", e)
             self._log(f"读取检测结果失败: {e}", "WARN")
     
     def _verify_download_results(self, run_dir: str, result: dict):
@@ -888,36 +1144,38 @@ class DownloadController(BaseController):
             run_dir: 运行目录
             result: 结果信息
         """
-        print(f"[DownloadController] ========== _verify_download_results 被调用 ==========")
-        print(f"[DownloadController] run_dir={run_dir}")
-        print(f"[DownloadController] result keys: {list(result.keys())}")
-        import sys
-        sys.stdout.flush()
+        _dbg(f"[DownloadController] ========== _verify_download_results 被调用 ==========")
+        _dbg(f"[DownloadController] run_dir={run_dir}")
+        _dbg(f"[DownloadController] result keys: {list(result.keys())}")
         try:
-            from pathlib import Path
-            
             if not run_dir:
-                print("[DownloadController] ✗ run_dir 为空，无法验证下载结果")
+                _dbg("[DownloadController] ✗ run_dir 为空，无法验证下载结果")
                 self._log("下载完成，但未找到输出目录", "WARN")
                 return
             
             run_path = Path(run_dir)
             if not run_path.exists():
-                print(f"[DownloadController] ✗ run_dir 不存在: {run_dir}")
+                _dbg(f"[DownloadController] ✗ run_dir 不存在: {run_dir}")
                 self._log(f"下载完成，但输出目录不存在: {run_dir}", "WARN")
                 return
             
             # 检查字幕目录
             subs_dir = run_path / "subs"
-            downloaded_files = []
+            file_count = 0  # 字幕文件总数
+            preview_files = []  # 用于显示的前20个文件
             
             if subs_dir.exists() and subs_dir.is_dir():
-                # 列出所有字幕文件
-                subtitle_files = list(subs_dir.glob("*.*"))
-                downloaded_files = [f for f in subtitle_files if f.is_file()]
-                print(f"[DownloadController] 找到 {len(downloaded_files)} 个字幕文件")
+                # 统计字幕文件，只保留前20个用于显示（先按扩展名过滤，DirEntry 缓存了类型信息，is_file 无需额外 stat）
+                with os.scandir(subs_dir) as it:
+                    for entry in it:
+                        if (os.path.splitext(entry.name)[1].lower() in _SUBTITLE_EXTS
+                                and entry.is_file(follow_symlinks=False)):
+                            file_count += 1
+                            if len(preview_files) < 20:
+                                preview_files.append(entry)
+                _dbg(f"[DownloadController] 找到 {file_count} 个字幕文件")
             else:
-                print(f"[DownloadController] ⚠️ 字幕目录不存在: {subs_dir}")
+                _dbg(f"[DownloadController] ⚠️ 字幕目录不存在: {subs_dir}")
             
             # 读取下载统计
             stats = result.get("stats", {})
@@ -925,55 +1183,30 @@ class DownloadController(BaseController):
             skipped_count = stats.get("skipped", result.get("skipped", 0))
             failed_count = stats.get("failed", result.get("failed", 0))
             
-            print(f"[DownloadController] 原始统计: downloaded={downloaded_count}, skipped={skipped_count}, failed={failed_count}")
-            import sys
-            sys.stdout.flush()
+            _dbg(f"[DownloadController] 原始统计: downloaded={downloaded_count}, skipped={skipped_count}, failed={failed_count}")
             
             # 如果实际找到了文件，但统计显示失败，可能是统计逻辑问题
             # 优先以实际文件数量为准
-            actual_file_count = len(downloaded_files)
-            print(f"[DownloadController] 实际文件数: {actual_file_count}")
-            sys.stdout.flush()
+            actual_file_count = file_count
+            _dbg(f"[DownloadController] 实际文件数: {actual_file_count}")
             
             # 调整统计逻辑：如果实际有文件，优先以实际文件数量为准
+            # - 成功数小于实际文件数：成功数补足到实际文件数，失败数相应减少
+            # - 否则剩余的失败计数属于误报（实际文件已下载成功），清零
             if actual_file_count > 0:
-                print(f"[DownloadController] ========== 开始调整统计 ==========")
-                print(f"[DownloadController] 条件检查: downloaded_count={downloaded_count}, actual_file_count={actual_file_count}, failed_count={failed_count}")
-                sys.stdout.flush()
-                
-                if downloaded_count < actual_file_count:
-                    # 如果成功数小于实际文件数，调整成功数
-                    old_downloaded = downloaded_count
-                    old_failed = failed_count
-                    downloaded_count = actual_file_count
-                    # 计算需要从失败计数中减去的数量
-                    adjustment = actual_file_count - old_downloaded
-                    failed_count = max(0, failed_count - adjustment)
-                    print(f"[DownloadController] ✓ 调整统计（情况1）：实际文件数={actual_file_count}，原成功={old_downloaded}，原失败={old_failed}，调整后成功={downloaded_count}，失败={failed_count}")
-                    sys.stdout.flush()
-                elif failed_count > 0 and downloaded_count >= actual_file_count:
-                    # 如果成功数已经等于或大于实际文件数，但仍有失败计数，说明失败计数是误报
-                    # 将失败计数清零（因为实际文件已经下载成功了）
-                    old_failed = failed_count
-                    failed_count = 0
-                    print(f"[DownloadController] ✓✓✓ 调整统计（情况2）：实际文件数={actual_file_count}，成功数={downloaded_count}，原失败计数={old_failed}（误报），清零后失败={failed_count} ✓✓✓")
-                    sys.stdout.flush()
+                if actual_file_count > downloaded_count:
+                    failed_count = max(0, failed_count - (actual_file_count - downloaded_count))
                 else:
-                    print(f"[DownloadController] 无需调整统计")
-                    sys.stdout.flush()
-            else:
-                print(f"[DownloadController] 未找到实际文件，使用原始统计")
-                sys.stdout.flush()
+                    failed_count = 0
+                downloaded_count = max(downloaded_count, actual_file_count)
             
-            print(f"[DownloadController] ========== 最终统计: downloaded={downloaded_count}, skipped={skipped_count}, failed={failed_count} ==========")
-            sys.stdout.flush()
+            _dbg(f"[DownloadController] ========== 最终统计: downloaded={downloaded_count}, skipped={skipped_count}, failed={failed_count} ==========")
             
             total_count = downloaded_count + skipped_count + failed_count
             
             # 显示下载统计
-            print(f"[DownloadController] ========== 准备显示统计信息 ==========")
-            print(f"[DownloadController] 显示统计: downloaded={downloaded_count}, skipped={skipped_count}, failed={failed_count}")
-            sys.stdout.flush()
+            _dbg(f"[DownloadController] ========== 准备显示统计信息 ==========")
+            _dbg(f"[DownloadController] 显示统计: downloaded={downloaded_count}, skipped={skipped_count}, failed={failed_count}")
             
             self._log(f"\n下载统计: 总计 {total_count}", "INFO")
             if downloaded_count > 0:
@@ -984,31 +1217,30 @@ class DownloadController(BaseController):
                 # 如果实际有文件但统计显示失败，说明可能是统计误差
                 if actual_file_count > 0:
                     # 这种情况不应该出现（因为我们已经调整了统计），但如果出现了，说明调整逻辑有问题
-                    print(f"[DownloadController] ⚠️⚠️⚠️ 警告：failed_count={failed_count} > 0，但实际文件数={actual_file_count}，这不应该发生！")
-                    sys.stdout.flush()
+                    _dbg(f"[DownloadController] ⚠️⚠️⚠️ 警告：failed_count={failed_count} > 0，但实际文件数={actual_file_count}，这不应该发生！")
                     self._log(f"  ⚠️ 注意: 统计显示失败 {failed_count} 个，但实际找到了 {actual_file_count} 个文件", "WARN")
                 else:
                     self._log(f"  ✗ 失败: {failed_count} 个", "ERROR")
             else:
-                print(f"[DownloadController] ✓ failed_count=0，不显示失败信息")
-                sys.stdout.flush()
+                _dbg(f"[DownloadController] ✓ failed_count=0，不显示失败信息")
             
             # 显示文件列表（最多显示前20个）
-            if downloaded_files:
-                self._log(f"\n下载的文件 ({len(downloaded_files)} 个):", "INFO")
-                for i, file_path in enumerate(downloaded_files[:20], 1):
-                    file_size = file_path.stat().st_size
-                    size_str = self._format_file_size(file_size)
-                    self._log(f"  {i}. {file_path.name} ({size_str})", "INFO")
-                
-                if len(downloaded_files) > 20:
-                    self._log(f"  ... 还有 {len(downloaded_files) - 20} 个文件", "INFO")
+            if file_count:
+                # 文件列表合并为一条日志发布
+                file_lines = [f"\n下载的文件 ({file_count} 个):"]
+                # 与 is_file(follow_symlinks=False) 一致使用 lstat：Windows 上直接取目录读取时缓存的数据，无额外系统调用
+                sizes = _entry_sizes(preview_files, parallel=_is_network_path(run_dir))
+                for i, (entry, size) in enumerate(zip(preview_files, sizes), 1):
+                    file_lines.append(f"  {i}. {entry.name} ({_format_file_size(size)})")
+                if file_count > 20:
+                    file_lines.append(f"  ... 还有 {file_count - 20} 个文件")
+                self._log_batch(file_lines, "INFO")
                 
                 # 验证文件数量是否匹配
-                if downloaded_count > 0 and len(downloaded_files) < downloaded_count:
-                    self._log(f"⚠️ 警告: 预期下载 {downloaded_count} 个文件，但只找到 {len(downloaded_files)} 个文件", "WARN")
-                elif len(downloaded_files) == downloaded_count:
-                    self._log(f"✓ 文件数量验证通过: {len(downloaded_files)} 个文件", "SUCCESS")
+                if downloaded_count > 0 and file_count < downloaded_count:
+                    self._log(f"⚠️ 警告: 预期下载 {downloaded_count} 个文件，但只找到 {file_count} 个文件", "WARN")
+                elif file_count == downloaded_count:
+                    self._log(f"✓ 文件数量验证通过: {file_count} 个文件", "SUCCESS")
             else:
                 if downloaded_count > 0:
                     self._log(f"⚠️ 警告: 统计显示下载了 {downloaded_count} 个文件，但未找到字幕文件", "WARN")
@@ -1026,12 +1258,10 @@ class DownloadController(BaseController):
             if html_report.exists():
                 self._log(f"HTML报告: {html_report}", "SUCCESS")
             
-            print(f"[DownloadController] ✓ 下载结果验证完成")
+            _dbg(f"[DownloadController] ✓ 下载结果验证完成")
             
         except Exception as e:
-            print(f"[DownloadController] ✗ 验证下载结果失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] ✗ 验证下载结果失败: %s", e)
             self._log(f"验证下载结果失败: {e}", "WARN")
     
     def _check_cookie_expiration(self, run_path: Path, result: dict):
@@ -1043,74 +1273,57 @@ class DownloadController(BaseController):
             result: 下载结果
         """
         try:
-            detected = False
-            # 1. 检查 failed_items 中的错误信息
+            # 1. 检查 failed_items 中的错误信息（是否包含Cookie相关关键词）
             failed_items = result.get("failed_items", [])
-            if failed_items:
-                for item in failed_items:
-                    error = item.get("error", "")
-                    error_msg = item.get("error_msg", "")
-                    status = item.get("status", "")
-                    
-                    # 检查错误消息中是否包含Cookie相关关键词
-                    error_text = f"{error} {error_msg} {status}".lower()
-                    if any(keyword in error_text for keyword in ["sign in", "cookie", "bot", "authentication", "expired", "invalid"]):
-                        detected = True
-                        break
-            if detected:
-                self._log("⚠️ Cookie 失效或已过期！", "ERROR")
-                self._log("请前往【高级设置】→【网络设置】→【Cookie文件】更新有效的Cookie文件", "WARN")
-                self._log("提示：Cookie文件通常需要定期更新，建议使用浏览器扩展（如Get cookies.txt）导出最新Cookie", "INFO")
+            if any(
+                _COOKIE_EXPIRE_RE.search(f"{item.get('error', '')} {item.get('error_msg', '')} {item.get('status', '')}")
+                for item in failed_items
+            ):
+                self._log_cookie_expired()
                 return
             
             # 2. 检查 errors.txt 文件
             errors_file = run_path / "errors.txt"
             if errors_file.exists():
                 try:
-                    error_content = errors_file.read_text(encoding='utf-8', errors='ignore').lower()
-                    if any(keyword in error_content for keyword in ["sign in", "cookie", "bot", "authentication", "expired", "invalid"]):
-                        self._log("⚠️ Cookie 失效或已过期！", "ERROR")
-                        self._log("请前往【高级设置】→【网络设置】→【Cookie文件】更新有效的Cookie文件", "WARN")
-                        self._log("提示：Cookie文件通常需要定期更新，建议使用浏览器扩展（如Get cookies.txt）导出最新Cookie", "INFO")
+                    if _file_contains(errors_file, _COOKIE_EXPIRE_RE_B):
+                        self._log_cookie_expired()
                         return
                 except Exception as e:
-                    print(f"[DownloadController] 读取errors.txt失败: {e}")
+                    _dbg(f"[DownloadController] 读取errors.txt失败: {e}")
             
             # 3. 检查 history.jsonl 中的错误记录
             history_file = run_path / "history.jsonl"
             if history_file.exists():
                 try:
-                    for line in history_file.read_text(encoding='utf-8', errors='ignore').splitlines():
-                        if not line.strip():
-                            continue
-                        try:
-                            import json
-                            record = json.loads(line)
-                            error_msg = record.get("error_msg", "") or record.get("api_err", "") or record.get("status", "")
-                            if error_msg:
-                                error_text = error_msg.lower()
-                                if any(keyword in error_text for keyword in ["sign in", "cookie", "bot", "authentication", "expired", "invalid"]):
-                                    self._log("⚠️ Cookie 失效或已过期！", "ERROR")
-                                    self._log("请前往【高级设置】→【网络设置】→【Cookie文件】更新有效的Cookie文件", "WARN")
-                                    self._log("提示：Cookie文件通常需要定期更新，建议使用浏览器扩展（如Get cookies.txt）导出最新Cookie", "INFO")
+                    # 逐行读取，命中即返回，无需将整个文件读入内存
+                    with open(history_file, 'r', encoding='utf-8', errors='ignore') as f:
+                        for line in f:
+                            # 原始行不含任何关键词时，解析后的字段也不可能命中，跳过 JSON 解析
+                            if not _COOKIE_EXPIRE_RE.search(line):
+                                continue
+                            try:
+                                record = json.loads(line)
+                                error_msg = record.get("error_msg", "") or record.get("api_err", "") or record.get("status", "")
+                                if error_msg and _COOKIE_EXPIRE_RE.search(error_msg):
+                                    self._log_cookie_expired()
                                     return
-                        except (json.JSONDecodeError, KeyError):
-                            continue
+                            except (json.JSONDecodeError, KeyError):
+                                continue
                 except Exception as e:
-                    print(f"[DownloadController] 读取history.jsonl失败: {e}")
+                    _dbg(f"[DownloadController] 读取history.jsonl失败: {e}")
 
             # 4. 检查 diagnose.txt 中的建议
             diagnose_file = run_path / "diagnose.txt"
             if diagnose_file.exists():
                 try:
-                    diag_text = diagnose_file.read_text(encoding='utf-8', errors='ignore').lower()
-                    if "cookie" in diag_text:
+                    if _file_contains(diagnose_file, _COOKIE_RE_B):
                         self._log("⚠️ Cookie 失效或已过期（诊断报告提示）", "ERROR")
                         self._log("请更新Cookie文件或重新从浏览器导出有效的Cookie", "WARN")
                         self._log("提示：使用浏览器扩展（如Get cookies.txt）导出最新的 YouTube Cookie", "INFO")
                         return
                 except Exception as e:
-                    print(f"[DownloadController] 读取diagnose.txt失败: {e}")
+                    _dbg(f"[DownloadController] 读取diagnose.txt失败: {e}")
 
             # 5. 回退：根据统计推断（downloaded=0 且存在失败项）
             if result.get("downloaded", 0) == 0 and result.get("total", 0) > 0 and failed_items:
@@ -1118,26 +1331,13 @@ class DownloadController(BaseController):
                 self._log("提示：请更新 Cookie 文件后重试，或使用浏览器导出最新 Cookie", "INFO")
                     
         except Exception as e:
-            print(f"[DownloadController] Cookie失效检测失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] Cookie失效检测失败: %s", e)
     
-    def _format_file_size(self, size_bytes: int) -> str:
-        """
-        格式化文件大小
-        
-        Args:
-            size_bytes: 文件大小（字节）
-        
-        Returns:
-            格式化后的文件大小字符串
-        """
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        else:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
+    def _log_cookie_expired(self):
+        """输出Cookie失效提示"""
+        self._log("⚠️ Cookie 失效或已过期！", "ERROR")
+        self._log("请前往【高级设置】→【网络设置】→【Cookie文件】更新有效的Cookie文件", "WARN")
+        self._log("提示：Cookie文件通常需要定期更新，建议使用浏览器扩展（如Get cookies.txt）导出最新Cookie", "INFO")
     
     def stop_download(self):
         """停止下载"""
@@ -1206,10 +1406,36 @@ class DownloadController(BaseController):
         )
         
         if success:
+            self._schedule_progress_drain()
             self._log("开始重试失败项")
         else:
             self.view.show_error("已有任务正在运行")
     
+    def _url_statistics(self, urls: list[str]) -> dict:
+        """
+        批量验证URL并统计（URL列表未变化时直接返回上次结果）
+        
+        Args:
+            urls: URL列表
+        
+        Returns:
+            BatchURLManager.validate_and_statistics 的结果
+        """
+        from utils.batch_url_manager import BatchURLManager
+        
+        key = tuple(urls)
+        cache = self._url_stats_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        result = BatchURLManager.validate_and_statistics(urls)
+        self._url_stats_cache = (key, result)
+        return result
+    
+    def _read_url_list(self) -> list[str]:
+        """读取URL输入框中的非空行（已去除首尾空白）"""
+        raw = self.view.txt_urls.get("1.0", "end-1c")
+        return [line for line in map(str.strip, raw.splitlines()) if line]
+    
     def import_urls(self):
         """
         导入URL文件（支持txt/csv/json）
@@ -1221,7 +1447,6 @@ class DownloadController(BaseController):
         """
         try:
             from tkinter import filedialog
-            from pathlib import Path
             from utils.batch_url_manager import BatchURLManager
             
             # 选择文件
@@ -1256,13 +1481,13 @@ class DownloadController(BaseController):
                 return
             
             # 获取当前URL列表
-            current_text = self.view.txt_urls.get("1.0", "end-1c").strip()
-            current_urls = [line.strip() for line in current_text.split("\n") if line.strip()]
+            current_urls = self._read_url_list()
             
-            # 合并URL（去重）
-            all_urls = current_urls + result["urls"]
-            unique_result = BatchURLManager.remove_duplicates(all_urls)
-            final_urls = unique_result["unique_urls"]
+            # 合并URL（去重，规则与 BatchURLManager.remove_duplicates 一致：忽略大小写和末尾斜杠，保留首次出现）
+            merged = {}
+            for url in chain(current_urls, result["urls"]):
+                merged.setdefault(url.strip().rstrip('/').lower(), url)
+            final_urls = list(merged.values())
             
             # 更新UI
             self.view.txt_urls.delete("1.0", "end")
@@ -1270,7 +1495,7 @@ class DownloadController(BaseController):
             
             # 显示导入结果
             imported_count = result["valid"]
-            duplicate_count = unique_result["duplicate_count"]
+            duplicate_count = len(current_urls) + len(result["urls"]) - len(final_urls)
             invalid_count = result["invalid"]
             
             msg_parts = [f"成功导入 {imported_count} 个URL"]
@@ -1283,29 +1508,23 @@ class DownloadController(BaseController):
             self.view.show_info("\n".join(msg_parts))
             
         except Exception as e:
-            print(f"[DownloadController] 导入URL失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] 导入URL失败: %s", e)
             self._log(f"导入URL失败: {e}", "ERROR")
             self.view.show_error(f"导入URL失败: {e}")
     
     def clean_invalid_urls(self):
         """清理无效URL"""
         try:
-            from utils.batch_url_manager import BatchURLManager
-            
             # 获取当前URL列表
-            urls_text = self.view.txt_urls.get("1.0", "end-1c").strip()
-            if not urls_text:
+            urls = self._read_url_list()
+            if not urls:
                 self.view.show_info("没有URL需要清理")
                 return
             
-            urls = [line.strip() for line in urls_text.split("\n") if line.strip()]
-            
-            # 清理无效URL
-            result = BatchURLManager.clean_invalid_urls(urls)
+            # 清理无效URL（复用验证统计结果）
+            result = self._url_statistics(urls)
             
-            if result["removed_count"] == 0:
+            if result["invalid"] == 0:
                 self.view.show_info("所有URL都是有效的")
                 self._log("URL验证完成，所有URL有效", "SUCCESS")
                 return
@@ -1315,16 +1534,14 @@ class DownloadController(BaseController):
             self.view.txt_urls.insert("1.0", "\n".join(result["valid_urls"]))
             
             # 显示清理结果
-            removed_count = result["removed_count"]
-            remaining_count = len(result["valid_urls"])
+            removed_count = result["invalid"]
+            remaining_count = result["valid"]
             
             self._log(f"清理完成: 移除了 {removed_count} 个无效URL，剩余 {remaining_count} 个有效URL", "SUCCESS")
             self.view.show_info(f"清理完成:\n移除了 {removed_count} 个无效URL\n剩余 {remaining_count} 个有效URL")
             
         except Exception as e:
-            print(f"[DownloadController] 清理无效URL失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] 清理无效URL失败: %s", e)
             self._log(f"清理无效URL失败: {e}", "ERROR")
             self.view.show_error(f"清理无效URL失败: {e}")
     
@@ -1334,13 +1551,11 @@ class DownloadController(BaseController):
             from utils.batch_url_manager import BatchURLManager
             
             # 获取当前URL列表
-            urls_text = self.view.txt_urls.get("1.0", "end-1c").strip()
-            if not urls_text:
+            urls = self._read_url_list()
+            if not urls:
                 self.view.show_info("没有URL需要去重")
                 return
             
-            urls = [line.strip() for line in urls_text.split("\n") if line.strip()]
-            
             # 移除重复
             result = BatchURLManager.remove_duplicates(urls)
             
@@ -1361,27 +1576,21 @@ class DownloadController(BaseController):
             self.view.show_info(f"去重完成:\n移除了 {duplicate_count} 个重复URL\n剩余 {remaining_count} 个唯一URL")
             
         except Exception as e:
-            print(f"[DownloadController] 移除重复URL失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] 移除重复URL失败: %s", e)
             self._log(f"移除重复URL失败: {e}", "ERROR")
             self.view.show_error(f"移除重复URL失败: {e}")
     
     def validate_urls(self):
         """验证URL并显示统计信息"""
         try:
-            from utils.batch_url_manager import BatchURLManager
-            
             # 获取当前URL列表
-            urls_text = self.view.txt_urls.get("1.0", "end-1c").strip()
-            if not urls_text:
+            urls = self._read_url_list()
+            if not urls:
                 self.view.show_info("没有URL需要验证")
                 return
             
-            urls = [line.strip() for line in urls_text.split("\n") if line.strip()]
-            
             # 验证并统计
-            result = BatchURLManager.validate_and_statistics(urls)
+            result = self._url_statistics(urls)
             
             # 显示统计信息
             stats_msg = f"URL验证统计:\n"
@@ -1391,7 +1600,7 @@ class DownloadController(BaseController):
             
             if result["statistics"]:
                 stats_msg += f"\n\n按域名统计:"
-                for domain, count in sorted(result["statistics"].items(), key=lambda x: x[1], reverse=True)[:5]:
+                for domain, count in heapq.nlargest(5, result["statistics"].items(), key=itemgetter(1)):
                     stats_msg += f"\n  {domain}: {count}"
             
             self._log(stats_msg, "INFO")
@@ -1405,9 +1614,7 @@ class DownloadController(BaseController):
                 self._log(invalid_msg, "WARN")
             
         except Exception as e:
-            print(f"[DownloadController] 验证URL失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DownloadController] 验证URL失败: %s", e)
             self._log(f"验证URL失败: {e}", "ERROR")
             self.view.show_error(f"验证URL失败: {e}")
     
@@ -1419,7 +1626,6 @@ class DownloadController(BaseController):
         
         try:
             from tkinter import filedialog
-            from pathlib import Path
             
             # 选择保存位置
             file_path = filedialog.asksaveasfilename(
@@ -1443,7 +1649,7 @@ class DownloadController(BaseController):
                 self._log(f"错误日志已导出到: {exported_path}", "SUCCESS")
                 self.view.show_info(f"错误日志已导出到:\n{exported_path}")
         except Exception as e:
-            print(f"[DownloadController] 导出错误日志失败: {e}")
+            _dbg(f"[DownloadController] 导出错误日志失败: {e}")
             self._log(f"导出错误日志失败: {e}", "ERROR")
             self.view.show_error(f"导出错误日志失败: {e}")
     
@@ -1457,7 +1663,7 @@ class DownloadController(BaseController):
         """清空URL"""
         self.view.clear_urls()
         # 清除错误高亮
-        self.view.txt_urls.config(highlightthickness=0)
+        self._set_url_error_highlight(False)
         self._log("已清空链接输入框", "INFO")
     
     def _on_theme_changed(self, event: Event):
@@ -1469,6 +1675,16 @@ class DownloadController(BaseController):
         """
         theme = event.data.get("theme")
         self.view.update_theme(theme)
+    
+    def cleanup(self):
+        """清理资源：停止进度队列轮询"""
+        if self._progress_drain_job is not None:
+            try:
+                self.view.after_cancel(self._progress_drain_job)
+            except (RuntimeError, TclError):
+                pass
+            self._progress_drain_job = None
+        self._discard_queued_progress()
 
 
 __all__ = ['DownloadController']
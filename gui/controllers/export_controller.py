@@ -2,15 +2,169 @@
 """
 导出控制器 - 处理导出操作
 """
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
-from tkinter import filedialog, messagebox, ttk
+from typing import TYPE_CHECKING, Callable, Iterable, List, Dict
+from tkinter import messagebox
 import tkinter as tk
-from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
+from time import monotonic
 from gui.controllers.base_controller import BaseController
 from events.event_bus import EventType, Event
-from services.export_service import ExportService
-from history_manager import HistoryManager
+
+# 历史记录、导出服务、文件对话框、ttk 均在首次使用时才导入，缩短 GUI 启动时的导入链
+if TYPE_CHECKING:
+    from services.export_service import ExportService
+    from history_manager import HistoryManager
+
+# 导出取消/进度事件（旧版事件总线可能未定义，缺失时不订阅也不发布）
+_EXPORT_CANCEL = getattr(EventType, 'EXPORT_CANCEL', None)
+_EXPORT_PROGRESS = getattr(EventType, 'EXPORT_PROGRESS', None)
+
+# 导出线程池：文件写入在后台线程执行，避免阻塞 Tk 事件循环
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+
+# 历史查询结果缓存：最多保留的查询数、有效期（秒）
+_HISTORY_CACHE_MAX = 16
+_HISTORY_CACHE_TTL_S = 5.0
+
+# 历史统计信息缓存有效期（秒）
+_STATS_CACHE_TTL_S = 30.0
+
+# 历史表格每次追加加载的行数
+_HISTORY_PAGE_SIZE = 50
+
+# 历史记录每页从存储层读取的条数（翻页时按 offset 读取下一页）
+_HISTORY_QUERY_PAGE = 100
+
+# 导出格式 -> 文件扩展名
+_FMT_TO_EXT = {
+    "excel": "xlsx",
+    "csv": "csv",
+    "json": "json",
+    "md": "md",
+    "markdown": "md",
+    "txt": "txt"
+}
+
+# 保存对话框的文件类型（数据导出 / 日志导出）
+_EXPORT_FILETYPES = (
+    ("Excel files", "*.xlsx"),
+    ("CSV files", "*.csv"),
+    ("JSON files", "*.json"),
+    ("Markdown files", "*.md"),
+    ("All files", "*.*")
+)
+_LOG_FILETYPES = (
+    ("Text files", "*.txt"),
+    ("Markdown files", "*.md"),
+    ("All files", "*.*")
+)
+
+# 历史记录行字段及其缺省值（字段齐全时用 itemgetter 一次取出）
+_ROW_FIELDS = ('status', 'ts', 'title', 'channel', 'langs', 'run_dir')
+_ROW_DEFAULTS = ('', '', '', '', [], '')
+_get_row_fields = itemgetter(*_ROW_FIELDS)
+
+# 历史记录状态显示文本
+_STATUS_TEXT = {
+    "ok": "✅ 成功",
+    "error": "❌ 失败",
+    "no_subs": "⚠️ 无字幕",
+    "skipped": "⏭️ 跳过"
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_ts(ts: str) -> str:
+    """格式化ISO时间戳用于显示（解析失败时截取前19个字符，相同时间戳的结果缓存）"""
+    if not ts:
+        return "-"
+    from datetime import datetime
+    try:
+        return datetime.fromisoformat(ts[:-1] + '+00:00' if ts.endswith('Z') else ts).strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return ts[:19]
+
+
+def _truncate(text: str, limit: int) -> str:
+    """超出长度的文本截断并加省略号"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _history_row(record: Dict) -> tuple:
+    """
+    将一条历史记录格式化为表格行
+    
+    Args:
+        record: 历史记录
+    
+    Returns:
+        (时间, 标题, 频道, 状态, 语言, 运行目录)
+    """
+    try:
+        rec_status, ts, title, channel, langs, run_dir = _get_row_fields(record)
+    except KeyError:
+        rec_status, ts, title, channel, langs, run_dir = (
+            record.get(key, default) for key, default in zip(_ROW_FIELDS, _ROW_DEFAULTS)
+        )
+    
+    return (
+        _format_ts(ts),
+        _truncate(title, 50),
+        _truncate(channel, 30),
+        _STATUS_TEXT.get(rec_status, rec_status),
+        ", ".join(langs),
+        run_dir
+    )
+
+
+class ExportCancelled(Exception):
+    """导出被用户取消"""
+
+
+def _export_segments(func: Callable[..., Path], items_key: str, items: List[Dict],
+                     segment_size: int, output_path: Path,
+                     cancel_event: threading.Event | None = None,
+                     progress: list | None = None, **kwargs) -> List[Path]:
+    """
+    分段导出：每段写入单独的文件（<名称>_part01.xlsx, <名称>_part02.xlsx, ...）
+    
+    每次只把一段数据交给导出函数，降低峰值内存，已完成的分段可以先行使用
+    
+    Args:
+        func: 服务层导出函数
+        items_key: 数据在导出函数中的参数名（如 "jobs"）
+        items: 全部数据
+        segment_size: 每段行数
+        output_path: 用户选择的输出路径
+        cancel_event: 取消标志，每段开始前检查
+        progress: [已完成段数, 总段数]，由本函数更新、主线程轮询读取
+        **kwargs: 传给导出函数的其他参数
+    
+    Returns:
+        各分段的输出路径
+    
+    Raises:
+        ExportCancelled: 导出被取消（已写完的分段文件保留）
+    """
+    stem, suffix = output_path.stem, output_path.suffix
+    total = -(-len(items) // segment_size)
+    if progress is not None:
+        progress[:] = [0, total]
+    paths = []
+    for idx, start in enumerate(range(0, len(items), segment_size), 1):
+        if cancel_event is not None and cancel_event.is_set():
+            raise ExportCancelled(f"已完成 {idx - 1}/{total} 段")
+        part_path = output_path.with_name(f"{stem}_part{idx:02d}{suffix}")
+        paths.append(func(**{items_key: items[start:start + segment_size]}, output_path=part_path, **kwargs))
+        if progress is not None:
+            progress[0] = idx
+    return paths
 
 
 class ExportController(BaseController):
@@ -23,163 +177,359 @@ class ExportController(BaseController):
     3. 发布事件通知其他模块
     """
     
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, root_window=None):
         """
         初始化
         
         Args:
             config: 全局配置
+            root_window: 根窗口（用于在主线程中处理导出结果），为None时使用默认根窗口
         """
         self.config = config
-        self.service = ExportService()
+        self.root_window = root_window
+        self._service: ExportService | None = None  # 首次导出时创建
+        self._exports_running: set[str] = set()  # 正在后台执行的导出类型（防止重复触发）
+        self._export_cancels: dict[str, threading.Event] = {}  # 导出类型 -> 取消标志
+        # 历史查询缓存：(输出目录, 关键词, 状态, 页码) -> (查询时间, 记录列表)
+        self._history_cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+        self._pending_refresh = None  # 历史对话框延迟刷新的定时器
+        self._history_page = 0  # 历史对话框当前页码（从0开始）
+        # 历史统计缓存：(生成时间, 输出目录, 统计文本)
+        self._stats_cache: tuple[float, str, str] | None = None
+        self._history_dialog = None  # 历史记录对话框（关闭时隐藏，再次打开时复用）
         super().__init__()
     
+    @property
+    def service(self) -> ExportService:
+        """导出服务（延迟创建）"""
+        if self._service is None:
+            from services.export_service import ExportService
+            self._service = ExportService()
+        return self._service
+    
     def _setup_event_listeners(self):
         """设置事件监听"""
-        # 导出功能主要通过其他控制器的按钮调用，不需要监听事件
-        pass
+        # 导出功能主要通过其他控制器的按钮调用；下载结束后历史记录会变化，需清空查询缓存
+        self.event_bus.subscribe(EventType.DOWNLOAD_COMPLETED, self._invalidate_history_cache)
+        self.event_bus.subscribe(EventType.DOWNLOAD_FAILED, self._invalidate_history_cache)
+        if _EXPORT_CANCEL is not None:
+            self.event_bus.subscribe(_EXPORT_CANCEL, self._on_export_cancel)
+    
+    def _on_export_cancel(self, event: Event):
+        """取消导出：data 中指定 type 时只取消该类型，否则取消全部正在进行的导出"""
+        export_type = event.data.get("type") if event.data else None
+        for key, cancel_event in self._export_cancels.items():
+            if export_type is None or key == export_type:
+                cancel_event.set()
+    
+    def _invalidate_history_cache(self, event: Event = None):
+        """清空历史查询缓存和统计缓存"""
+        self._history_cache.clear()
+        self._stats_cache = None
+    
+    def _query_history(self, history_mgr: HistoryManager, out_root: str, keyword: str,
+                       status_filter: str | None, page: int = 0) -> list:
+        """
+        查询一页历史记录（相同查询在有效期内直接返回缓存结果）
+        
+        Args:
+            history_mgr: 历史记录管理器
+            out_root: 输出目录（缓存键的一部分）
+            keyword: 搜索关键词（为空时按状态过滤）
+            status_filter: 状态过滤（None 表示全部）
+            page: 页码（从0开始，每页 _HISTORY_QUERY_PAGE 条）
+        
+        Returns:
+            历史记录列表
+        """
+        key = (out_root, keyword, status_filter, page)
+        cached = self._history_cache.get(key)
+        now = monotonic()
+        if cached is not None and now - cached[0] < _HISTORY_CACHE_TTL_S:
+            self._history_cache.move_to_end(key)
+            return cached[1]
+        
+        offset = page * _HISTORY_QUERY_PAGE
+        if keyword:
+            query = partial(history_mgr.search_history, keyword)
+        else:
+            query = partial(history_mgr.get_all_history, status_filter=status_filter)
+        try:
+            records = query(limit=_HISTORY_QUERY_PAGE, offset=offset)
+        except TypeError:
+            # 历史存储不支持 offset：读取到本页末尾为止的记录，在本地截取本页
+            records = query(limit=offset + _HISTORY_QUERY_PAGE)[offset:]
+        
+        self._history_cache[key] = (now, records)
+        self._history_cache.move_to_end(key)
+        while len(self._history_cache) > _HISTORY_CACHE_MAX:
+            self._history_cache.popitem(last=False)
+        return records
+    
+    def _get_root(self):
+        """获取根窗口"""
+        return self.root_window if self.root_window is not None else tk._default_root
     
-    def export_scheduler_jobs(self, jobs: List[Dict], format: str = "excel"):
+    def _run_export(self, export_type: str, label: str, export_func: Callable,
+                    track_progress: bool = False, **kwargs):
+        """
+        在后台线程执行导出，完成后回到主线程处理结果
+        
+        Args:
+            export_type: 导出类型（事件中的 type 字段）
+            label: 导出内容名称（用于提示信息）
+            export_func: 导出函数（返回输出路径，分段导出时返回路径列表）
+            track_progress: 是否向导出函数传入 cancel_event/progress（分段导出），
+                以支持进度事件和取消
+            **kwargs: 传给导出函数的参数
+        """
+        if self._export_busy(export_type, label):
+            return
+        
+        progress = None
+        if track_progress:
+            progress = [0, 0]
+            cancel_event = threading.Event()
+            self._export_cancels[export_type] = cancel_event
+            kwargs.update(cancel_event=cancel_event, progress=progress)
+        
+        self._exports_running.add(export_type)
+        future = _executor.submit(export_func, **kwargs)
+        root = self._get_root()
+        if root is None:
+            # 没有事件循环可用，直接等待结果
+            future.exception()
+            self._on_export_done(future, export_type, label)
+        else:
+            self._poll_export(root, future, export_type, label, progress)
+    
+    def _export_busy(self, export_type: str, label: str) -> bool:
+        """同类型导出仍在后台执行时提示并返回True（在弹出保存对话框之前检查）"""
+        if export_type in self._exports_running:
+            self._log(f"{label}正在导出，请稍候", "WARN")
+            return True
+        return False
+    
+    def _poll_export(self, root, future: Future, export_type: str, label: str,
+                     progress: list | None = None, reported: tuple = (0, 0)):
+        """在主线程中轮询导出任务，进度变化时发布进度事件，完成后处理结果（Tk 调用始终留在主线程）"""
+        if progress is not None and _EXPORT_PROGRESS is not None:
+            current = tuple(progress)
+            if current != reported:
+                reported = current
+                self.event_bus.publish(Event(
+                    _EXPORT_PROGRESS,
+                    {"type": export_type, "i": current[0], "n": current[1]}
+                ))
+        
+        if future.done():
+            self._on_export_done(future, export_type, label)
+        else:
+            root.after(100, self._poll_export, root, future, export_type, label, progress, reported)
+    
+    def _on_export_done(self, future: Future, export_type: str, label: str):
+        """
+        导出完成处理：发布事件、记录日志、弹出提示
+        
+        Args:
+            future: 导出任务
+            export_type: 导出类型
+            label: 导出内容名称
+        """
+        self._exports_running.discard(export_type)
+        self._export_cancels.pop(export_type, None)
+        try:
+            output_path = future.result()
+        except ExportCancelled as e:
+            self._log(f"{label}导出已取消（{e}）", "WARN")
+            self.event_bus.publish(Event(
+                EventType.EXPORT_FAILED,
+                {"type": export_type, "reason": "cancelled"}
+            ))
+            return
+        except Exception as e:
+            self._report_export_failure(export_type, label, e)
+            return
+        
+        if isinstance(output_path, list):
+            # 分段导出：每段发布一个完成事件
+            total = len(output_path)
+            for idx, part_path in enumerate(output_path, 1):
+                self.event_bus.publish(Event(
+                    EventType.EXPORT_COMPLETED,
+                    {"type": export_type, "path": str(part_path), "part": idx, "total": total}
+                ))
+            self._log(f"{label}已分 {total} 段导出: {output_path[0].parent}", "SUCCESS")
+            messagebox.showinfo("导出成功", f"{label}已分 {total} 段导出到:\n{output_path[0].parent}")
+            return
+        
+        # 发布事件
+        self.event_bus.publish(Event(
+            EventType.EXPORT_COMPLETED,
+            {"type": export_type, "path": str(output_path)}
+        ))
+        
+        self._log(f"{label}已导出: {output_path}", "SUCCESS")
+        messagebox.showinfo("导出成功", f"{label}已导出到:\n{output_path}")
+    
+    def _report_export_failure(self, export_type: str, label: str, error: Exception):
+        """记录导出失败、提示用户并发布失败事件"""
+        self._log(f"导出失败: {error}", "ERROR")
+        messagebox.showerror("导出失败", f"导出{label}时出错:\n{error}")
+        self.event_bus.publish(Event(
+            EventType.EXPORT_FAILED,
+            {"type": export_type, "reason": str(error)}
+        ))
+    
+    def _ask_save(self, fmt: str, base: str, log: bool = False) -> str:
+        """
+        弹出保存对话框
+        
+        Args:
+            fmt: 导出格式
+            base: 默认文件名（不含扩展名）
+            log: 是否为日志导出（决定可选的文件类型）
+        
+        Returns:
+            用户选择的路径，取消时为空字符串
+        
+        Raises:
+            ValueError: 不支持的导出格式（在打开对话框之前检查）
+        """
+        ext = _FMT_TO_EXT.get(fmt)
+        if ext is None:
+            raise ValueError(f"不支持的导出格式: {fmt}")
+        
+        from tkinter import filedialog
+        return filedialog.asksaveasfilename(
+            defaultextension=f".{ext}",
+            filetypes=_LOG_FILETYPES if log else _EXPORT_FILETYPES,
+            initialfile=f"{base}.{ext}"
+        )
+    
+    def _export_segment_size(self, segment_size: int | None) -> int | None:
+        """获取分段大小：未指定时读取配置 export.segment_size（None 表示不分段）"""
+        if segment_size is None:
+            segment_size = self.config.get("export", {}).get("segment_size")
+        return segment_size if segment_size and segment_size > 0 else None
+    
+    def export_scheduler_jobs(self, jobs: List[Dict], format: str = "excel", segment_size: int | None = None):
         """
         导出调度任务
         
         Args:
             jobs: 任务列表
             format: 导出格式
+            segment_size: 分段大小（每个文件的最大行数），None 表示读取配置，未配置则导出为单个文件
         """
+        if self._export_busy("scheduler_jobs", "调度任务"):
+            return
+        
+        # 选择保存位置
+        file_path = self._ask_save(format, "scheduler_jobs")
+        
+        if not file_path:
+            return
+        
+        # 执行导出（后台线程，完成后由 _on_export_done 处理结果）
+        segment_size = self._export_segment_size(segment_size)
         try:
-            # 选择保存位置
-            filename = f"scheduler_jobs.{format if format != 'excel' else 'xlsx'}"
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=f".{format if format != 'excel' else 'xlsx'}",
-                filetypes=[
-                    ("Excel files", "*.xlsx"),
-                    ("CSV files", "*.csv"),
-                    ("JSON files", "*.json"),
-                    ("Markdown files", "*.md"),
-                    ("All files", "*.*")
-                ],
-                initialfile=filename
-            )
-            
-            if not file_path:
-                return
-            
-            # 执行导出
-            output_path = self.service.export_scheduler_jobs(
-                jobs=jobs,
-                format=format,
-                output_path=Path(file_path)
-            )
-            
-            # 发布事件
-            self.event_bus.publish(Event(
-                EventType.EXPORT_COMPLETED,
-                {"type": "scheduler_jobs", "path": str(output_path)}
-            ))
-            
-            self._log(f"调度任务已导出: {output_path}", "SUCCESS")
-            messagebox.showinfo("导出成功", f"调度任务已导出到:\n{output_path}")
-            
+            if segment_size and len(jobs) > segment_size:
+                self._run_export(
+                    "scheduler_jobs", "调度任务", _export_segments,
+                    track_progress=True,
+                    func=self.service.export_scheduler_jobs,
+                    items_key="jobs",
+                    items=jobs,
+                    segment_size=segment_size,
+                    output_path=Path(file_path),
+                    format=format
+                )
+            else:
+                self._run_export(
+                    "scheduler_jobs", "调度任务", self.service.export_scheduler_jobs,
+                    jobs=jobs,
+                    format=format,
+                    output_path=Path(file_path)
+                )
         except Exception as e:
-            self._log(f"导出失败: {e}", "ERROR")
-            messagebox.showerror("导出失败", f"导出调度任务时出错:\n{e}")
-            self.event_bus.publish(Event(
-                EventType.EXPORT_FAILED,
-                {"type": "scheduler_jobs", "reason": str(e)}
-            ))
+            self._report_export_failure("scheduler_jobs", "调度任务", e)
     
-    def export_subscriptions(self, subscriptions: List[Dict], format: str = "excel"):
+    def export_subscriptions(self, subscriptions: List[Dict], format: str = "excel", segment_size: int | None = None):
         """
         导出订阅列表
         
         Args:
             subscriptions: 订阅列表
             format: 导出格式
+            segment_size: 分段大小（每个文件的最大行数），None 表示读取配置，未配置则导出为单个文件
         """
+        if self._export_busy("subscriptions", "订阅列表"):
+            return
+        
+        file_path = self._ask_save(format, "subscriptions")
+        
+        if not file_path:
+            return
+        
+        segment_size = self._export_segment_size(segment_size)
         try:
-            filename = f"subscriptions.{format if format != 'excel' else 'xlsx'}"
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=f".{format if format != 'excel' else 'xlsx'}",
-                filetypes=[
-                    ("Excel files", "*.xlsx"),
-                    ("CSV files", "*.csv"),
-                    ("JSON files", "*.json"),
-                    ("Markdown files", "*.md"),
-                    ("All files", "*.*")
-                ],
-                initialfile=filename
-            )
-            
-            if not file_path:
-                return
-            
-            output_path = self.service.export_subscriptions(
-                subscriptions=subscriptions,
-                format=format,
-                output_path=Path(file_path)
-            )
-            
-            self.event_bus.publish(Event(
-                EventType.EXPORT_COMPLETED,
-                {"type": "subscriptions", "path": str(output_path)}
-            ))
-            
-            self._log(f"订阅列表已导出: {output_path}", "SUCCESS")
-            messagebox.showinfo("导出成功", f"订阅列表已导出到:\n{output_path}")
-            
+            if segment_size and len(subscriptions) > segment_size:
+                self._run_export(
+                    "subscriptions", "订阅列表", _export_segments,
+                    track_progress=True,
+                    func=self.service.export_subscriptions,
+                    items_key="subscriptions",
+                    items=subscriptions,
+                    segment_size=segment_size,
+                    output_path=Path(file_path),
+                    format=format
+                )
+            else:
+                self._run_export(
+                    "subscriptions", "订阅列表", self.service.export_subscriptions,
+                    subscriptions=subscriptions,
+                    format=format,
+                    output_path=Path(file_path)
+                )
         except Exception as e:
-            self._log(f"导出失败: {e}", "ERROR")
-            messagebox.showerror("导出失败", f"导出订阅列表时出错:\n{e}")
-            self.event_bus.publish(Event(
-                EventType.EXPORT_FAILED,
-                {"type": "subscriptions", "reason": str(e)}
-            ))
+            self._report_export_failure("subscriptions", "订阅列表", e)
     
-    def export_logs(self, log_content: str, format: str = "txt"):
+    def export_logs(self, log_content: str | Iterable[str], format: str = "txt"):
         """
         导出日志内容
         
         Args:
-            log_content: 日志文本内容
+            log_content: 日志文本内容；也可以是文本块的可迭代对象（如
+                text.get('1.0', 'end').splitlines(keepends=True)），txt 格式逐块写入文件，
+                其他格式拼接后按文本导出。可迭代对象在后台线程中被消费，不能直接读取 Tk 控件
             format: 导出格式
         """
+        if self._export_busy("logs", "日志"):
+            return
+        
+        file_path = self._ask_save(format, "logs", log=True)
+        
+        if not file_path:
+            return
+        
         try:
-            filename = f"logs.{format}"
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=f".{format}",
-                filetypes=[
-                    ("Text files", "*.txt"),
-                    ("Markdown files", "*.md"),
-                    ("All files", "*.*")
-                ],
-                initialfile=filename
-            )
-            
-            if not file_path:
-                return
-            
-            output_path = self.service.export_logs(
-                log_content=log_content,
-                format=format,
-                output_path=Path(file_path)
-            )
-            
-            self.event_bus.publish(Event(
-                EventType.EXPORT_COMPLETED,
-                {"type": "logs", "path": str(output_path)}
-            ))
-            
-            self._log(f"日志已导出: {output_path}", "SUCCESS")
-            messagebox.showinfo("导出成功", f"日志已导出到:\n{output_path}")
-            
+            if isinstance(log_content, str):
+                self._run_export(
+                    "logs", "日志", self.service.export_logs,
+                    log_content=log_content,
+                    format=format,
+                    output_path=Path(file_path)
+                )
+            else:
+                self._run_export(
+                    "logs", "日志", self.service.export_logs_stream,
+                    chunks=log_content,
+                    format=format,
+                    output_path=Path(file_path)
+                )
         except Exception as e:
-            self._log(f"导出失败: {e}", "ERROR")
-            messagebox.showerror("导出失败", f"导出日志时出错:\n{e}")
-            self.event_bus.publish(Event(
-                EventType.EXPORT_FAILED,
-                {"type": "logs", "reason": str(e)}
-            ))
+            self._report_export_failure("logs", "日志", e)
     
     def view_history(self, root_window=None):
         """
@@ -190,152 +540,235 @@ class ExportController(BaseController):
         Args:
             root_window: 根窗口（Tk实例），如果为None则尝试自动获取
         """
+        # 获取输出目录
+        out_root = self.config.get("run", {}).get("output_root", "out")
+        
+        # 已有对话框且输出目录未变：直接显示并刷新数据，不重建控件
+        if self._reuse_history_dialog(out_root):
+            return
+        
         try:
-            # 获取输出目录
-            out_root = self.config.get("run", {}).get("output_root", "out")
+            from history_manager import HistoryManager
             history_mgr = HistoryManager(out_root=out_root)
-            
-            # 获取根窗口
-            if root_window is None:
-                # 尝试从事件总线获取（如果设置了）
-                try:
-                    root_window = tk._default_root
-                    if root_window is None:
-                        # 如果仍然为None，创建一个临时窗口
-                        import tkinter as tk_temp
-                        root_window = tk_temp._default_root
-                except:
-                    pass
-            
-            if root_window is None:
-                self._log("无法获取根窗口，无法打开历史记录对话框", "ERROR")
-                messagebox.showerror("错误", "无法打开历史记录对话框：找不到根窗口")
-                return
-            
-            # 创建对话框
-            dialog = tk.Toplevel(root_window)
-            dialog.title("📜 下载历史记录")
-            dialog.geometry("1200x700")
-            dialog.transient(root_window)
-            
-            # 顶部工具栏
-            toolbar = ttk.Frame(dialog)
-            toolbar.pack(fill='x', padx=10, pady=10)
-            
-            # 搜索框
-            ttk.Label(toolbar, text="搜索:").pack(side='left', padx=(0,5))
-            search_var = tk.StringVar()
-            search_entry = ttk.Entry(toolbar, textvariable=search_var, width=30)
-            search_entry.pack(side='left', padx=(0,10))
-            
-            # 状态过滤
-            ttk.Label(toolbar, text="状态:").pack(side='left', padx=(0,5))
-            status_var = tk.StringVar(value="全部")
-            status_combo = ttk.Combobox(toolbar, textvariable=status_var, width=12, 
-                                       values=["全部", "成功", "失败", "无字幕", "跳过"], state="readonly")
-            status_combo.pack(side='left', padx=(0,10))
-            
-            # 刷新按钮
-            def refresh_history():
-                keyword = search_var.get().strip()
-                status = status_var.get()
-                
-                # 状态映射
-                status_map = {
-                    "全部": None,
-                    "成功": "ok",
-                    "失败": "error",
-                    "无字幕": "no_subs",
-                    "跳过": "skipped"
-                }
-                
-                # 获取历史记录
-                if keyword:
-                    records = history_mgr.search_history(keyword, limit=500)
-                else:
-                    records = history_mgr.get_all_history(limit=500, status_filter=status_map[status])
-                
-                # 更新表格
-                for item in table.get_children():
-                    table.delete(item)
-                
-                for record in records:
-                    status_text = {
-                        "ok": "✅ 成功",
-                        "error": "❌ 失败",
-                        "no_subs": "⚠️ 无字幕",
-                        "skipped": "⏭️ 跳过"
-                    }.get(record.get('status', ''), record.get('status', ''))
-                    
-                    ts = record.get('ts', '')
-                    if ts:
-                        try:
-                            dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                            ts_display = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except:
-                            ts_display = ts[:19] if len(ts) > 19 else ts
-                    else:
-                        ts_display = "-"
-                    
-                    title = record.get('title', '')
-                    title_display = title[:50] + "..." if len(title) > 50 else title
-                    
-                    channel = record.get('channel', '')
-                    channel_display = channel[:30] + "..." if len(channel) > 30 else channel
-                    
-                    langs = ", ".join(record.get('langs', []))
-                    
-                    table.insert("", "end", values=(
-                        ts_display,
-                        title_display,
-                        channel_display,
-                        status_text,
-                        langs,
-                        record.get('run_dir', '')
-                    ))
-            
-            ttk.Button(toolbar, text="🔄 刷新", command=refresh_history).pack(side='left', padx=(0,5))
-            ttk.Button(toolbar, text="📊 统计", command=lambda: self._show_history_stats(history_mgr)).pack(side='left')
-            
-            # 表格
-            table_frame = ttk.Frame(dialog)
-            table_frame.pack(fill='both', expand=True, padx=10, pady=(0,10))
-            
-            columns = ("时间", "标题", "频道", "状态", "语言", "运行目录")
-            table = ttk.Treeview(table_frame, columns=columns, show="headings", height=20)
-            
-            for col in columns:
-                table.heading(col, text=col)
-                table.column(col, width=150 if col == "时间" else 200 if col == "标题" else 120)
-            
-            # 滚动条
-            scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=table.yview)
-            table.configure(yscrollcommand=scrollbar.set)
-            
-            table.pack(side='left', fill='both', expand=True)
-            scrollbar.pack(side='right', fill='y')
-            
-            # 绑定搜索
-            search_entry.bind('<Return>', lambda e: refresh_history())
-            status_combo.bind('<<ComboboxSelected>>', lambda e: refresh_history())
-            
-            # 初始加载
+        except Exception as e:
+            self._report_history_error(e)
+            return
+        
+        # 获取根窗口
+        if root_window is None:
+            root_window = self._get_root()
+        
+        if root_window is None:
+            self._log("无法获取根窗口，无法打开历史记录对话框", "ERROR")
+            messagebox.showerror("错误", "无法打开历史记录对话框：找不到根窗口")
+            return
+        
+        from tkinter import ttk
+        
+        # 创建对话框
+        dialog = tk.Toplevel(root_window)
+        dialog.title("📜 下载历史记录")
+        dialog.geometry("1200x700")
+        dialog.transient(root_window)
+        dialog.out_root = out_root
+        
+        # 顶部工具栏
+        toolbar = ttk.Frame(dialog)
+        toolbar.pack(fill='x', padx=10, pady=10)
+        
+        # 搜索框
+        ttk.Label(toolbar, text="搜索:").pack(side='left', padx=(0,5))
+        search_var = tk.StringVar()
+        search_entry = ttk.Entry(toolbar, textvariable=search_var, width=30)
+        search_entry.pack(side='left', padx=(0,10))
+        
+        # 状态过滤
+        ttk.Label(toolbar, text="状态:").pack(side='left', padx=(0,5))
+        status_var = tk.StringVar(value="全部")
+        status_combo = ttk.Combobox(toolbar, textvariable=status_var, width=12, 
+                                   values=["全部", "成功", "失败", "无字幕", "跳过"], state="readonly")
+        status_combo.pack(side='left', padx=(0,10))
+        
+        # 刷新按钮
+        def refresh_history(page: int = 0):
+            nonlocal loaded_records, loaded_count
+            keyword = search_var.get().strip()
+            status = status_var.get()
+            
+            # 状态映射
+            status_map = {
+                "全部": None,
+                "成功": "ok",
+                "失败": "error",
+                "无字幕": "no_subs",
+                "跳过": "skipped"
+            }
+            
+            # 获取历史记录（仅当前页）
+            records = self._query_history(history_mgr, out_root, keyword, status_map[status], page)
+            self._history_page = page
+            prev_button.state(['!disabled'] if page > 0 else ['disabled'])
+            next_button.state(['!disabled'] if len(records) >= _HISTORY_QUERY_PAGE else ['disabled'])
+            
+            # 一次性清空表格（单次 Tcl 调用）
+            children = table.get_children()
+            if children:
+                table.delete(*children)
+            
+            # 只插入可见行及少量缓冲，其余在滚动到底部时分页加载
+            loaded_records = records
+            loaded_count = 0
+            load_more_rows(int(table.cget('height')) + _HISTORY_PAGE_SIZE)
+        
+        # 当前查询结果与已插入表格的行数（分页加载用）
+        loaded_records: list = []
+        loaded_count = 0
+        
+        def load_more_rows(count: int):
+            nonlocal loaded_count
+            end = min(loaded_count + count, len(loaded_records))
+            insert = table.insert
+            for i in range(loaded_count, end):
+                insert("", "end", values=_history_row(loaded_records[i]))
+            loaded_count = end
+        
+        def on_table_scroll(first, last):
+            scrollbar.set(first, last)
+            # 滚动到底部且还有未加载的记录时，加载下一页
+            if float(last) >= 1.0 and loaded_count < len(loaded_records):
+                load_more_rows(_HISTORY_PAGE_SIZE)
+        
+        def force_refresh():
+            # 手动刷新：跳过查询缓存，停留在当前页
+            self._invalidate_history_cache()
+            refresh_history(self._history_page)
+        
+        ttk.Button(toolbar, text="🔄 刷新", command=force_refresh).pack(side='left', padx=(0,5))
+        ttk.Button(toolbar, text="📊 统计", command=lambda: self._show_history_stats(history_mgr, out_root)).pack(side='left', padx=(0,5))
+        
+        # 翻页（每页从存储层读取 _HISTORY_QUERY_PAGE 条）
+        prev_button = ttk.Button(toolbar, text="上一页", command=lambda: refresh_history(self._history_page - 1))
+        prev_button.pack(side='left', padx=(0,5))
+        next_button = ttk.Button(toolbar, text="下一页", command=lambda: refresh_history(self._history_page + 1))
+        next_button.pack(side='left')
+        
+        # 表格
+        table_frame = ttk.Frame(dialog)
+        table_frame.pack(fill='both', expand=True, padx=10, pady=(0,10))
+        
+        columns = ("时间", "标题", "频道", "状态", "语言", "运行目录")
+        table = ttk.Treeview(table_frame, columns=columns, show="headings", height=20)
+        
+        for col in columns:
+            table.heading(col, text=col)
+            table.column(col, width=150 if col == "时间" else 200 if col == "标题" else 120)
+        
+        # 滚动条
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=table.yview)
+        table.configure(yscrollcommand=on_table_scroll)
+        
+        table.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        # 绑定搜索：输入和切换状态时延迟刷新（连续事件合并为一次查询），回车立即刷新
+        def schedule_refresh(event=None):
+            if event is not None and getattr(event, 'keysym', '') == 'Return':
+                return  # 回车已立即刷新
+            if self._pending_refresh is not None:
+                dialog.after_cancel(self._pending_refresh)
+            self._pending_refresh = dialog.after(250, run_pending_refresh)
+        
+        def run_pending_refresh():
+            self._pending_refresh = None
+            refresh_history()
+        
+        def refresh_now(event=None):
+            if self._pending_refresh is not None:
+                dialog.after_cancel(self._pending_refresh)
+                self._pending_refresh = None
+            refresh_history()
+        
+        search_entry.bind('<KeyRelease>', schedule_refresh)
+        search_entry.bind('<Return>', refresh_now)
+        status_combo.bind('<<ComboboxSelected>>', schedule_refresh)
+        
+        # 关闭时只隐藏窗口，下次打开时复用
+        def hide_dialog():
+            if self._pending_refresh is not None:
+                dialog.after_cancel(self._pending_refresh)
+                self._pending_refresh = None
+            dialog.withdraw()
+        
+        dialog.protocol('WM_DELETE_WINDOW', hide_dialog)
+        dialog.refresh = refresh_history
+        self._history_dialog = dialog
+        
+        # 初始加载
+        try:
             refresh_history()
-            
-            self._log("历史记录查看窗口已打开", "INFO")
-            
         except Exception as e:
-            self._log(f"查看历史记录失败: {e}", "ERROR")
-            messagebox.showerror("错误", f"查看历史记录时出错:\n{e}")
-            import traceback
-            traceback.print_exc()
+            self._report_history_error(e)
+            return
+        
+        self._log("历史记录查看窗口已打开", "INFO")
     
-    def _show_history_stats(self, history_mgr: HistoryManager):
-        """显示历史统计信息"""
+    def _reuse_history_dialog(self, out_root: str) -> bool:
+        """
+        复用已创建的历史记录对话框
+        
+        Args:
+            out_root: 当前输出目录
+        
+        Returns:
+            是否已复用（False 表示需要新建对话框）
+        """
+        dialog = self._history_dialog
+        if dialog is None:
+            return False
+        
         try:
-            stats = history_mgr.get_statistics()
-            
-            stats_text = f"""下载历史统计
+            exists = bool(dialog.winfo_exists())
+        except tk.TclError:
+            exists = False
+        
+        if exists and dialog.out_root == out_root:
+            dialog.deiconify()
+            dialog.lift()
+            try:
+                dialog.refresh()
+            except Exception as e:
+                self._report_history_error(e)
+            return True
+        
+        # 窗口已被销毁，或输出目录已变化（历史管理器需重建）
+        if exists:
+            dialog.destroy()
+        self._history_dialog = None
+        return False
+    
+    def _report_history_error(self, error: Exception):
+        """记录并提示历史记录查看失败"""
+        self._log(f"查看历史记录失败: {error}", "ERROR")
+        messagebox.showerror("错误", f"查看历史记录时出错:\n{error}")
+        import traceback
+        traceback.print_exc()
+    
+    def _show_history_stats(self, history_mgr: HistoryManager, out_root: str = ""):
+        """
+        显示历史统计信息（统计文本缓存，下载结束后失效）
+        
+        Args:
+            history_mgr: 历史记录管理器
+            out_root: 输出目录（缓存键）
+        """
+        try:
+            cached = self._stats_cache
+            if cached is not None and cached[1] == out_root and monotonic() - cached[0] < _STATS_CACHE_TTL_S:
+                stats_text = cached[2]
+            else:
+                stats = history_mgr.get_statistics()
+                
+                stats_text = f"""下载历史统计
 
 总计: {stats['total']}
 成功: {stats['ok']}
@@ -346,11 +779,21 @@ class ExportController(BaseController):
 频道数: {stats['channels']}
 语言: {', '.join(list(stats['languages'].keys())[:10])}
 """
+                self._stats_cache = (monotonic(), out_root, stats_text)
             
             messagebox.showinfo("历史统计", stats_text)
         except Exception as e:
             self._log(f"获取统计信息失败: {e}", "ERROR")
             messagebox.showerror("错误", f"获取统计信息时出错:\n{e}")
+    
+    def cleanup(self):
+        """清理资源：销毁隐藏的历史记录对话框"""
+        if self._history_dialog is not None:
+            try:
+                self._history_dialog.destroy()
+            except tk.TclError:
+                pass
+            self._history_dialog = None
 
 
 __all__ = ['ExportController']
@@ -14,13 +14,52 @@ from gui.controllers.export_controller import ExportController
 from gui.utils.log_manager import LogManager
 from events.event_bus import EventType, Event
 from theme_manager import apply_theme
-from config_store import load_config
 from services.config_service import get_config_service
+from functools import partial
 from datetime import datetime
 from pathlib import Path
 from typing import List
 import json
 from tkinter import simpledialog, messagebox, filedialog
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 按需订阅的事件处理：事件类型 -> 处理方法名（仅当某个子控制器在 REQUIRED_EVENTS 中声明时订阅）
+_OPTIONAL_HANDLERS = {
+    EventType.DOWNLOAD_STARTED: '_on_download_started',
+    EventType.DOWNLOAD_PROGRESS: '_on_download_progress',
+    EventType.DOWNLOAD_COMPLETED: '_on_download_completed',
+    EventType.DOWNLOAD_FAILED: '_on_download_failed',
+    EventType.DOWNLOAD_STOPPED: '_on_download_stopped',
+    EventType.DOWNLOAD_PAUSED: '_on_download_paused',
+    EventType.DOWNLOAD_RESUMED: '_on_download_resumed',
+}
+
+# 由下载控制器处理的按钮：(视图属性名, 是否仅检测 dry_run)
+_BUTTON_BINDINGS = (('btn_detect', True), ('btn_download', False))
+
+# 初始化时加载配置的子控制器（存在时）；常驻控制器的配置加载完成后才绑定事件
+_CONFIG_CONTROLLERS = ('settings', 'download', 'ai', 'optimize', 'translate')
+_CORE_CONTROLLERS = frozenset({'settings', 'download', 'ai'})
+
+# 启动时必须存在的关键UI组件：(视图属性名, 显示名称)
+_CRITICAL_COMPONENTS = (
+    ('btn_detect', '检测按钮'),
+    ('btn_download', '下载按钮'),
+    ('btn_stop', '停止按钮'),
+    ('download_panel', '下载面板'),
+    ('settings_panel', '设置面板'),
+    ('ai_panel', 'AI面板'),
+    ('optimize_panel', '字幕优化面板'),
+    ('translate_panel', '字幕翻译面板'),
+)
+
+# 需要触发懒加载的面板：(面板名, 视图属性名)
+_PANELS = tuple(
+    (name, f"{name}_panel")
+    for name in ('settings', 'download', 'ai', 'optimize', 'translate', 'scheduler', 'subscription')
+)
 
 
 class MainController(BaseController):
@@ -44,6 +83,12 @@ class MainController(BaseController):
         self.view = view
         self.config = config
         self.controllers = {}
+        # 延迟创建的子控制器：名称 -> (面板视图, 工厂函数)，首次使用时由 get_controller 创建
+        self._controller_factories = {}
+        # 就绪检查时取得的关键组件快照（属性名 -> 控件，缺失为None），供绑定事件复用
+        self._ui_widgets = {}
+        self._subscribed_events = set()  # 已按需订阅的事件类型
+        self._view_events_bound = False  # 视图事件是否已绑定（避免重复绑定）
         self.cfg_service = get_config_service()
         
         super().__init__()
@@ -61,71 +106,43 @@ class MainController(BaseController):
         创建所有子控制器（使用统一的初始化顺序）
         
         初始化顺序：
-        1. 确保UI完全创建（触发所有懒加载）
-        2. SettingsController（先创建，供DownloadController使用）
-        3. DownloadController（依赖SettingsController）
-        4. AIController
-        5. SchedulerController
-        6. SubscriptionController
-        7. ExportController（不需要视图）
-        8. 加载配置到所有控制器
-        9. 设置自动保存
-        10. 绑定UI事件
+        1. SettingsController（先创建，供DownloadController使用）
+        2. DownloadController（依赖SettingsController）
+        3. AIController（记录下载完成的运行目录、预设读写AI配置，需立即创建）
+        4. SchedulerController（后台调度任务，需立即创建）
+        5. 字幕优化、字幕翻译、订阅控制器：首次展开对应面板时创建
+        6. ExportController：首次导出/查看历史时创建
+        7. 确保UI完全创建（触发所有懒加载）、加载配置、绑定UI事件
         """
-        print("[MainController] 开始创建子控制器...")
+        logger.debug("[MainController] 开始创建子控制器...")
         
         # 1. 设置控制器（先创建，供下载控制器使用）
-        print("[MainController] 创建设置控制器...")
+        logger.debug("[MainController] 创建设置控制器...")
         self.controllers['settings'] = SettingsController(
             self.view.settings_panel,
-            self.config
+            self.config,
+            cfg_service=self.cfg_service
         )
         
         # 2. 下载控制器（需要settings_ctrl来获取网络配置）
-        print("[MainController] 创建下载控制器...")
+        logger.debug("[MainController] 创建下载控制器...")
         self.controllers['download'] = DownloadController(
             self.view.download_panel,
             self.config,
-            settings_ctrl=self.controllers['settings']  # 传递设置控制器的引用
+            settings_ctrl=self.controllers['settings'],  # 传递设置控制器的引用
+            cfg_service=self.cfg_service
         )
         
         # 3. AI控制器
-        print("[MainController] 创建AI控制器...")
+        logger.debug("[MainController] 创建AI控制器...")
         self.controllers['ai'] = AIController(
             self.view.ai_panel,
-            self.config
+            self.config,
+            cfg_service=self.cfg_service
         )
         
-        # 4. 字幕优化控制器
-        print("[MainController] 创建字幕优化控制器...")
-        try:
-            self.controllers['optimize'] = OptimizeController(
-                self.view.optimize_panel,
-                self.config
-            )
-            print("[MainController] ✓ 字幕优化控制器创建成功")
-        except Exception as e:
-            print(f"[MainController] ⚠️ 字幕优化控制器创建失败: {e}")
-            import traceback
-            traceback.print_exc()
-            # 即使失败也继续，不影响其他功能
-        
-        # 5. 字幕翻译控制器
-        print("[MainController] 创建字幕翻译控制器...")
-        try:
-            self.controllers['translate'] = TranslateController(
-                self.view.translate_panel,
-                self.config
-            )
-            print("[MainController] ✓ 字幕翻译控制器创建成功")
-        except Exception as e:
-            print(f"[MainController] ⚠️ 字幕翻译控制器创建失败: {e}")
-            import traceback
-            traceback.print_exc()
-            # 即使失败也继续，不影响其他功能
-        
-        # 6. 调度器控制器
-        print("[MainController] 创建调度器控制器...")
+        # 4. 调度器控制器
+        logger.debug("[MainController] 创建调度器控制器...")
         scheduler_ctrl = SchedulerController(
             self.view.scheduler_panel,
             self.config
@@ -133,22 +150,93 @@ class MainController(BaseController):
         scheduler_ctrl.main_controller = self  # 设置主控制器引用
         self.controllers['scheduler'] = scheduler_ctrl
         
-        # 5. 订阅控制器
-        print("[MainController] 创建订阅控制器...")
-        self.controllers['subscription'] = SubscriptionController(
-            self.view.subscription_panel,
-            self.config
-        )
+        # 5. 其余控制器延迟到首次使用时创建
+        self._controller_factories = {
+            'optimize': (self.view.optimize_panel,
+                         partial(OptimizeController, self.view.optimize_panel, self.config,
+                                 cfg_service=self.cfg_service)),
+            'translate': (self.view.translate_panel,
+                          partial(TranslateController, self.view.translate_panel, self.config,
+                                  cfg_service=self.cfg_service)),
+            'subscription': (self.view.subscription_panel,
+                             partial(SubscriptionController, self.view.subscription_panel, self.config)),
+            'export': (None, partial(ExportController, self.config, root_window=self.view.root)),
+        }
+        for name, (panel, _) in list(self._controller_factories.items()):
+            if panel is not None:
+                self._create_when_expanded(name, panel)
         
-        # 8. 导出控制器（不需要视图）
-        print("[MainController] 创建导出控制器...")
-        self.controllers['export'] = ExportController(self.config)
+        logger.debug("[MainController] ✓ 常驻子控制器已创建，延迟创建: %s",
+                     list(self._controller_factories))
         
-        print("[MainController] ✓ 所有子控制器已创建")
+        # 只订阅已创建的子控制器需要的事件
+        self._subscribe_required_events(self.controllers.values())
         
         # 确保UI完全创建后再加载配置和绑定事件
         self._ensure_ui_ready_then_init()
     
+    def get_controller(self, name: str):
+        """
+        获取子控制器（延迟创建的控制器在首次调用时创建）
+        
+        Args:
+            name: 控制器名称
+        
+        Returns:
+            控制器实例，不存在或创建失败时返回None
+        """
+        ctrl = self.controllers.get(name)
+        if ctrl is not None:
+            return ctrl
+        
+        entry = self._controller_factories.pop(name, None)
+        if entry is None:
+            return None
+        
+        logger.debug("[MainController] 创建%s控制器...", name)
+        try:
+            ctrl = entry[1]()
+        except Exception as e:
+            # 即使失败也继续，不影响其他功能
+            logger.warning("[MainController] ⚠️ %s控制器创建失败: %s", name, e, exc_info=True)
+            return None
+        
+        self.controllers[name] = ctrl
+        self._subscribe_required_events((ctrl,))
+        return ctrl
+    
+    def _subscribe_required_events(self, controllers):
+        """
+        订阅子控制器声明需要的事件（已订阅的跳过）
+        
+        Args:
+            controllers: 子控制器集合
+        """
+        needed = set().union(*(ctrl.REQUIRED_EVENTS for ctrl in controllers))
+        handlers = {
+            event_type: getattr(self, _OPTIONAL_HANDLERS[event_type])
+            for event_type in needed - self._subscribed_events
+            if event_type in _OPTIONAL_HANDLERS
+        }
+        if handlers:
+            self._subscribe_many(handlers)
+            self._subscribed_events.update(handlers)
+    
+    def _create_when_expanded(self, name: str, panel):
+        """面板内容首次显示（手风琴展开）时创建对应的控制器"""
+        accordion = getattr(panel, 'accordion', None)
+        try:
+            content = accordion.get_content_frame() if accordion is not None else None
+        except Exception as e:
+            logger.warning("[MainController] ⚠️ %s面板加载失败: %s", name, e)
+            content = None
+        
+        if content is None or content.winfo_ismapped():
+            self.get_controller(name)
+            return
+        # 创建失败时 get_controller 返回 None 并已记录警告，此处不使用返回值
+        content.bind('<Map>', lambda e, n=name: self.get_controller(n), add='+')
+    
     def _ensure_ui_ready_then_init(self):
         """
         确保UI完全创建后再初始化（包括懒加载组件）
@@ -166,188 +254,95 @@ class MainController(BaseController):
             
             init_manager.add_step("确保UI就绪", ensure_ui_ready, retry_on_fail=True, max_retries=5)
             
-            # 步骤2: 加载配置（依赖UI就绪）
-            def load_all_configs():
-                """加载所有配置"""
-                try:
-                    self.controllers['settings'].load_config()
-                    self.controllers['download'].load_config()
-                    self.controllers['ai'].load_config()
-                    # 加载优化配置（如果存在）
-                    if 'optimize' in self.controllers:
-                        try:
-                            self.controllers['optimize'].load_config()
-                        except Exception as e:
-                            print(f"[MainController] ⚠️ 加载优化配置失败: {e}")
-                            # 继续执行，不影响其他配置加载
-                    # 加载翻译配置（如果存在）
-                    if 'translate' in self.controllers:
-                        try:
-                            self.controllers['translate'].load_config()
-                        except Exception as e:
-                            print(f"[MainController] ⚠️ 加载翻译配置失败: {e}")
-                            # 继续执行，不影响其他配置加载
-                    print("[MainController] ✓ 所有配置已加载")
-                    return True
-                except Exception as e:
-                    print(f"[MainController] ✗ 加载配置失败: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    return False
+            # 步骤2: 加载配置（依赖UI就绪）；各控制器读取各自的配置段，拆为互不依赖的步骤，
+            # 某个控制器失败不会阻塞其他控制器
+            config_steps = []
+            for name in _CONFIG_CONTROLLERS:
+                if name in self.controllers:
+                    step_name = f"加载配置:{name}"
+                    init_manager.add_step(step_name, partial(self._load_controller_config, name),
+                                          dependencies=["确保UI就绪"])
+                    if name in _CORE_CONTROLLERS:
+                        config_steps.append(step_name)
             
-            init_manager.add_step("加载配置", load_all_configs, dependencies=["确保UI就绪"])
-            
-            # 步骤3: 绑定事件（依赖配置加载）
+            # 步骤3: 绑定事件（依赖常驻控制器的配置加载）
             def bind_events():
                 """绑定所有事件"""
                 try:
-                    print("[MainController] 开始绑定视图事件...")
+                    logger.debug("[MainController] 开始绑定视图事件...")
                     self._bind_view_events()
-                    print("[MainController] ✓ 所有事件已绑定")
-                    
-                    # 验证按钮绑定
-                    if hasattr(self.view, 'btn_detect'):
-                        cmd = self.view.btn_detect.cget('command')
-                        if cmd:
-                            print(f"[MainController] ✓ 检测按钮已绑定: {cmd}")
-                        else:
-                            print("[MainController] ✗ 检测按钮未绑定（command为空）")
-                    
-                    if hasattr(self.view, 'btn_download'):
-                        cmd = self.view.btn_download.cget('command')
-                        if cmd:
-                            print(f"[MainController] ✓ 下载按钮已绑定: {cmd}")
-                        else:
-                            print("[MainController] ✗ 下载按钮未绑定（command为空）")
-                    
+                    logger.debug("[MainController] ✓ 所有事件已绑定")
+                    # 按钮绑定由下一步骤“验证按钮绑定”检查
                     return True
                 except Exception as e:
-                    print(f"[MainController] ✗ 绑定事件失败: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("[MainController] ✗ 绑定事件失败: %s", e)
                     return False
             
-            init_manager.add_step("绑定事件", bind_events, dependencies=["加载配置"])
+            init_manager.add_step("绑定事件", bind_events, dependencies=config_steps)
             
-            # 步骤4: 延迟验证按钮绑定（确保绑定成功）
+            # 步骤4: 验证按钮绑定（发现未绑定时重新绑定并返回False，由初始化管理器重试验证）
             def verify_bindings():
                 """验证按钮绑定"""
                 try:
-                    print("[MainController] ========== 验证按钮绑定 ==========")
-                    if hasattr(self.view, 'btn_detect'):
-                        cmd = self.view.btn_detect.cget('command')
-                        state = self.view.btn_detect.cget('state')
-                        print(f"[MainController] 检测按钮: command={cmd is not None}, state={state}")
-                        if not cmd:
-                            print("[MainController] ⚠️ 检测按钮未绑定，尝试重新绑定")
-                            self._bind_view_events()
-                    else:
-                        print("[MainController] ✗ 检测按钮不存在")
+                    logger.debug("[MainController] ========== 验证按钮绑定 ==========")
+                    unbound = []
+                    for attr, name in (('btn_detect', '检测按钮'), ('btn_download', '下载按钮')):
+                        if not hasattr(self.view, attr):
+                            logger.warning("[MainController] ✗ %s不存在", name)
+                            continue
+                        btn = getattr(self.view, attr)
+                        if not btn.cget('command'):
+                            unbound.append(name)
                     
-                    if hasattr(self.view, 'btn_download'):
-                        cmd = self.view.btn_download.cget('command')
-                        state = self.view.btn_download.cget('state')
-                        print(f"[MainController] 下载按钮: command={cmd is not None}, state={state}")
-                        if not cmd:
-                            print("[MainController] ⚠️ 下载按钮未绑定，尝试重新绑定")
-                            self._bind_view_events()
-                    else:
-                        print("[MainController] ✗ 下载按钮不存在")
-                    
-                    print("[MainController] =====================================")
+                    if unbound:
+                        logger.warning("[MainController] ⚠️ %s未绑定，尝试重新绑定", "、".join(unbound))
+                        self._rebind_view_events()
+                        return False
                     return True
                 except Exception as e:
-                    print(f"[MainController] ✗ 验证绑定失败: {e}")
+                    logger.error("[MainController] ✗ 验证绑定失败: %s", e)
                     return False
             
-            init_manager.add_step("验证按钮绑定", verify_bindings, dependencies=["绑定事件"])
+            init_manager.add_step("验证按钮绑定", verify_bindings, dependencies=["绑定事件"],
+                                  retry_on_fail=True, max_retries=2)
             
             # 执行初始化
-            print("[MainController] 开始统一初始化...")
+            logger.debug("[MainController] 开始统一初始化...")
             init_manager.execute_all()
             
             # 检查状态
             status = init_manager.get_status()
             if status["failed"] > 0:
-                print(f"[MainController] ⚠️ 初始化完成，但有 {status['failed']} 个步骤失败")
+                logger.warning("[MainController] ⚠️ 初始化完成，但有 %s 个步骤失败", status['failed'])
                 for error in status["errors"]:
-                    print(f"  - {error}")
+                    logger.warning("  - %s", error)
             else:
-                print("[MainController] ✓ 统一初始化完成")
-                
-            # 延迟再次验证和绑定（确保按钮绑定成功）
-            def delayed_verify_and_bind():
-                """延迟验证和绑定（确保UI完全创建后）"""
-                print("[MainController] ========== 延迟验证按钮绑定 ==========")
-                try:
-                    if hasattr(self.view, 'btn_detect'):
-                        cmd = self.view.btn_detect.cget('command')
-                        state = self.view.btn_detect.cget('state')
-                        visible = self.view.btn_detect.winfo_viewable()
-                        print(f"[MainController] 检测按钮: command={cmd is not None}, state={state}, visible={visible}")
-                        
-                        if not cmd:
-                            print("[MainController] ⚠️ 检测按钮未绑定，强制绑定测试函数...")
-                            # 绑定一个简单的测试函数
-                            def test_detect():
-                                print("[MainController] ===== 检测按钮被点击（延迟绑定测试）======")
-                                import sys
-                                sys.stdout.flush()
-                                # 然后调用真正的功能
-                                if 'download' in self.controllers:
-                                    try:
-                                        self.controllers['download'].start_download(dry_run=True)
-                                    except Exception as e:
-                                        print(f"[MainController] ✗ 执行检测失败: {e}")
-                            
-                            self.view.btn_detect.config(command=test_detect)
-                            print(f"[MainController] ✓ 已强制绑定检测按钮")
-                        
-                        # 验证最终状态
-                        final_cmd = self.view.btn_detect.cget('command')
-                        final_state = self.view.btn_detect.cget('state')
-                        print(f"[MainController] 检测按钮最终: command={final_cmd is not None}, state={final_state}")
-                    
-                    if hasattr(self.view, 'btn_download'):
-                        cmd = self.view.btn_download.cget('command')
-                        state = self.view.btn_download.cget('state')
-                        visible = self.view.btn_download.winfo_viewable()
-                        print(f"[MainController] 下载按钮: command={cmd is not None}, state={state}, visible={visible}")
-                        
-                        if not cmd:
-                            print("[MainController] ⚠️ 下载按钮未绑定，强制绑定测试函数...")
-                            # 绑定一个简单的测试函数
-                            def test_download():
-                                print("[MainController] ===== 下载按钮被点击（延迟绑定测试）======")
-                                import sys
-                                sys.stdout.flush()
-                                # 然后调用真正的功能
-                                if 'download' in self.controllers:
-                                    try:
-                                        self.controllers['download'].start_download(dry_run=False)
-                                    except Exception as e:
-                                        print(f"[MainController] ✗ 执行下载失败: {e}")
-                            
-                            self.view.btn_download.config(command=test_download)
-                            print(f"[MainController] ✓ 已强制绑定下载按钮")
-                        
-                        # 验证最终状态
-                        final_cmd = self.view.btn_download.cget('command')
-                        final_state = self.view.btn_download.cget('state')
-                        print(f"[MainController] 下载按钮最终: command={final_cmd is not None}, state={final_state}")
-                except Exception as e:
-                    print(f"[MainController] ✗ 延迟验证失败: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            # 延迟500ms后再次验证和绑定
-            self.view.root.after(500, delayed_verify_and_bind)
+                logger.debug("[MainController] ✓ 统一初始化完成")
                 
         except ImportError:
             # 如果初始化管理器不可用，使用传统方式
-            print("[MainController] ⚠️ 初始化管理器不可用，使用传统初始化方式")
+            logger.warning("[MainController] ⚠️ 初始化管理器不可用，使用传统初始化方式")
             self._ensure_ui_ready_then_init_legacy()
     
+    def _load_controller_config(self, name: str) -> bool:
+        """
+        加载单个子控制器的配置（初始化步骤）
+        
+        Args:
+            name: 控制器名称
+        
+        Returns:
+            是否成功；常驻控制器失败时返回False，其余控制器失败只记录警告
+        """
+        try:
+            self.controllers[name].load_config()
+        except Exception as e:
+            if name in _CORE_CONTROLLERS:
+                logger.exception("[MainController] ✗ 加载%s配置失败: %s", name, e)
+                return False
+            logger.warning("[MainController] ⚠️ 加载%s配置失败: %s", name, e)
+        return True
+    
     def _ensure_ui_components_ready(self) -> bool:
         """
         确保所有UI组件已创建（包括懒加载组件）
@@ -355,394 +350,171 @@ class MainController(BaseController):
         Returns:
             是否就绪
         """
-        # 检查关键UI组件
-        critical_components = [
-            ('btn_detect', '检测按钮'),
-            ('btn_download', '下载按钮'),
-            ('btn_stop', '停止按钮'),
-            ('download_panel', '下载面板'),
-            ('settings_panel', '设置面板'),
-            ('ai_panel', 'AI面板'),
-            ('optimize_panel', '字幕优化面板'),
-            ('translate_panel', '字幕翻译面板'),
-        ]
-        
-        missing_components = []
-        for attr, name in critical_components:
-            if not hasattr(self.view, attr):
-                missing_components.append(name)
+        # 检查关键UI组件；每个属性只查找一次，结果保存供 _bind_view_events 复用
+        view = self.view
+        snap = {attr: getattr(view, attr, None) for attr, _ in _CRITICAL_COMPONENTS}
+        self._ui_widgets = snap
+        missing_components = [name for attr, name in _CRITICAL_COMPONENTS if snap[attr] is None]
         
         # 检查懒加载组件
         lazy_load_issues = []
-        panels = [
-            ("settings", getattr(self.view, "settings_panel", None)),
-            ("download", getattr(self.view, "download_panel", None)),
-            ("ai", getattr(self.view, "ai_panel", None)),
-            ("optimize", getattr(self.view, "optimize_panel", None)),
-            ("translate", getattr(self.view, "translate_panel", None)),
-            ("scheduler", getattr(self.view, "scheduler_panel", None)),
-            ("subscription", getattr(self.view, "subscription_panel", None)),
-        ]
-        
-        for panel_name, panel in panels:
-            if panel and hasattr(panel, "accordion"):
-                accordion = panel.accordion
-                if hasattr(accordion, "_lazy_load") and accordion._lazy_load:
-                    try:
-                        # 触发懒加载
-                        accordion.get_content_frame()
-                    except Exception as e:
-                        lazy_load_issues.append(f"{panel_name}面板: {e}")
+        for panel_name, attr in _PANELS:
+            panel = snap[attr] if attr in snap else getattr(view, attr, None)
+            accordion = getattr(panel, "accordion", None)
+            if accordion is not None and getattr(accordion, "_lazy_load", False):
+                try:
+                    # 触发懒加载
+                    accordion.get_content_frame()
+                except Exception as e:
+                    lazy_load_issues.append(f"{panel_name}面板: {e}")
         
         if missing_components or lazy_load_issues:
             if missing_components:
-                print(f"[MainController] ⚠️ 缺少关键组件: {', '.join(missing_components)}")
+                logger.warning("[MainController] ⚠️ 缺少关键组件: %s", ', '.join(missing_components))
             if lazy_load_issues:
-                print(f"[MainController] ⚠️ 懒加载问题: {', '.join(lazy_load_issues)}")
+                logger.warning("[MainController] ⚠️ 懒加载问题: %s", ', '.join(lazy_load_issues))
             return False
         
-        print("[MainController] ✓ 所有UI组件已就绪")
+        logger.debug("[MainController] ✓ 所有UI组件已就绪")
         return True
     
     def _ensure_ui_ready_then_init_legacy(self):
         """
         传统初始化方式（兼容性，当初始化管理器不可用时使用）
         """
-        def check_and_init(retry_count=0, max_retries=5):
+        def check_and_init():
             """检查UI就绪状态并初始化"""
+            # 就绪检查本身会同步触发面板懒加载；此时仍未就绪（组件缺失或懒加载异常）
+            # 不会因等待而改变，因此不再轮询重试，记录后直接继续初始化
             if not self._ensure_ui_components_ready():
-                if retry_count < max_retries:
-                    print(f"[MainController] UI未就绪，{200}ms后重试 ({retry_count + 1}/{max_retries})")
-                    self.view.root.after(200, lambda: check_and_init(retry_count + 1, max_retries))
-                    return
-                else:
-                    print("[MainController] ⚠️ UI未就绪，但已达到最大重试次数，继续初始化")
+                logger.warning("[MainController] ⚠️ UI未完全就绪，继续初始化")
             
             # UI就绪后，加载配置和绑定事件
             try:
                 self.controllers['settings'].load_config()
                 self.controllers['download'].load_config()
                 self.controllers['ai'].load_config()
-                print("[MainController] ✓ 所有配置已加载")
+                logger.debug("[MainController] ✓ 所有配置已加载")
             except Exception as e:
-                print(f"[MainController] ✗ 加载配置失败: {e}")
+                logger.error("[MainController] ✗ 加载配置失败: %s", e)
             
             # 绑定事件
             try:
-                print("[MainController] 开始绑定视图事件...")
+                logger.debug("[MainController] 开始绑定视图事件...")
                 self._bind_view_events()
-                print("[MainController] ✓ 所有事件已绑定")
+                logger.debug("[MainController] ✓ 所有事件已绑定")
             except Exception as e:
-                print(f"[MainController] ✗ 绑定事件失败: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("[MainController] ✗ 绑定事件失败: %s", e)
             
             # 延迟验证按钮绑定
             def delayed_verify():
-                print("[MainController] ========== 传统方式延迟验证按钮绑定 ==========")
+                logger.debug("[MainController] ========== 传统方式延迟验证按钮绑定 ==========")
                 try:
                     if hasattr(self.view, 'btn_detect'):
-                        cmd = self.view.btn_detect.cget('command')
-                        state = self.view.btn_detect.cget('state')
-                        print(f"[MainController] 检测按钮: command={cmd is not None}, state={state}")
-                        if not cmd:
-                            print("[MainController] ⚠️ 检测按钮未绑定，重新绑定...")
-                            self._bind_view_events()
+                        if not self.view.btn_detect.cget('command'):
+                            logger.warning("[MainController] ⚠️ 检测按钮未绑定，重新绑定...")
+                            self._rebind_view_events()
                     
                     if hasattr(self.view, 'btn_download'):
-                        cmd = self.view.btn_download.cget('command')
-                        state = self.view.btn_download.cget('state')
-                        print(f"[MainController] 下载按钮: command={cmd is not None}, state={state}")
-                        if not cmd:
-                            print("[MainController] ⚠️ 下载按钮未绑定，重新绑定...")
-                            self._bind_view_events()
+                        if not self.view.btn_download.cget('command'):
+                            logger.warning("[MainController] ⚠️ 下载按钮未绑定，重新绑定...")
+                            self._rebind_view_events()
                 except Exception as e:
-                    print(f"[MainController] ✗ 延迟验证失败: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("[MainController] ✗ 延迟验证失败: %s", e)
             
-            # 延迟500ms后验证
-            self.view.root.after(500, delayed_verify)
+            # 空闲时验证（不再固定等待500ms）
+            self.view.root.after_idle(delayed_verify)
+        
+        # 主窗口映射（显示）后再初始化，不再固定延迟
+        root = self.view.root
+        if root.winfo_ismapped():
+            root.after_idle(check_and_init)
+            return
         
-        # 延迟检查，确保UI完全创建
-        self.view.root.after(100, lambda: check_and_init())
+        fired = False
+        
+        def on_root_map(event):
+            # 子控件的 <Map> 也会经由顶层窗口的绑定标签到达这里，只处理主窗口本身的第一次映射
+            nonlocal fired
+            if fired or event.widget is not root:
+                return
+            fired = True
+            check_and_init()
+        
+        root.bind('<Map>', on_root_map, add='+')
     
     def _setup_event_listeners(self):
         """设置事件监听"""
-        # 监听日志事件
-        self.event_bus.subscribe(EventType.LOG_MESSAGE, self._on_log_message)
-        self.event_bus.subscribe(EventType.LOG_CLEAR, self._on_log_clear)
-        
-        # 监听下载事件
-        self.event_bus.subscribe(EventType.DOWNLOAD_STARTED, self._on_download_started)
-        self.event_bus.subscribe(EventType.DOWNLOAD_PROGRESS, self._on_download_progress)
-        self.event_bus.subscribe(EventType.DOWNLOAD_COMPLETED, self._on_download_completed)
-        self.event_bus.subscribe(EventType.DOWNLOAD_FAILED, self._on_download_failed)
-        self.event_bus.subscribe(EventType.DOWNLOAD_STOPPED, self._on_download_stopped)
-        self.event_bus.subscribe(EventType.DOWNLOAD_PAUSED, self._on_download_paused)
-        self.event_bus.subscribe(EventType.DOWNLOAD_RESUMED, self._on_download_resumed)
-        
-        # 监听主题变化
-        self.event_bus.subscribe(EventType.THEME_CHANGED, self._on_theme_changed)
-        
-        # 监听配置事件
-        self.event_bus.subscribe(EventType.CONFIG_SAVED, self._on_config_saved)
+        # 下载事件按子控制器的 REQUIRED_EVENTS 订阅（见 _subscribe_required_events）
+        self._subscribe_many({
+            # 日志事件
+            EventType.LOG_MESSAGE: self._on_log_message,
+            EventType.LOG_CLEAR: self._on_log_clear,
+            # 主题变化
+            EventType.THEME_CHANGED: self._on_theme_changed,
+            # 配置事件
+            EventType.CONFIG_SAVED: self._on_config_saved,
+        })
     
     def _bind_view_events(self):
-        """绑定视图事件"""
-        print("[MainController] 开始绑定视图事件...")
-        print(f"[MainController] 视图对象: {self.view}")
-        print(f"[MainController] 视图类型: {type(self.view)}")
-        print(f"[MainController] 控制器字典: {list(self.controllers.keys())}")
+        """绑定视图事件（已绑定时直接返回，强制重新绑定请用 _rebind_view_events）"""
+        if self._view_events_bound:
+            return
+        logger.debug("[MainController] 开始绑定视图事件...")
+        logger.debug("[MainController] 视图对象: %s", self.view)
+        logger.debug("[MainController] 视图类型: %s", type(self.view))
+        logger.debug("[MainController] 控制器字典: %s", list(self.controllers.keys()))
         
         # 主题切换
         if hasattr(self.view, 'theme_combo'):
             self.view.theme_combo.bind("<<ComboboxSelected>>", self._on_theme_combo_change)
         
-        # 下载按钮（确保控制器已创建）
-        if hasattr(self.view, 'btn_detect'):
-            print(f"[MainController] ✓ 检测按钮存在: {self.view.btn_detect}")
-            if 'download' in self.controllers:
-                print(f"[MainController] ✓ 下载控制器存在: {self.controllers['download']}")
-                try:
-                    # 使用包装函数，避免lambda闭包问题
-                    def on_detect_click():
-                        print("=" * 80)
-                        print("[MainController] ===== 检测按钮被点击 ======")
-                        print("=" * 80)
-                        import sys
-                        sys.stdout.flush()
-                        try:
-                            print(f"[MainController] 调用下载控制器: {self.controllers['download']}")
-                            print(f"[MainController] start_download方法存在: {hasattr(self.controllers['download'], 'start_download')}")
-                            self.controllers['download'].start_download(dry_run=True)
-                            print("[MainController] ✓ start_download调用完成")
-                        except Exception as e:
-                            print(f"[MainController] ✗ 执行检测失败: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            sys.stdout.flush()
-                    
-                    print(f"[MainController] 准备绑定检测按钮，command函数: {on_detect_click}")
-                    print(f"[MainController] on_detect_click函数ID: {id(on_detect_click)}")
-                    
-                    # 确保按钮未被禁用
-                    current_state = self.view.btn_detect.cget('state')
-                    print(f"[MainController] 检测按钮当前状态: {current_state}")
-                    if current_state == 'disabled':
-                        print("[MainController] ⚠️ 检测按钮被禁用，启用它")
-                        self.view.btn_detect.config(state='normal')
-                    
-                    # 先检查当前command是什么
-                    old_cmd = self.view.btn_detect.cget('command')
-                    print(f"[MainController] 检测按钮当前command: {old_cmd}")
-                    print(f"[MainController] 检测按钮当前command类型: {type(old_cmd)}")
-                    
-                    # 检查按钮是否可见
-                    try:
-                        is_visible = self.view.btn_detect.winfo_viewable()
-                        print(f"[MainController] 检测按钮是否可见: {is_visible}")
-                    except:
-                        print("[MainController] ⚠️ 无法检查按钮可见性")
-                    
-                    # 强制绑定，即使已经有command
-                    print(f"[MainController] 准备覆盖按钮command（从测试绑定改为实际功能）")
-                    # 先移除可能存在的bind事件（避免事件冲突）
-                    try:
-                        self.view.btn_detect.unbind('<Button-1>')
-                        print(f"[MainController] ✓ 已移除检测按钮的Button-1绑定")
-                    except:
-                        pass
-                    
-                    # 然后设置command - 直接绑定函数，避免lambda闭包问题
-                    self.view.btn_detect.config(command=on_detect_click)
-                    print(f"[MainController] ✓ 已绑定检测按钮（直接绑定函数）")
-                    print(f"[MainController] 绑定后的command: {self.view.btn_detect.cget('command')}")
-                    
-                    # 验证绑定
-                    cmd = self.view.btn_detect.cget('command')
-                    print(f"[MainController] 验证：检测按钮command = {cmd}")
-                    print(f"[MainController] 验证：检测按钮command类型 = {type(cmd)}")
-                    
-                    # 验证command是否真的是我们的函数
-                    cmd_str = str(cmd)
-                    if 'on_detect_click' in cmd_str or 'lambda' in cmd_str:
-                        print(f"[MainController] ✓ 确认：检测按钮command已正确绑定到控制器函数")
-                    else:
-                        print(f"[MainController] ⚠️ 警告：检测按钮command可能未正确绑定")
-                        print(f"[MainController] command字符串: {cmd_str[:200]}")
-                    
-                    # 再次验证状态
-                    final_state = self.view.btn_detect.cget('state')
-                    print(f"[MainController] 检测按钮最终状态: {final_state}")
-                    
-                    # 强制刷新按钮
-                    self.view.btn_detect.update()
-                    print(f"[MainController] ✓ 检测按钮已刷新")
-                    
-                    # 再次验证command是否还在
-                    final_cmd = self.view.btn_detect.cget('command')
-                    if final_cmd != cmd:
-                        print(f"[MainController] ⚠️ 警告：检测按钮command被改变！原={cmd}, 现={final_cmd}")
-                        # 重新绑定
-                        self.view.btn_detect.config(command=on_detect_click)
-                        print(f"[MainController] ✓ 已重新绑定检测按钮")
-                    
-                    # 尝试程序化调用，验证绑定是否有效
-                    try:
-                        print("[MainController] 尝试程序化调用按钮（仅测试，不执行实际功能）...")
-                        # 不实际调用，只检查command是否存在
-                        if cmd:
-                            print("[MainController] ✓ 按钮command存在，应该可以响应点击")
-                        else:
-                            print("[MainController] ✗ 按钮command为空！")
-                    except Exception as e:
-                        print(f"[MainController] ⚠️ 程序化调用测试失败: {e}")
-                except Exception as e:
-                    print(f"[MainController] ✗ 绑定检测按钮失败: {e}")
-                    import traceback
-                    traceback.print_exc()
-            else:
-                print("[MainController] ✗ 检测按钮存在，但下载控制器未创建")
-        else:
-            print("[MainController] ✗ 检测按钮不存在")
-        
-        if hasattr(self.view, 'btn_download'):
-            print(f"[MainController] ✓ 下载按钮存在: {self.view.btn_download}")
-            if 'download' in self.controllers:
-                try:
-                    # 使用包装函数，避免lambda闭包问题
-                    def on_download_click():
-                        print("=" * 80)
-                        print("[MainController] ===== 下载按钮被点击 ======")
-                        print("=" * 80)
-                        import sys
-                        sys.stdout.flush()
-                        try:
-                            print(f"[MainController] 调用下载控制器: {self.controllers['download']}")
-                            print(f"[MainController] start_download方法存在: {hasattr(self.controllers['download'], 'start_download')}")
-                            self.controllers['download'].start_download(dry_run=False)
-                            print("[MainController] ✓ start_download调用完成")
-                        except Exception as e:
-                            print(f"[MainController] ✗ 执行下载失败: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            sys.stdout.flush()
-                    
-                    print(f"[MainController] 准备绑定下载按钮，command函数: {on_download_click}")
-                    print(f"[MainController] on_download_click函数ID: {id(on_download_click)}")
-                    
-                    # 确保按钮未被禁用
-                    current_state = self.view.btn_download.cget('state')
-                    print(f"[MainController] 下载按钮当前状态: {current_state}")
-                    if current_state == 'disabled':
-                        print("[MainController] ⚠️ 下载按钮被禁用，启用它")
-                        self.view.btn_download.config(state='normal')
-                    
-                    # 先检查当前command是什么
-                    old_cmd = self.view.btn_download.cget('command')
-                    print(f"[MainController] 下载按钮当前command: {old_cmd}")
-                    print(f"[MainController] 下载按钮当前command类型: {type(old_cmd)}")
-                    
-                    # 检查按钮是否可见
-                    try:
-                        is_visible = self.view.btn_download.winfo_viewable()
-                        print(f"[MainController] 下载按钮是否可见: {is_visible}")
-                    except:
-                        print("[MainController] ⚠️ 无法检查按钮可见性")
-                    
-                    # 强制绑定，即使已经有command
-                    print(f"[MainController] 准备覆盖按钮command（从测试绑定改为实际功能）")
-                    # 先移除可能存在的bind事件（避免事件冲突）
-                    try:
-                        self.view.btn_download.unbind('<Button-1>')
-                        print(f"[MainController] ✓ 已移除下载按钮的Button-1绑定")
-                    except:
-                        pass
-                    
-                    # 然后设置command - 直接绑定函数，避免lambda闭包问题
-                    self.view.btn_download.config(command=on_download_click)
-                    print(f"[MainController] ✓ 已绑定下载按钮（直接绑定函数）")
-                    print(f"[MainController] 绑定后的command: {self.view.btn_download.cget('command')}")
-                    
-                    # 验证绑定
-                    cmd = self.view.btn_download.cget('command')
-                    print(f"[MainController] 验证：下载按钮command = {cmd}")
-                    print(f"[MainController] 验证：下载按钮command类型 = {type(cmd)}")
-                    
-                    # 验证command是否真的是我们的函数
-                    cmd_str = str(cmd)
-                    if 'on_download_click' in cmd_str or 'lambda' in cmd_str:
-                        print(f"[MainController] ✓ 确认：下载按钮command已正确绑定到控制器函数")
-                    else:
-                        print(f"[MainController] ⚠️ 警告：下载按钮command可能未正确绑定")
-                        print(f"[MainController] command字符串: {cmd_str[:200]}")
-                    
-                    # 再次验证状态
-                    final_state = self.view.btn_download.cget('state')
-                    print(f"[MainController] 下载按钮最终状态: {final_state}")
-                    
-                    # 强制刷新按钮
-                    self.view.btn_download.update()
-                    print(f"[MainController] ✓ 下载按钮已刷新")
-                    
-                    # 再次验证command是否还在
-                    final_cmd = self.view.btn_download.cget('command')
-                    if final_cmd != cmd:
-                        print(f"[MainController] ⚠️ 警告：下载按钮command被改变！原={cmd}, 现={final_cmd}")
-                        # 重新绑定
-                        self.view.btn_download.config(command=on_download_click)
-                        print(f"[MainController] ✓ 已重新绑定下载按钮")
-                    
-                    # 尝试程序化调用，验证绑定是否有效
-                    try:
-                        print("[MainController] 尝试程序化调用按钮（仅测试，不执行实际功能）...")
-                        # 不实际调用，只检查command是否存在
-                        if cmd:
-                            print("[MainController] ✓ 按钮command存在，应该可以响应点击")
-                        else:
-                            print("[MainController] ✗ 按钮command为空！")
-                    except Exception as e:
-                        print(f"[MainController] ⚠️ 程序化调用测试失败: {e}")
-                except Exception as e:
-                    print(f"[MainController] ✗ 绑定下载按钮失败: {e}")
-                    import traceback
-                    traceback.print_exc()
-            else:
-                print("[MainController] ✗ 下载按钮存在，但下载控制器未创建")
-        else:
-            print("[MainController] ✗ 下载按钮不存在")
+        # 检测/下载按钮：直接绑定到下载控制器（partial 为稳定的可调用对象，无需反复校验重绑）
+        download_ctrl = self.controllers.get('download')
+        widgets = self._ui_widgets
+        for attr, dry_run in _BUTTON_BINDINGS:
+            btn = widgets.get(attr)
+            if btn is None:
+                btn = getattr(self.view, attr, None)
+            if btn is None:
+                logger.warning("[MainController] ✗ %s 不存在", attr)
+                continue
+            if download_ctrl is None:
+                logger.error("[MainController] ✗ %s 存在，但下载控制器未创建", attr)
+                continue
+            btn.config(state='normal', command=partial(download_ctrl.start_download, dry_run=dry_run))
+            logger.debug("[MainController] ✓ 已绑定 %s (dry_run=%s)", attr, dry_run)
         
         if hasattr(self.view, 'btn_stop'):
-            print(f"[MainController] ✓ 停止按钮存在: {self.view.btn_stop}")
+            logger.debug("[MainController] ✓ 停止按钮存在: %s", self.view.btn_stop)
             if 'download' in self.controllers:
                 try:
                     self.view.btn_stop.config(command=self.controllers['download'].stop_download)
-                    print("[MainController] ✓ 已绑定停止按钮")
+                    logger.debug("[MainController] ✓ 已绑定停止按钮")
                 except Exception as e:
-                    print(f"[MainController] ✗ 绑定停止按钮失败: {e}")
+                    logger.error("[MainController] ✗ 绑定停止按钮失败: %s", e)
             else:
-                print("[MainController] ✗ 停止按钮存在，但下载控制器未创建")
+                logger.error("[MainController] ✗ 停止按钮存在，但下载控制器未创建")
         else:
-            print("[MainController] ✗ 停止按钮不存在")
+            logger.warning("[MainController] ✗ 停止按钮不存在")
         
         # 暂停/恢复按钮
         if hasattr(self.view, 'btn_pause_resume'):
             self.view.btn_pause_resume.config(command=self._toggle_pause_resume)
-            print("[MainController] ✓ 已绑定暂停/恢复按钮")
+            logger.debug("[MainController] ✓ 已绑定暂停/恢复按钮")
         else:
-            print("[MainController] ✗ 暂停/恢复按钮不存在")
+            logger.warning("[MainController] ✗ 暂停/恢复按钮不存在")
         
         # 日志按钮
         if hasattr(self.view, 'btn_clear_log'):
             self.view.btn_clear_log.config(command=self._clear_log)
         
         if hasattr(self.view, 'btn_search_log_toolbar'):
-            print(f"[DEBUG] 绑定搜索按钮: {self.view.btn_search_log_toolbar}")
+            logger.debug("[MainController] 绑定搜索按钮: %s", self.view.btn_search_log_toolbar)
             self.view.btn_search_log_toolbar.config(command=self._on_search_log_click)
-            print(f"[DEBUG] ✓ 搜索按钮已绑定")
+            logger.debug("[MainController] ✓ 搜索按钮已绑定")
         else:
-            print(f"[DEBUG] ✗ btn_search_log_toolbar 不存在")
+            logger.warning("[MainController] ✗ btn_search_log_toolbar 不存在")
         
         if hasattr(self.view, 'btn_export_log'):
             self.view.btn_export_log.config(command=self._export_log)
@@ -755,10 +527,10 @@ class MainController(BaseController):
             self.view.combo_log_level.bind("<<ComboboxSelected>>", self._on_log_level_changed)
         
         if hasattr(self.view, 'entry_log_search'):
-            print(f"[DEBUG] 绑定搜索输入框事件")
+            logger.debug("[MainController] 绑定搜索输入框事件")
             self.view.entry_log_search.bind("<Return>", lambda e: self._on_search_log_click())
             self.view.entry_log_search.bind("<KeyRelease>", self._on_search_text_changed)
-            print(f"[DEBUG] ✓ 搜索输入框事件已绑定")
+            logger.debug("[MainController] ✓ 搜索输入框事件已绑定")
         
         # 历史记录按钮
         if hasattr(self.view, 'btn_view_history'):
@@ -777,42 +549,13 @@ class MainController(BaseController):
         
         # 初始化预设菜单
         self.view.root.after(200, self._refresh_preset_menu)
-    
-    def _test_button_binding(self):
-        """测试按钮绑定是否成功"""
-        print("[MainController] ========== 测试按钮绑定 ==========")
-        if hasattr(self.view, 'btn_detect'):
-            cmd = self.view.btn_detect.cget('command')
-            print(f"[MainController] 检测按钮command: {cmd}")
-            if cmd:
-                print("[MainController] ✓ 检测按钮已绑定")
-            else:
-                print("[MainController] ✗ 检测按钮未绑定（command为空）")
-        else:
-            print("[MainController] ✗ 检测按钮不存在")
-        
-        if hasattr(self.view, 'btn_download'):
-            cmd = self.view.btn_download.cget('command')
-            print(f"[MainController] 下载按钮command: {cmd}")
-            if cmd:
-                print("[MainController] ✓ 下载按钮已绑定")
-            else:
-                print("[MainController] ✗ 下载按钮未绑定（command为空）")
-        else:
-            print("[MainController] ✗ 下载按钮不存在")
         
-        # 测试直接调用
-        if 'download' in self.controllers:
-            print("[MainController] 测试直接调用下载控制器...")
-            try:
-                # 不实际执行，只测试方法是否存在
-                if hasattr(self.controllers['download'], 'start_download'):
-                    print("[MainController] ✓ 下载控制器的start_download方法存在")
-                else:
-                    print("[MainController] ✗ 下载控制器的start_download方法不存在")
-            except Exception as e:
-                print(f"[MainController] ✗ 测试失败: {e}")
-        print("[MainController] =====================================")
+        self._view_events_bound = True
+    
+    def _rebind_view_events(self):
+        """强制重新绑定视图事件（验证发现按钮未绑定时使用）"""
+        self._view_events_bound = False
+        self._bind_view_events()
     
     def _on_theme_combo_change(self, event=None):
         """主题下拉框变化"""
@@ -842,10 +585,13 @@ class MainController(BaseController):
         if hasattr(self.view, 'update_theme'):
             self.view.update_theme(theme_name)
         
-        # 更新所有子控制器视图的主题
+        # 更新所有子控制器视图的主题（含尚未创建控制器的面板）
         for ctrl in self.controllers.values():
             if hasattr(ctrl, 'view') and hasattr(ctrl.view, 'update_theme'):
                 ctrl.view.update_theme(theme_name)
+        for panel, _ in self._controller_factories.values():
+            if hasattr(panel, 'update_theme'):
+                panel.update_theme(theme_name)
         
         # 发布主题变化事件
         self.event_bus.publish(Event(
@@ -980,8 +726,6 @@ class MainController(BaseController):
         use_regex = self.view.var_use_regex.get() if hasattr(self.view, 'var_use_regex') else False
         
         print(f"[DEBUG] 搜索关键词: '{keyword}', 使用正则: {use_regex}")
-        import sys
-        sys.stdout.flush()
         
         # 查找匹配项（用于导航）
         matches = self.log_manager.search(keyword, use_regex, 0)
@@ -990,7 +734,6 @@ class MainController(BaseController):
         print("[DEBUG] 开始高亮当前显示的日志...")
         highlight_count = self.view.highlight_search_matches(keyword, use_regex)
         print(f"[DEBUG] 高亮完成，实际高亮 {highlight_count} 处")
-        sys.stdout.flush()
         
         if highlight_count > 0:
             self._log_search_pos = matches[0][0] if matches else 0
@@ -1015,7 +758,6 @@ class MainController(BaseController):
                 pass
         else:
             print(f"[DEBUG] 未找到匹配项")
-            sys.stdout.flush()
             # 清除高亮
             self.view.txt_log.tag_remove("search_match", "1.0", "end")
             self.view.append_log(f"未找到匹配项", "WARN")
@@ -1122,18 +864,22 @@ class MainController(BaseController):
         except Exception as e:
             messagebox.showerror("错误", f"导出失败: {e}")
             self.view.append_log(f"导出日志失败: {e}", "ERROR")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[MainController] 导出日志失败")
     
     def _view_history(self):
         """查看历史记录"""
+        export_ctrl = self.get_controller('export')
+        if export_ctrl is None:
+            # 延迟创建失败（原因已由 get_controller 记录）
+            self._log("导出控制器不可用，无法打开历史记录", "ERROR")
+            messagebox.showerror("错误", "导出控制器不可用")
+            return
         try:
             # 传递根窗口给ExportController
-            self.controllers['export'].view_history(root_window=self.view.root)
+            export_ctrl.view_history(root_window=self.view.root)
         except Exception as e:
             self._log(f"打开历史记录失败: {e}", "ERROR")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[MainController] 打开历史记录失败")
     
     def _on_theme_changed(self, event: Event):
         """主题变化事件处理"""
@@ -1287,7 +1033,7 @@ class MainController(BaseController):
             self._update_pause_resume_button(state="normal")
         
         # 延迟重置进度条（3秒后）
-        self.view.root.after(3000, lambda: self.view.update_progress({"percent": 0, "phase": "", "task": "", "title": "", "speed": None, "eta": None}))
+        self.view.root.after(3000, partial(self.view.update_progress, {"percent": 0, "phase": "", "task": "", "title": "", "speed": None, "eta": None}))
     
     def _on_download_failed(self, event: Event):
         """下载失败事件处理（包括Cookie失效检测）"""
@@ -5,10 +5,11 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from gui.controllers.base_controller import BaseController
-from services.config_service import ConfigService
+from services.config_service import get_config_service
 
 if TYPE_CHECKING:
     from gui.views.optimize_panel import OptimizePanel
+    from services.config_service import ConfigService
 
 
 class OptimizeController(BaseController):
@@ -21,17 +22,19 @@ class OptimizeController(BaseController):
     3. 处理配置变更事件
     """
     
-    def __init__(self, view: OptimizePanel, config: dict):
+    def __init__(self, view: OptimizePanel, config: dict, cfg_service: ConfigService | None = None):
         """
         初始化
         
         Args:
             view: 字幕优化面板视图
             config: 全局配置
+            cfg_service: 配置服务（默认使用全局单例）
         """
         self.view = view
         self.config = config
-        self.config_service = ConfigService()
+        # 共享配置服务，避免再次解析配置文件
+        self.cfg_service = cfg_service if cfg_service is not None else get_config_service()
         
         super().__init__()
         
@@ -115,7 +118,7 @@ class OptimizeController(BaseController):
                 self.config["quality"] = quality_config
             
             # 保存到配置文件
-            self.config_service.save()
+            self.cfg_service.save()
             
             print(f"[OptimizeController] ✓ 字幕优化配置已保存")
         except Exception as e:
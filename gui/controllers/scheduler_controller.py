@@ -23,6 +23,13 @@ class SchedulerController(BaseController):
     3. 执行任务
     """
     
+    # 调度任务执行时发布的下载事件（进度条/日志由主控制器更新）
+    REQUIRED_EVENTS = frozenset({
+        EventType.DOWNLOAD_PROGRESS,
+        EventType.DOWNLOAD_COMPLETED,
+        EventType.DOWNLOAD_FAILED,
+    })
+    
     def __init__(self, view: SchedulerPanel, config: dict):
         """
         初始化
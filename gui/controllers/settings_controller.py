@@ -11,6 +11,7 @@ from events.event_bus import EventType, Event
 
 if TYPE_CHECKING:
     from gui.views.settings_panel import SettingsPanel
+    from services.config_service import ConfigService
 
 
 class SettingsController(BaseController):
@@ -23,14 +24,19 @@ class SettingsController(BaseController):
     3. 处理文件选择等操作
     """
     
-    def __init__(self, view: SettingsPanel, config: dict):
+    def __init__(self, view: SettingsPanel, config: dict, cfg_service: ConfigService | None = None):
         """
         初始化
         
         Args:
             view: 设置面板视图
             config: 全局配置
+            cfg_service: 配置服务（默认使用全局单例）
         """
+        if cfg_service is None:
+            from services.config_service import get_config_service
+            cfg_service = get_config_service()
+        self.cfg_service = cfg_service
         self.view = view
         self.config = config
         
@@ -127,8 +133,7 @@ class SettingsController(BaseController):
     def save_config(self):
         """保存配置"""
         try:
-            from services.config_service import get_config_service
-            config_service = get_config_service()
+            config_service = self.cfg_service
             
             # 获取网络配置
             network_config = self.view.get_config()
@@ -157,8 +162,7 @@ class SettingsController(BaseController):
                 # 触发懒加载（如果尚未加载）
                 self.view.accordion.get_content_frame()
             
-            from services.config_service import get_config_service
-            config_service = get_config_service()
+            config_service = self.cfg_service
             config = config_service.load_network_config()
             print(f"[SettingsController] 加载网络配置:")
             print(f"  - proxy_text长度: {len(config.get('proxy_text', ''))}")
@@ -254,8 +258,7 @@ class SettingsController(BaseController):
     def _on_config_changed(self):
         """配置变化时自动保存（延迟保存）"""
         try:
-            from services.config_service import get_config_service
-            config_service = get_config_service()
+            config_service = self.cfg_service
             
             # 获取当前网络配置（使用宽松模式，保留输入过程中的不完整格式）
             network_config = self.view.get_config(strict_validation=False)
@@ -10,6 +10,7 @@ from services.config_service import get_config_service
 
 if TYPE_CHECKING:
     from gui.views.translate_panel import TranslatePanel
+    from services.config_service import ConfigService
 
 
 class TranslateController(BaseController):
@@ -21,14 +22,16 @@ class TranslateController(BaseController):
     2. 管理配置持久化
     """
     
-    def __init__(self, view: TranslatePanel, config: dict):
+    def __init__(self, view: TranslatePanel, config: dict, cfg_service: ConfigService | None = None):
         """
         初始化
         
         Args:
             view: 字幕翻译面板视图
             config: 全局配置
+            cfg_service: 配置服务（默认使用全局单例）
         """
+        self.cfg_service = cfg_service if cfg_service is not None else get_config_service()
         self.view = view
         self.config = config
         
@@ -66,7 +69,7 @@ class TranslateController(BaseController):
         
         # 通过配置服务统一保存
         try:
-            cfg = get_config_service()
+            cfg = self.cfg_service
             # 直接更新 translate 段
             cfg.update("translate", new_config)
             cfg.save()
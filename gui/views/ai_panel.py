@@ -4,6 +4,7 @@ AI面板视图 - 纯UI，不包含业务逻辑
 """
 import tkinter as tk
 from tkinter import ttk
+from typing import Sequence
 from gui.views.base_view import BaseView
 from ui_components import Accordion, ModuleTitle
 
@@ -187,15 +188,15 @@ class AIPanel(BaseView):
             # 隐藏Base URL输入框（测试按钮保持显示）
             self.ai_base_url_frame.pack_forget()
     
-    def update_model_list(self, provider: str, models: list):
+    def update_model_list(self, provider: str, models: Sequence[str]):
         """
-        更新模型列表
+        更新模型列表（一次性设置全部候选项）
         
         Args:
             provider: 供应商名称
-            models: 模型列表
+            models: 模型列表（元组或列表，直接传给Combobox）
         """
-        self.cmb_model['values'] = models
+        self.cmb_model.configure(values=models)
         if models:
             self.cmb_model.set(models[0])
     
@@ -445,9 +445,6 @@ class MainWindowFull(tk.Frame):
             import traceback
             traceback.print_exc()
         
-        import sys
-        sys.stdout.flush()
-        
         # 添加工具提示
         create_tooltip(self.btn_find_next, 
             "查找下一个匹配项\n"
@@ -119,6 +119,8 @@ class AIService:
                 base_url = ai_config.get("base_url", "").strip()
                 if not base_url:
                     logger.error("[AIService] 自定义API必须提供base_url")
+                    if completion_callback:
+                        completion_callback({"error": "自定义API必须提供base_url"})
                     return
                 
                 # 自定义API直接使用用户输入的模型名称，不进行映射
@@ -24,10 +24,13 @@ class ConfigService:
         """初始化配置服务"""
         self.config_path = Path.cwd() / "config" / "config.json"
         self._config: Dict[str, Any] = {}
+        # load_ai_config 结果缓存（ai 段被修改时失效）
+        self._ai_config_cache: Optional[Dict[str, Any]] = None
         self._load()
     
     def _load(self):
         """加载配置文件"""
+        self._ai_config_cache = None
         try:
             self._config = _load_config()
             # 验证加载的AI配置
@@ -71,6 +74,9 @@ class ConfigService:
             key: 配置键（如果为None，则value应该是整个section的字典）
             value: 配置值
         """
+        if section == "ai":
+            self._ai_config_cache = None
+        
         if section not in self._config:
             self._config[section] = {}
         
@@ -96,6 +102,9 @@ class ConfigService:
             section: 配置段
             updates: 要更新的键值对
         """
+        if section == "ai":
+            self._ai_config_cache = None
+        
         if section not in self._config:
             self._config[section] = {}
         
@@ -203,14 +212,17 @@ class ConfigService:
         加载AI模块配置
         
         Returns:
-            AI配置字典
+            AI配置字典（缓存结果，调用方不应修改）
         """
+        if self._ai_config_cache is not None:
+            return self._ai_config_cache
+        
         ai_section = self.get("ai") or {}  # 修复：使用 or {} 而不是传入 {} 作为默认值
         api_key = ai_section.get("api_key", "") if isinstance(ai_section, dict) else ""
         print(f"[ConfigService.load_ai_config] 加载AI配置 - api_key: {'***' if api_key else '(空)'}, 长度: {len(api_key)}")
         print(f"[ConfigService.load_ai_config] ai_section类型: {type(ai_section)}, 键: {list(ai_section.keys()) if isinstance(ai_section, dict) else 'N/A'}")
         
-        return {
+        self._ai_config_cache = {
             "enabled": ai_section.get("enabled", False) if isinstance(ai_section, dict) else False,
             "provider": ai_section.get("provider", "GPT") if isinstance(ai_section, dict) else "GPT",
             "model": ai_section.get("model", "gpt-5") if isinstance(ai_section, dict) else "gpt-5",
@@ -220,6 +232,7 @@ class ConfigService:
             "translate_langs": ai_section.get("translate_langs", ["zh", "en"]) if isinstance(ai_section, dict) else ["zh", "en"],
             "bilingual_enabled": ai_section.get("bilingual_enabled", False) if isinstance(ai_section, dict) else False,
         }
+        return self._ai_config_cache
     
     def save_ai_config(self, config: Dict[str, Any]):
         """
@@ -3,9 +3,12 @@
 导出服务 - 纯业务逻辑，不依赖UI
 """
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 from export_manager import ExportManager
 
+# 流式导出日志时的文件写缓冲区大小
+_LOG_WRITE_BUFFER = 1 << 20
+
 
 class ExportService:
     """
@@ -87,6 +90,33 @@ class ExportService:
             output_path=output_path
         )
 
+    
+    def export_logs_stream(
+        self,
+        chunks: Iterable[str],
+        output_path: Path,
+        format: str = "txt"
+    ) -> Path:
+        """
+        流式导出日志内容（txt 逐块写入文件，不在内存中拼接完整文本）
+        
+        Args:
+            chunks: 日志文本块（通常为带换行符的行）
+            output_path: 输出路径
+            format: 导出格式；非 txt 格式拼接后交给 ExportManager，与文本导出的结果一致
+        
+        Returns:
+            输出文件路径
+        """
+        if format != "txt":
+            return self.export_logs("".join(chunks), format=format, output_path=output_path)
+        
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open('w', encoding='utf-8', buffering=_LOG_WRITE_BUFFER) as f:
+            f.writelines(chunks)
+        return output_path
+
 
 __all__ = ['ExportService']
 
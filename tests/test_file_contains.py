@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+tests.test_file_contains — 分块扫描文件时跨块边界的关键词匹配
+"""
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# 确保能导入项目模块
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+download_controller = pytest.importorskip("gui.controllers.download_controller")
+_file_contains = download_controller._file_contains
+
+_COOKIE_RE_B = re.compile(rb'cookie', re.IGNORECASE)
+
+
+def test_match_split_across_chunk_boundary(tmp_path):
+    """关键词被块边界切开时，依靠重叠字节仍能匹配"""
+    path = tmp_path / "errors.txt"
+    # chunk_size=8：第一块以 "Coo" 结尾，"kie" 落在第二块开头
+    path.write_bytes(b"xxxxxCookiexxxxxxxxxx")
+
+    assert _file_contains(path, _COOKIE_RE_B, chunk_size=8, overlap=16)
+    # 重叠字节少于关键词长度时跨边界的关键词会被漏掉（说明用例确实跨越了边界）
+    assert not _file_contains(path, _COOKIE_RE_B, chunk_size=8, overlap=2)
+    assert not _file_contains(path, _COOKIE_RE_B, chunk_size=8, overlap=0)
+
+
+def test_match_in_later_chunk_and_no_match(tmp_path):
+    """多块之后出现的关键词能找到；不含关键词时返回 False"""
+    hit = tmp_path / "hit.txt"
+    hit.write_bytes(b"." * 100 + b"cookie" + b"." * 100)
+    miss = tmp_path / "miss.txt"
+    miss.write_bytes("无关内容 ".encode("utf-8") * 50)
+
+    assert _file_contains(hit, _COOKIE_RE_B, chunk_size=8)
+    assert not _file_contains(miss, _COOKIE_RE_B, chunk_size=8)
+
+
+def test_empty_file(tmp_path):
+    """空文件不匹配"""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert not _file_contains(path, _COOKIE_RE_B)
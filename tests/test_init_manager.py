@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+tests.test_init_manager — 初始化管理器的依赖调度（重试、失败传递、缺失依赖）
+"""
+import sys
+from pathlib import Path
+
+# 确保能导入项目模块
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.init_manager import InitializationManager
+
+
+class _ImmediateRoot:
+    """替代 Tk 根窗口：after 立即执行回调"""
+
+    def after(self, ms, func, *args):
+        func(*args)
+        return "after#0"
+
+
+def _flaky(fail_times: int, calls: list):
+    """前 fail_times 次返回 False，之后返回 True"""
+    def step():
+        calls.append(len(calls))
+        return len(calls) > fail_times
+    return step
+
+
+def test_dependent_waits_for_retried_step():
+    """依赖的步骤重试后成功时，后续步骤在其完成后执行（而不是被跳过）"""
+    manager = InitializationManager(_ImmediateRoot())
+    calls, order = [], []
+    manager.add_step("ui", _flaky(2, calls), retry_on_fail=True, max_retries=3)
+    manager.add_step("load", lambda: order.append("load") or True, dependencies=["ui"])
+
+    manager.execute_all()
+
+    assert len(calls) == 3
+    assert order == ["load"]
+    assert manager.status["completed"] == ["ui", "load"]
+    assert manager.get_status()["failed"] == 0
+
+
+def test_failure_propagates_to_dependents():
+    """步骤失败（含重试用尽、抛出异常）时，直接和间接依赖它的步骤都记为失败且不执行"""
+    manager = InitializationManager(_ImmediateRoot())
+    ran = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    manager.add_step("ui", lambda: False, retry_on_fail=True, max_retries=1)
+    manager.add_step("load", lambda: ran.append("load") or True, dependencies=["ui"])
+    manager.add_step("bind", lambda: ran.append("bind") or True, dependencies=["load"])
+    manager.add_step("crash", broken)
+    manager.add_step("after_crash", lambda: ran.append("after_crash") or True, dependencies=["crash"])
+    manager.add_step("independent", lambda: ran.append("independent") or True)
+
+    manager.execute_all()
+
+    assert ran == ["independent"]
+    assert set(manager.status["failed"]) == {"ui", "load", "bind", "crash", "after_crash"}
+    assert manager.status["completed"] == ["independent"]
+
+
+def test_missing_dependency_skips_step():
+    """依赖的步骤不存在时，该步骤记为失败并给出原因"""
+    manager = InitializationManager(_ImmediateRoot())
+    ran = []
+    manager.add_step("load", lambda: ran.append("load") or True, dependencies=["nonexistent"])
+
+    manager.execute_all()
+
+    assert ran == []
+    assert manager.status["failed"] == ["load"]
+    assert "nonexistent" in manager.status["errors"][0]
@@ -16,6 +16,7 @@ class InitializationManager:
     2. 处理依赖关系
     3. 确保UI完全创建后再初始化控制器
     4. 提供重试机制
+    5. 依赖完成（含重试后完成）时立即执行后续步骤
     """
     
     def __init__(self, root: tk.Tk):
@@ -33,6 +34,9 @@ class InitializationManager:
             "errors": []
         }
         self._current_step_index = 0
+        self._order: List[Dict] = []
+        self._step_map: Dict[str, Dict] = {}
+        self._dispatching = False
     
     def add_step(
         self,
@@ -62,6 +66,7 @@ class InitializationManager:
             "max_retries": max_retries,
             "retry_count": 0,
             "delay_ms": delay_ms,
+            "state": "pending",  # pending/running/done/failed
             "completed": False
         })
     
@@ -70,11 +75,11 @@ class InitializationManager:
         print(f"[InitManager] 开始执行 {len(self.steps)} 个初始化步骤")
         
         # 按依赖关系排序
-        sorted_steps = self._topological_sort()
+        self._order = self._topological_sort()
+        self._step_map = {step["name"]: step for step in self.steps}
         
-        # 执行步骤
-        for step in sorted_steps:
-            self._execute_step(step)
+        # 启动依赖已满足的步骤；其余步骤在依赖完成（含重试后完成）时再启动
+        self._dispatch_ready()
     
     def _topological_sort(self) -> List[Dict]:
         """拓扑排序，确保依赖步骤先执行"""
@@ -109,19 +114,44 @@ class InitializationManager:
         
         return sorted_steps
     
+    def _dispatch_ready(self):
+        """启动所有依赖已完成的待执行步骤，依赖失败的步骤直接记为失败"""
+        if self._dispatching:
+            # 正在分发中（同步步骤完成时回调），由外层循环继续扫描
+            return
+        self._dispatching = True
+        try:
+            progressed = True
+            while progressed:
+                progressed = False
+                for step in self._order:
+                    if step["state"] != "pending":
+                        continue
+                    blocked = self._blocked_dependency(step)
+                    if blocked:
+                        name = step["name"]
+                        print(f"[InitManager] ⚠️ 步骤 '{name}' 的依赖 '{blocked}' 未完成，跳过")
+                        step["state"] = "failed"
+                        self.status["failed"].append(name)
+                        self.status["errors"].append(f"步骤 '{name}' 的依赖 '{blocked}' 未完成")
+                        progressed = True
+                    elif all(self._step_map[dep]["completed"] for dep in step["dependencies"]):
+                        step["state"] = "running"
+                        self._execute_step(step)
+                        progressed = True
+        finally:
+            self._dispatching = False
+    
+    def _blocked_dependency(self, step: Dict) -> Optional[str]:
+        """返回不存在或已失败的依赖名称（无则返回None）"""
+        for dep_name in step["dependencies"]:
+            dep_step = self._step_map.get(dep_name)
+            if dep_step is None or dep_step["state"] == "failed":
+                return dep_name
+        return None
+    
     def _execute_step(self, step: Dict):
         """执行单个步骤"""
-        name = step["name"]
-        
-        # 检查依赖是否完成
-        for dep_name in step["dependencies"]:
-            dep_step = next((s for s in self.steps if s["name"] == dep_name), None)
-            if not dep_step or not dep_step["completed"]:
-                print(f"[InitManager] ⚠️ 步骤 '{name}' 的依赖 '{dep_name}' 未完成，跳过")
-                self.status["failed"].append(name)
-                self.status["errors"].append(f"步骤 '{name}' 的依赖 '{dep_name}' 未完成")
-                return
-        
         # 延迟执行
         if step["delay_ms"] > 0:
             self.root.after(step["delay_ms"], lambda: self._run_step(step))
@@ -135,28 +165,44 @@ class InitializationManager:
         
         try:
             result = step["func"]()
-            if result:
-                step["completed"] = True
-                self.status["completed"].append(name)
-                print(f"[InitManager] ✓ 步骤 '{name}' 完成")
-            else:
-                # 失败，检查是否需要重试
-                if step["retry_on_fail"] and step["retry_count"] < step["max_retries"]:
-                    step["retry_count"] += 1
-                    print(f"[InitManager] ⚠️ 步骤 '{name}' 失败，重试 {step['retry_count']}/{step['max_retries']}")
-                    self.root.after(200, lambda: self._run_step(step))
-                else:
-                    step["completed"] = False
-                    self.status["failed"].append(name)
-                    self.status["errors"].append(f"步骤 '{name}' 失败")
-                    print(f"[InitManager] ✗ 步骤 '{name}' 失败")
         except Exception as e:
-            import traceback
-            error_msg = f"步骤 '{name}' 执行异常: {e}"
-            print(f"[InitManager] ✗ {error_msg}")
-            traceback.print_exc()
+            self._on_step_error(step, e)
+        else:
+            self._on_step_result(step, result)
+    
+    def _on_step_result(self, step: Dict, result):
+        """处理步骤返回值"""
+        name = step["name"]
+        if result:
+            step["state"] = "done"
+            step["completed"] = True
+            self.status["completed"].append(name)
+            print(f"[InitManager] ✓ 步骤 '{name}' 完成")
+        else:
+            # 失败，检查是否需要重试
+            if step["retry_on_fail"] and step["retry_count"] < step["max_retries"]:
+                step["retry_count"] += 1
+                print(f"[InitManager] ⚠️ 步骤 '{name}' 失败，重试 {step['retry_count']}/{step['max_retries']}")
+                self.root.after(200, lambda: self._run_step(step))
+                return
+            step["state"] = "failed"
+            step["completed"] = False
             self.status["failed"].append(name)
-            self.status["errors"].append(error_msg)
+            self.status["errors"].append(f"步骤 '{name}' 失败")
+            print(f"[InitManager] ✗ 步骤 '{name}' 失败")
+        self._dispatch_ready()
+    
+    def _on_step_error(self, step: Dict, error: BaseException):
+        """处理步骤异常"""
+        import traceback
+        name = step["name"]
+        error_msg = f"步骤 '{name}' 执行异常: {error}"
+        print(f"[InitManager] ✗ {error_msg}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        step["state"] = "failed"
+        self.status["failed"].append(name)
+        self.status["errors"].append(error_msg)
+        self._dispatch_ready()
     
     def ensure_ui_ready(self, view) -> bool:
         """